@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Article Archive Benchmark
+
+Compares the size and decode throughput of the article file formats: the
+pretty-printed JSON written by default, gzip and zstd JSON Lines, and the
+``.zarc`` archive with and without a trained zstd dictionary. The dictionary
+is trained on the first part of the corpus and the sizes are measured on the
+rest, so it is never tested on records it was trained on. The dictionary is
+stored once per archive, so on small inputs it dominates the file size;
+"Bytes/article" counts only the record payload to show the per-record cost
+at corpus scale. Random access (one record by title) is only possible with
+the archive.
+"""
+
+import sys
+import json
+import time
+import random
+import tempfile
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.article_store import ArticleWriter, iter_article_dicts
+from src.collectors.article_archive import (
+    ArchiveWriter, ArticleArchive, train_dictionary_from_articles
+)
+
+console = Console()
+
+
+def scan_rate(path: str, records: int, rounds: int) -> float:
+    """Full-scan decode throughput in records per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in iter_article_dicts(path):
+            pass
+    return records * rounds / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option('--input', default='data/raw/articles.json', help='Article file to benchmark on')
+@click.option('--train-fraction', default=0.5, help='Share of the corpus used to train the dictionary')
+@click.option('--dict-size', default=112, help='Dictionary size in KB')
+@click.option('--rounds', default=20, help='Decode rounds per format')
+def main(input: str, train_fraction: float, dict_size: int, rounds: int):
+    """Benchmark article archive compression against JSON and JSON Lines."""
+    article_dicts = list(iter_article_dicts(input))
+    split = max(1, int(len(article_dicts) * train_fraction))
+    training, measured = article_dicts[:split], article_dicts[split:]
+    if not measured:
+        raise click.UsageError("The corpus is too small to hold out records for measuring")
+    dictionary = train_dictionary_from_articles(training, dict_size * 1024)
+    raw_bytes = sum(len(json.dumps(d, ensure_ascii=False).encode("utf-8")) for d in measured)
+
+    table = Table(title=f"Article formats ({len(measured)} held-out articles, "
+                        f"dictionary trained on {len(training)})")
+    table.add_column("Format", style="cyan")
+    table.add_column("Bytes", style="green")
+    table.add_column("Bytes/article", style="green")
+    table.add_column("Ratio", style="magenta")
+    table.add_column("Scan articles/s", style="green")
+    table.add_column("Lookup articles/s", style="green")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        formats = []
+        payload = {}
+
+        json_path = str(Path(tmp) / "articles.json")
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(measured, file, ensure_ascii=False, indent=2)
+        formats.append(("json (indent=2)", json_path))
+
+        for suffix in (".jsonl", ".jsonl.gz", ".jsonl.zst"):
+            path = str(Path(tmp) / f"articles{suffix}")
+            with ArticleWriter(path) as writer:
+                for article_dict in measured:
+                    writer.write_dict(article_dict)
+            formats.append((suffix.lstrip("."), path))
+
+        archives = [("zarc (no dictionary)", None), ("zarc (dictionary)", dictionary)]
+        for name, archive_dictionary in archives:
+            path = str(Path(tmp) / f"{len(formats)}.zarc")
+            # training_records=0 keeps the writer from training its own dictionary
+            with ArchiveWriter(path, dictionary=archive_dictionary, training_records=0) as writer:
+                for article_dict in measured:
+                    writer.write_dict(article_dict)
+            formats.append((name, path))
+            payload[path] = writer.get_statistics()['compressed_bytes']
+
+        for name, path in formats:
+            size = Path(path).stat().st_size
+            lookup = "-"
+            if path.endswith(".zarc"):
+                titles = [d["title"] for d in measured]
+                with ArticleArchive(path) as archive:
+                    picks = [random.choice(titles) for _ in range(rounds * len(measured))]
+                    start = time.perf_counter()
+                    for title in picks:
+                        archive.get(title)
+                    lookup = f"{len(picks) / (time.perf_counter() - start):.0f}"
+            table.add_row(name, str(size), f"{payload.get(path, size) / len(measured):.0f}",
+                          f"{raw_bytes / size:.1f}x",
+                          f"{scan_rate(path, len(measured), rounds):.0f}", lookup)
+
+    console.print(table)
+    if dictionary:
+        console.print(f"Dictionary: {len(dictionary)} bytes, stored once per archive")
+
+
+if __name__ == '__main__':
+    main()
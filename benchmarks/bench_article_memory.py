@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Article Memory Benchmark
+
+Measures the heap cost of holding collected articles in memory with
+tracemalloc: the original ``WikipediaArticle`` dataclass against the slotted
+representation with interned category/template names, derived URLs and
+compressed long text. Articles are decoded from JSON records, as when a
+corpus is loaded from the article store, so repeated names arrive as
+separate string objects.
+"""
+
+import gc
+import sys
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.wikipedia_collector import WikipediaArticle, article_url
+
+console = Console()
+
+
+@dataclass
+class LegacyWikipediaArticle:
+    """The original dataclass representation."""
+
+    title: str
+    page_id: int
+    url: str
+    abstract: str
+    content: str
+    infobox: Dict[str, Any]
+    categories: List[str]
+    templates: List[str]
+    language: str = "vi"
+    last_modified: Optional[str] = None
+    revision_id: Optional[int] = None
+
+
+def build_records(count: int, content_chars: int, seed: int = 7) -> List[str]:
+    """Build JSON article records drawing names from shared vocabularies."""
+    rng = random.Random(seed)
+    categories = [f"Thể loại:Nhân vật thời {i}" for i in range(2000)]
+    templates = [f"Bản mẫu:Sơ khai {i}" for i in range(300)]
+    keys = ["tên", "hình", "ngày sinh", "nơi sinh", "ngày mất", "nơi mất", "chức vụ", "tiền nhiệm"]
+    sentence = "Đây là một câu văn mẫu trong nội dung bài viết về lịch sử Việt Nam. "
+
+    records = []
+    for index in range(count):
+        title = f"Bài viết {index}"
+        records.append(json.dumps({
+            "title": title,
+            "page_id": index,
+            "url": article_url(title),
+            "abstract": sentence * rng.randint(2, 6),
+            "content": (sentence * (content_chars // len(sentence) + 1))[:content_chars],
+            "infobox": {"template_type": "nhân vật", **{key: f"{key} {index}" for key in keys}},
+            "categories": rng.sample(categories, 8),
+            "templates": rng.sample(templates, 12),
+            "language": "vi",
+            "last_modified": "2024-01-01T00:00:00Z",
+            "revision_id": 1000 + index,
+        }, ensure_ascii=False))
+    return records
+
+
+def measure(factory: Callable[..., Any], records: List[str]) -> int:
+    """Return the traced heap bytes retained by the articles built from ``records``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    articles = [factory(**json.loads(record)) for record in records]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del articles
+    return retained
+
+
+@click.command()
+@click.option('--articles', default=20000, help='Number of articles to hold in memory')
+@click.option('--content-chars', multiple=True, type=int, default=[0, 5000],
+              help='Content length per article (repeatable)')
+def main(articles: int, content_chars: List[int]):
+    """Benchmark bytes per article for the legacy and compact representations."""
+    table = Table(title=f"Article memory ({articles} articles)")
+    table.add_column("Content chars", style="cyan")
+    table.add_column("Dataclass B/article", style="green")
+    table.add_column("Compact B/article", style="green")
+    table.add_column("Reduction", style="magenta")
+
+    for chars in content_chars:
+        records = build_records(articles, chars)
+        legacy = measure(LegacyWikipediaArticle, records) / articles
+        compact = measure(WikipediaArticle, records) / articles
+        table.add_row(str(chars), f"{legacy:,.0f}", f"{compact:,.0f}", f"{legacy / compact:.1f}x")
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
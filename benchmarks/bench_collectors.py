@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Collector Throughput Benchmark
+
+Compares the synchronous WikipediaCollector (per-title and batched) with the
+asyncio collection engine and the fetch/parse pipeline against a local stub
+MediaWiki server with simulated round-trip latency. ``--infobox-fields``
+makes the stub pages large enough for wikitext parsing to matter.
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import click
+import yaml
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.async_collector import AsyncWikipediaCollector
+from src.collectors.pipeline_collector import PipelineCollector
+from tests.mediawiki_stub import MediaWikiStub, make_page
+
+console = Console()
+
+
+def write_config(base_url: str, requests_per_second: float, burst_limit: int,
+                 directory: str) -> str:
+    """Write a collector config pointing at the stub server."""
+    with open("config/wikipedia.yaml", "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    config["wikipedia"]["base_url"] = base_url
+    config["wikipedia"]["rate_limit"]["requests_per_second"] = requests_per_second
+    config["wikipedia"]["rate_limit"]["burst_limit"] = burst_limit
+    config["cache"]["enabled"] = False
+    config["title_aliases"]["path"] = None
+
+    path = Path(directory) / "wikipedia.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding="utf-8")
+    return str(path)
+
+
+def build_wikitext(title: str, fields: int) -> str:
+    """Build a page whose infobox values nest templates and links."""
+    lines = ["{{Thông tin nhân vật", f"| tên = {title}"]
+    for index in range(fields):
+        lines.append(
+            f"| trường {index} = [[Hà Nội|thủ đô {index}]] {{{{formatnum:{index}}}}}"
+            f"<ref>{{{{chú thích web|url=https://vi.wikipedia.org/{index}}}}}</ref>"
+        )
+    lines.append("}}")
+    lines.append(f"'''{title}''' là một [[nhân vật]]. " * 20)
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option('--articles', default=200, help='Number of stub articles to collect')
+@click.option('--latency', default=0.05, help='Simulated server latency in seconds')
+@click.option('--rate', default=100.0, help='Rate limit (requests per second)')
+@click.option('--max-in-flight', default=16, help='Async in-flight window')
+@click.option('--parse-workers', default=None, type=int, help='Pipeline parser processes')
+@click.option('--infobox-fields', default=0, help='Extra infobox fields per stub page')
+def main(articles: int, latency: float, rate: float, max_in_flight: int,
+         parse_workers: int, infobox_fields: int):
+    """Benchmark sync vs async vs pipelined article collection."""
+    titles = [f"Bài viết {i}" for i in range(articles)]
+    pages = {
+        title: make_page(
+            title, page_id=i + 1,
+            wikitext=build_wikitext(title, infobox_fields) if infobox_fields else None,
+        )
+        for i, title in enumerate(titles)
+    }
+
+    table = Table(title=f"Collector throughput ({articles} articles, {latency * 1000:.0f} ms latency)")
+    table.add_column("Engine", style="cyan")
+    table.add_column("Requests", style="green")
+    table.add_column("Seconds", style="green")
+    table.add_column("Articles/s", style="green")
+
+    with MediaWikiStub(pages, latency=latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        config_path = write_config(stub.base_url, rate, max_in_flight, tmp)
+
+        start_requests = stub.request_count
+        start = time.perf_counter()
+        collector = WikipediaCollector(config_path)
+        for title in titles:
+            collector.get_article_by_title(title)
+        elapsed = time.perf_counter() - start
+        table.add_row("sync (per title)", str(stub.request_count - start_requests),
+                      f"{elapsed:.2f}", f"{articles / elapsed:.1f}")
+
+        start_requests = stub.request_count
+        start = time.perf_counter()
+        WikipediaCollector(config_path).get_articles_by_titles(titles)
+        elapsed = time.perf_counter() - start
+        table.add_row("sync (batched)", str(stub.request_count - start_requests),
+                      f"{elapsed:.2f}", f"{articles / elapsed:.1f}")
+
+        start_requests = stub.request_count
+        start = time.perf_counter()
+        engine = AsyncWikipediaCollector(WikipediaCollector(config_path), max_in_flight=max_in_flight)
+        engine.collect_titles(titles)
+        elapsed = time.perf_counter() - start
+        table.add_row(f"async (window={max_in_flight})", str(stub.request_count - start_requests),
+                      f"{elapsed:.2f}", f"{articles / elapsed:.1f}")
+
+        start_requests = stub.request_count
+        start = time.perf_counter()
+        pipeline = PipelineCollector(WikipediaCollector(config_path), parse_workers=parse_workers)
+        pipeline.collect_titles(titles)
+        elapsed = time.perf_counter() - start
+        table.add_row(f"pipeline ({pipeline.fetch_workers} fetch, {pipeline.parse_workers} parse)",
+                      str(stub.request_count - start_requests),
+                      f"{elapsed:.2f}", f"{articles / elapsed:.1f}")
+
+        stats = pipeline.get_statistics()
+        console.print(
+            f"Pipeline stages: fetch {stats['fetch_pages_per_second']:.1f} pages/s, "
+            f"parse {stats['parse_pages_per_second']:.1f} pages/s, "
+            f"fetchers blocked {stats['fetch_blocked_seconds']:.2f}s, "
+            f"max queue depth {stats['max_queue_depth']}"
+        )
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
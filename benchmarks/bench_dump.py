@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Dump Ingestion Benchmark
+
+Measures pages/second of the offline dump reader on a synthetic bz2 dump built
+by repeating the pages of the test fixture dump, with one and several parser
+processes.
+"""
+
+import os
+import bz2
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.dump_reader import DumpReader
+
+console = Console()
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "viwiki-sample-pages-articles.xml"
+EXPORT_NS = "http://www.mediawiki.org/xml/export-0.10/"
+
+
+def build_dump(pages: int, path: str) -> None:
+    """Write a bz2 dump with ``pages`` pages cloned from the fixture."""
+    ET.register_namespace("", EXPORT_NS)
+    root = ET.parse(FIXTURE).getroot()
+    templates = root.findall(f"{{{EXPORT_NS}}}page")
+    for page in templates:
+        root.remove(page)
+    header, footer = ET.tostring(root, encoding="unicode").rsplit("</mediawiki>", 1)
+
+    with bz2.open(path, "wt", encoding="utf-8") as file:
+        file.write(header)
+        for i in range(pages):
+            page = templates[i % len(templates)]
+            title = page.find(f"{{{EXPORT_NS}}}title").text
+            xml = ET.tostring(page, encoding="unicode")
+            xml = xml.replace(f"<title>{title}</title>", f"<title>{title} {i}</title>", 1)
+            file.write(xml.replace("ns0:", "").replace(":ns0", ""))
+        file.write("</mediawiki>" + footer)
+
+
+@click.command()
+@click.option('--pages', default=20000, help='Number of pages in the synthetic dump')
+@click.option('--workers', default=os.cpu_count() or 1, help='Parser processes for the parallel run')
+def main(pages: int, workers: int):
+    """Benchmark offline dump ingestion."""
+    table = Table(title=f"Dump ingestion ({pages} pages)")
+    table.add_column("Parser processes", style="cyan")
+    table.add_column("Articles", style="green")
+    table.add_column("Seconds", style="green")
+    table.add_column("Pages/s", style="green")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = str(Path(tmp) / "viwiki-bench-pages-articles.xml.bz2")
+        build_dump(pages, dump_path)
+
+        for worker_count in dict.fromkeys([1, workers]):
+            stats = DumpReader(dump_path, workers=worker_count).write_to_store(
+                str(Path(tmp) / "articles.jsonl")
+            )
+            table.add_row(str(worker_count), str(stats['articles']),
+                          f"{stats['elapsed_seconds']:.2f}", f"{stats['pages_per_second']:.0f}")
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
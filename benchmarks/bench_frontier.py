@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Work Frontier Scaling Benchmark
+
+Runs 1..N collector worker processes against one shared SQLite frontier and
+a local stub MediaWiki server with simulated latency, and reports how
+collection throughput scales with the number of workers. A second pass
+with a low rate limit shows the shared budget capping all workers together.
+"""
+
+import sys
+import time
+import tempfile
+import multiprocessing
+from pathlib import Path
+from typing import List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_collectors import write_config
+from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.work_frontier import WorkFrontier, FrontierWorker
+from tests.mediawiki_stub import MediaWikiStub, make_page
+
+console = Console()
+
+
+def run_worker(config_path: str, frontier_path: str, output: str, name: str,
+               batch_size: int) -> None:
+    """Worker process entry point."""
+    collector = WikipediaCollector(config_path)
+    with WorkFrontier(frontier_path, worker_id=name) as frontier:
+        FrontierWorker(collector, frontier, output, batch_size=batch_size, idle_seconds=0.05).run()
+
+
+def run_crawl(config_path: str, titles: List[str], workers: int, batch_size: int,
+              directory: str) -> float:
+    """Crawl all titles with ``workers`` processes, returning the elapsed seconds."""
+    frontier_path = str(Path(directory) / f"frontier-{workers}-{time.monotonic_ns()}.sqlite")
+    with WorkFrontier(frontier_path) as frontier:
+        frontier.add_titles(titles)
+
+    output = str(Path(directory) / "articles-{worker}.jsonl")
+    start = time.perf_counter()
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(config_path, frontier_path, output, f"w{index}", batch_size),
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    with WorkFrontier(frontier_path) as frontier:
+        done = frontier.counts()["done"]
+    if done != len(titles):
+        console.print(f"[red]Only {done} of {len(titles)} titles completed[/red]")
+    return elapsed
+
+
+@click.command()
+@click.option('--articles', default=400, help='Number of stub articles to collect')
+@click.option('--latency', default=0.2, help='Simulated server latency in seconds')
+@click.option('--batch-size', default=10, help='Titles claimed per lease')
+@click.option('--max-workers', default=8, help='Largest number of worker processes')
+@click.option('--ceiling', default=10.0, help='Rate limit (requests/s) for the capped pass')
+def main(articles: int, latency: float, batch_size: int, max_workers: int, ceiling: float):
+    """Benchmark multi-process collection from a shared frontier."""
+    titles = [f"Bài viết {i}" for i in range(articles)]
+    pages = {title: make_page(title, page_id=i + 1) for i, title in enumerate(titles)}
+    worker_counts = [count for count in (1, 2, 4, 8, 16) if count <= max_workers]
+
+    table = Table(title=f"Frontier scaling ({articles} articles, batch {batch_size}, "
+                        f"{latency * 1000:.0f} ms latency)")
+    table.add_column("Rate limit", style="cyan")
+    table.add_column("Workers", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("Articles/s", style="green")
+    table.add_column("Speedup", style="magenta")
+
+    with MediaWikiStub(pages, latency=latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        for rate in (1000.0, ceiling):
+            config_path = write_config(stub.base_url, rate, 1, tmp)
+            baseline = None
+            for workers in worker_counts:
+                elapsed = run_crawl(config_path, titles, workers, batch_size, tmp)
+                baseline = baseline or elapsed
+                table.add_row(f"{rate:g} req/s", str(workers), f"{elapsed:.2f}",
+                              f"{articles / elapsed:.1f}", f"{baseline / elapsed:.1f}x")
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Indexed Article Store Benchmark
+
+Measures what it costs to fetch one article from a large corpus: loading the
+pretty-printed JSON file as the tools did before, streaming a JSON Lines file
+until the title turns up, and opening the memory-mapped ``.aix`` store and
+looking the title up. The corpus is built by replicating the sample articles
+under new titles and page ids. Python heap use is traced with tracemalloc;
+the mapped pages of the store live in the OS page cache instead.
+"""
+
+import sys
+import json
+import time
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.article_store import ArticleWriter, iter_article_dicts
+from src.collectors.indexed_store import IndexedArticleStore
+
+console = Console()
+
+
+def build_corpus(sample_path: str, articles: int):
+    samples = list(iter_article_dicts(sample_path))
+    for i in range(articles):
+        article_dict = dict(samples[i % len(samples)])
+        article_dict["title"] = f"{article_dict['title']} {i}"
+        article_dict["page_id"] = i + 1
+        yield article_dict
+
+
+def measure(function):
+    """Run ``function`` once, returning its result, seconds and peak traced heap bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@click.command()
+@click.option('--input', default='data/raw/articles.json', help='Sample articles to replicate')
+@click.option('--articles', default=20000, help='Number of articles in the corpus')
+@click.option('--lookups', default=20000, help='Random lookups in the steady-state test')
+def main(input: str, articles: int, lookups: int):
+    """Benchmark single-article lookups against the indexed store."""
+    table = Table(title=f"Fetching one article from {articles} articles")
+    table.add_column("Method", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("Peak heap MB", style="magenta")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = str(Path(tmp) / "articles.json")
+        jsonl_path = str(Path(tmp) / "articles.jsonl")
+        index_path = str(Path(tmp) / "articles.aix")
+
+        corpus = list(build_corpus(input, articles))
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(corpus, file, ensure_ascii=False, indent=2)
+        for path in (jsonl_path, index_path):
+            with ArticleWriter(path) as writer:
+                for article_dict in corpus:
+                    writer.write_dict(article_dict)
+        titles = [article_dict["title"] for article_dict in corpus]
+        target = titles[len(titles) // 2]
+        del corpus
+
+        def load_json():
+            with open(json_path, "r", encoding="utf-8") as file:
+                return next(d for d in json.load(file) if d["title"] == target)
+
+        def scan_jsonl():
+            return next(d for d in iter_article_dicts(jsonl_path) if d["title"] == target)
+
+        def open_index():
+            with IndexedArticleStore(index_path) as store:
+                return store.get(target)
+
+        for name, function in (("load JSON, then search", load_json),
+                               ("stream JSONL until found", scan_jsonl),
+                               ("open .aix, get(title)", open_index)):
+            article, elapsed, peak = measure(function)
+            assert article["title"] == target
+            table.add_row(name, f"{elapsed:.4f}", f"{peak / 1e6:.1f}")
+
+        with IndexedArticleStore(index_path) as store:
+            picks = [random.choice(titles) for _ in range(lookups)]
+            start = time.perf_counter()
+            for title in picks:
+                store.get(title)
+            title_rate = lookups / (time.perf_counter() - start)
+
+            page_ids = [random.randint(1, articles) for _ in range(lookups)]
+            start = time.perf_counter()
+            for page_id in page_ids:
+                store.position_of_page_id(page_id)
+            page_id_rate = lookups / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            scanned = sum(len(record) for record in store.iter_records())
+            scan_seconds = time.perf_counter() - start
+            stats = store.get_statistics()
+
+    console.print(table)
+    console.print(
+        f"Steady state: get(title) {title_rate:,.0f}/s (decoded), "
+        f"page id lookups {page_id_rate:,.0f}/s, "
+        f"{stats['probes_per_lookup']:.2f} probes per lookup"
+    )
+    console.print(f"Zero-copy record scan: {scanned / scan_seconds / 1e9:.2f} GB/s "
+                  f"over {stats['bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
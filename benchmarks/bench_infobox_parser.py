@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Infobox Parser Benchmark
+
+Compares the single-pass template parser with the original regex and
+character-loop infobox parsing on synthetic pages the size of our largest
+articles (provinces, dynasties): long infoboxes whose values nest templates
+and piped links, followed by a long body full of templates.
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.wikitext_parser import (
+    clean_wiki_markup, parse_infobox, parse_templates, _split_parameters, _top_level_pipes
+)
+
+console = Console()
+
+VALUE_VARIANTS = [
+    "{value}",
+    "[[{value}]]",
+    "[[{value}|{value} {index}]]",
+    "{{{{formatnum:{index}}}}} người",
+    "{{{{convert|{index}|km2|sqmi}}}} [[{value}]]",
+    "[[{value}]]<ref>{{{{chú thích web|url=https://vi.wikipedia.org/{index}|tiêu đề={value}}}}}</ref>",
+    "{{{{Coord|{index}|N|105|E|display=inline}}}}",
+    "'''{value}''' <!-- ghi chú | {index} -->",
+]
+
+NAMES = ["Hà Nội", "Huế", "Đà Nẵng", "Nhà Lý", "Nhà Trần", "Lê Lợi", "Thăng Long", "Hải Phòng"]
+
+
+def build_page(kind: str, fields: int, paragraphs: int) -> str:
+    """Build a province or dynasty page with ``fields`` infobox parameters."""
+    lines = [f"{{{{Thông tin {kind}"]
+    for index in range(fields):
+        value = VALUE_VARIANTS[index % len(VALUE_VARIANTS)].format(
+            value=NAMES[index % len(NAMES)], index=index
+        )
+        lines.append(f"| trường_{index} = {value}")
+    lines.append("}}")
+
+    for index in range(paragraphs):
+        lines.append(
+            f"'''{NAMES[index % len(NAMES)]}''' là [[{NAMES[(index + 1) % len(NAMES)]}|một địa danh]] "
+            f"{{{{lang|vi|{index}}}}} với dân số {{{{formatnum:{index * 1000}}}}}."
+            f"<ref>{{{{chú thích sách|tên={index}|năm=1990}}}}</ref>"
+        )
+        if index % 10 == 0:
+            lines.append(f"== Mục {index} ==\n{{{{Chính|{NAMES[index % len(NAMES)]}}}}}")
+    return "\n".join(lines)
+
+
+def legacy_parse_infobox_parameters(content: str) -> Dict[str, str]:
+    """The original character-loop parameter splitter."""
+    params = {}
+    parts = []
+    current_part = ""
+    brace_depth = 0
+
+    for char in content:
+        if char == "{":
+            brace_depth += 1
+        elif char == "}":
+            brace_depth -= 1
+        elif char == "|" and brace_depth == 0:
+            parts.append(current_part.strip())
+            current_part = ""
+            continue
+        current_part += char
+
+    if current_part.strip():
+        parts.append(current_part.strip())
+
+    for part in parts[1:]:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            key = key.strip()
+            value = clean_wiki_markup(value.strip())
+            if key and value:
+                params[key] = value
+    return params
+
+
+def legacy_parse_infobox(wikitext: str) -> Dict[str, str]:
+    """The original regex infobox parser, which stops at the first ``}``."""
+    infobox = {}
+    infobox_patterns = [
+        r"\{\{\s*[Tt]hông tin\s+([^}]+?)\}\}",
+        r"\{\{\s*[Hh]ộp thông tin\s+([^}]+?)\}\}",
+        r"\{\{\s*[Ii]nfobox\s+([^}]+?)\}\}",
+        r"\{\{\s*[Tt]hông\s+tin\s+([^}]+?)\}\}",
+    ]
+    for pattern in infobox_patterns:
+        for match in re.finditer(pattern, wikitext, re.IGNORECASE | re.DOTALL):
+            infobox_content = match.group(1)
+            infobox["template_type"] = infobox_content.split("|")[0].strip()
+            infobox.update(legacy_parse_infobox_parameters(infobox_content))
+            if infobox:
+                break
+    return infobox
+
+
+def legacy_split(content: str) -> List[str]:
+    """The splitting half of the original parser, without value cleanup."""
+    parts = []
+    current_part = ""
+    brace_depth = 0
+    for char in content:
+        if char == "{":
+            brace_depth += 1
+        elif char == "}":
+            brace_depth -= 1
+        elif char == "|" and brace_depth == 0:
+            parts.append(current_part.strip())
+            current_part = ""
+            continue
+        current_part += char
+    return parts
+
+
+def scanner_split(content: str):
+    return _split_parameters(content, 0, len(content), _top_level_pipes(content, 0, len(content)))
+
+
+def time_calls(function: Callable, argument, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(argument)
+    return (time.perf_counter() - start) / repeat
+
+
+def add_row(table: Table, page: str, step: str, legacy_seconds: float, legacy_fields: int,
+            scanner_seconds: float, scanner_fields: int) -> None:
+    table.add_row(
+        page, step,
+        f"{legacy_seconds * 1000:.2f}", f"{scanner_seconds * 1000:.2f}",
+        f"{legacy_seconds / scanner_seconds:.1f}x",
+        f"{legacy_fields}/{scanner_fields}",
+        f"{legacy_seconds / max(legacy_fields, 1) * 1e6:.1f}/{scanner_seconds / max(scanner_fields, 1) * 1e6:.1f}",
+    )
+
+
+@click.command()
+@click.option('--fields', default=150, help='Infobox parameters per page')
+@click.option('--paragraphs', default=400, help='Body paragraphs per page')
+@click.option('--repeat', default=20, help='Parses per measurement')
+def main(fields: int, paragraphs: int, repeat: int):
+    """Benchmark infobox parsing on large synthetic pages."""
+    table = Table(title=f"Infobox parsing ({fields} fields, {paragraphs} paragraphs, x{repeat})")
+    table.add_column("Page", style="cyan")
+    table.add_column("Step", style="cyan")
+    table.add_column("Original ms", style="green")
+    table.add_column("Scanner ms", style="green")
+    table.add_column("Speedup", style="magenta")
+    table.add_column("Fields", style="yellow")
+    table.add_column("µs/field", style="yellow")
+
+    for kind in ("tỉnh", "triều đại"):
+        page = build_page(kind, fields, paragraphs)
+        infobox = parse_templates(page)[0]
+        body = page[infobox.start + 2:infobox.end - 2]
+        label = f"{kind} ({len(page) // 1024} KB)"
+
+        # Splitting the full infobox body, which the original regex never reached
+        add_row(
+            table, label, "split parameters",
+            time_calls(legacy_split, body, repeat), len(legacy_split(body)) - 1,
+            time_calls(scanner_split, body, repeat), len(scanner_split(body)[1]),
+        )
+        add_row(
+            table, "", "parse_infobox",
+            time_calls(legacy_parse_infobox, page, repeat), len(legacy_parse_infobox(page)) - 1,
+            time_calls(parse_infobox, page, repeat), len(parse_infobox(page)) - 1,
+        )
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Multi-Wiki Collection Benchmark
+
+Collects the same number of articles from three stub wikis (standing in for
+vi, en and fr Wikipedia), each with simulated latency and its own rate
+limit, once wiki after wiki and once with MultiWikiCollector running them
+side by side. With an independent budget per host the concurrent wall time
+should be close to that of the slowest wiki.
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import click
+import yaml
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_collectors import write_config
+from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.multi_wiki_collector import MultiWikiCollector
+from tests.mediawiki_stub import MediaWikiStub, make_page
+
+console = Console()
+
+WIKIS = ("vi", "en", "fr")
+
+
+@click.command()
+@click.option('--articles', default=200, help='Articles per wiki')
+@click.option('--latency', default=0.1, help='Simulated server latency in seconds')
+@click.option('--rate', default=10.0, help='Rate limit per host (requests per second)')
+def main(articles: int, latency: float, rate: float):
+    """Benchmark sequential vs concurrent collection from several wikis."""
+    titles = [f"Article {i}" for i in range(articles)]
+    stubs = [
+        MediaWikiStub({title: make_page(title, page_id=i + 1) for i, title in enumerate(titles)},
+                      latency=latency).start()
+        for _ in WIKIS
+    ]
+
+    table = Table(title=f"Multi-wiki collection ({len(WIKIS)} wikis x {articles} articles, "
+                        f"{latency * 1000:.0f} ms latency, {rate:g} req/s per host)")
+    table.add_column("Run", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("Articles/s", style="green")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = write_config(stubs[0].base_url, rate, 1, tmp)
+            with open(config_path, "r", encoding="utf-8") as file:
+                config = yaml.safe_load(file)
+            config["wikis"] = {
+                wiki: {"base_url": stub.base_url} for wiki, stub in zip(WIKIS[1:], stubs[1:])
+            }
+            with open(config_path, "w", encoding="utf-8") as file:
+                yaml.safe_dump(config, file, allow_unicode=True)
+
+            start = time.perf_counter()
+            for wiki in WIKIS:
+                WikipediaCollector(config_path, wiki=wiki).get_articles_by_titles(titles)
+            sequential = time.perf_counter() - start
+            table.add_row("one wiki after another", f"{sequential:.2f}",
+                          f"{len(WIKIS) * articles / sequential:.1f}")
+
+            multi = MultiWikiCollector(WIKIS, config_path)
+            start = time.perf_counter()
+            multi.collect_titles({wiki: titles for wiki in WIKIS})
+            concurrent = time.perf_counter() - start
+            table.add_row("MultiWikiCollector", f"{concurrent:.2f}",
+                          f"{len(WIKIS) * articles / concurrent:.1f}")
+
+            stats = multi.get_statistics()
+            slowest = max(stats["wiki_seconds"].values())
+            table.add_row("slowest single wiki", f"{slowest:.2f}", f"{articles / slowest:.1f}")
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
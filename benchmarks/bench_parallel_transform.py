@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Parallel RDF Transformation Benchmark
+
+Writes a JSON Lines corpus (the sample articles replicated under new titles
+and page ids), indexes it, and streams it to partial N-Quads files with 1,
+2, 4, ... worker processes, then merges the partial files. Throughput
+should grow close to linearly with the number of workers up to the number
+of cores; beyond that the workers only compete for the same CPUs.
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_streaming_transform import iter_corpus
+from src.collectors.article_store import ArticleWriter
+from src.collectors.indexed_store import open_article_index
+from src.transformers.parallel_transform import transform_parallel, merge_partials
+
+console = Console()
+
+
+@click.command()
+@click.option('--input', default='data/raw/articles.json', help='Sample articles to replicate')
+@click.option('--articles', default=20000, help='Number of articles in the corpus')
+@click.option('--workers', default='1,2,4,8', help='Comma-separated worker counts')
+@click.option('--shard-size', default=200, help='Consecutive articles per shard handed to a worker')
+def main(input: str, articles: int, workers: str, shard_size: int):
+    """Benchmark sharded RDF transformation across worker processes."""
+    table = Table(title=f"Parallel transformation of {articles} articles ({os.cpu_count()} CPUs)")
+    table.add_column("Workers", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("Articles/s", style="green")
+    table.add_column("Triples/s", style="green")
+    table.add_column("Speedup", style="magenta")
+    table.add_column("Merge s", style="yellow")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = str(Path(tmp) / "articles.jsonl")
+        with ArticleWriter(input_path) as writer:
+            writer.write_many(iter_corpus(input, articles))
+
+        # Workers read their shards from the .aix index of the input, built once and reused
+        start = time.perf_counter()
+        open_article_index(input_path).close()
+        console.print(f"Indexed the corpus in {time.perf_counter() - start:.2f}s")
+
+        baseline = None
+        for count in (int(value) for value in workers.split(',')):
+            start = time.perf_counter()
+            partials, stats = transform_parallel(input_path, str(Path(tmp) / f"parts-{count}"),
+                                                 workers=count, shard_size=shard_size)
+            elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            merge_partials(partials, str(Path(tmp) / f"merged-{count}.nt"))
+            merge_seconds = time.perf_counter() - start
+
+            baseline = baseline or elapsed
+            table.add_row(str(count), f"{elapsed:.2f}", f"{stats['articles_processed'] / elapsed:,.0f}",
+                          f"{stats['triples_generated'] / elapsed:,.0f}", f"{baseline / elapsed:.2f}x",
+                          f"{merge_seconds:.2f}")
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Infobox Property Mapping Benchmark
+
+Transforms the infoboxes of the collected articles over and over, once
+through the original path (a hard-coded table looked up with
+``key.lower()`` and an if/elif chain on the property name per field) and
+once through the compiled field bindings, where each field costs one dict
+lookup and one converter call. Both paths parse values with the
+transformer's literal parser and build the same terms; since rdflib term construction dominates
+the end-to-end time, field resolution (mapping lookup plus choosing the
+converter, without building terms) is also timed on its own.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+from rdflib import Literal, URIRef, RDF, RDFS
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.article_store import iter_article_dicts
+from src.transformers.rdf_transformer import RDFTransformer, _UNBOUND
+
+console = Console()
+
+LEGACY_PROPERTY_MAPPINGS = {
+    'ngày sinh': 'birthDate', 'sinh': 'birthDate', 'nơi sinh': 'birthPlace', 'quê quán': 'birthPlace',
+    'ngày mất': 'deathDate', 'mất': 'deathDate', 'nơi mất': 'deathPlace', 'nghề nghiệp': 'occupation',
+    'quốc tịch': 'nationality', 'dân tộc': 'ethnicity', 'tọa độ': 'coordinates', 'diện tích': 'area',
+    'dân số': 'population', 'thành lập': 'foundingDate', 'múi giờ': 'timeZone', 'tỉnh': 'province',
+    'quận': 'district', 'phường': 'ward', 'trụ sở': 'headquarters', 'giám đốc': 'director',
+    'hiệu trưởng': 'rector', 'tên': 'name', 'tên đầy đủ': 'fullName', 'tên khác': 'alternateName',
+    'mô tả': 'description', 'website': 'homepage', 'hình ảnh': 'image',
+}
+
+
+def legacy_process_value(transformer: RDFTransformer, value: str, property_name: str) -> Optional[Any]:
+    """The original if/elif value dispatch."""
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    if property_name in ['birthDate', 'deathDate', 'foundingDate']:
+        date_value = transformer.literal_parser.parse('date', value)
+        if date_value is not None:
+            return date_value
+    elif property_name in ['population', 'area']:
+        numeric_value = transformer.literal_parser.parse('number', value)
+        if numeric_value is not None:
+            return numeric_value
+    elif property_name in ['birthPlace', 'deathPlace', 'province', 'district', 'ward']:
+        place_uri = transformer.create_entity_uri(value)
+        transformer._emit(place_uri, RDF.type, transformer.ontology.get_class_uri('Place'))
+        transformer._emit(place_uri, RDFS.label, Literal(value, lang="vi"))
+        return place_uri
+    elif property_name == 'homepage':
+        if value.startswith('http'):
+            return URIRef(value)
+    elif property_name == 'coordinates':
+        coords = transformer.literal_parser.parse('coordinates', value)
+        if coords is not None:
+            return coords
+    return Literal(value, lang="vi")
+
+
+def legacy_resolve_field(transformer: RDFTransformer, key: str) -> Optional[str]:
+    """The original field resolution: lower-case lookup, property URI, then the if/elif branch."""
+    property_name = LEGACY_PROPERTY_MAPPINGS.get(key.lower())
+    if not property_name:
+        transformer.create_entity_uri(key, 'property')
+        return 'unmapped'
+    if not transformer.ontology.get_property_uri(property_name):
+        return None
+    if property_name in ['birthDate', 'deathDate', 'foundingDate']:
+        return 'date'
+    elif property_name in ['population', 'area']:
+        return 'number'
+    elif property_name in ['birthPlace', 'deathPlace', 'province', 'district', 'ward']:
+        return 'place'
+    elif property_name == 'homepage':
+        return 'url'
+    elif property_name == 'coordinates':
+        return 'coordinates'
+    return 'literal'
+
+
+def legacy_transform_infobox(transformer: RDFTransformer, entity_uri: URIRef, infobox: Dict[str, Any]) -> None:
+    """The original per-field lookup and dispatch."""
+    for key, value in infobox.items():
+        if key == 'template_type' or not value or not value.strip():
+            continue
+        property_name = LEGACY_PROPERTY_MAPPINGS.get(key.lower())
+        if property_name:
+            property_uri = transformer.ontology.get_property_uri(property_name)
+            if property_uri:
+                object_value = legacy_process_value(transformer, value, property_name)
+                if object_value:
+                    transformer._emit(entity_uri, property_uri, object_value)
+        else:
+            custom_property_uri = transformer.create_entity_uri(key, 'property')
+            transformer._emit(entity_uri, custom_property_uri, Literal(str(value), lang="vi"))
+
+
+def run(transform, infoboxes: List[Dict[str, Any]], entity_uri: URIRef, transformer: RDFTransformer,
+        repeat: int) -> (float, int):
+    triples = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for infobox in infoboxes:
+            transformer._triples = []
+            transform(entity_uri, infobox)
+            triples += len(transformer._triples)
+    return time.perf_counter() - start, triples
+
+
+def run_resolution(resolve, keys: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for key in keys:
+            resolve(key)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--input', default='data/raw/articles.json', help='Articles whose infoboxes are transformed')
+@click.option('--repeat', default=2000, help='Passes over all infoboxes')
+def main(input: str, repeat: int):
+    """Benchmark infobox field mapping and value conversion."""
+    infoboxes = [article_dict['infobox'] for article_dict in iter_article_dicts(input) if article_dict.get('infobox')]
+    fields = sum(1 for infobox in infoboxes for key in infobox if key != 'template_type') * repeat
+
+    transformer = RDFTransformer()
+    entity_uri = transformer.create_entity_uri("Benchmark")
+    # Place nodes are described once by the new path; keep describing them to match the original
+    transformer.described_cache_size = 0
+
+    table = Table(title=f"Infobox mapping ({len(infoboxes)} infoboxes, {fields // repeat} fields, x{repeat})")
+    table.add_column("Path", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("ns/field", style="green")
+    table.add_column("Triples", style="yellow")
+    table.add_column("Speedup", style="magenta")
+
+    legacy_seconds, legacy_triples = run(
+        lambda uri, infobox: legacy_transform_infobox(transformer, uri, infobox),
+        infoboxes, entity_uri, transformer, repeat
+    )
+    table.add_row("key.lower() + if/elif", f"{legacy_seconds:.2f}", f"{legacy_seconds / fields * 1e9:.0f}",
+                  str(legacy_triples), "1.0x")
+
+    seconds, triples = run(
+        lambda uri, infobox: transformer._transform_infobox(uri, infobox, None),
+        infoboxes, entity_uri, transformer, repeat
+    )
+    table.add_row("compiled bindings", f"{seconds:.2f}", f"{seconds / fields * 1e9:.0f}",
+                  str(triples), f"{legacy_seconds / seconds:.1f}x")
+
+    console.print(table)
+
+    keys = [key for infobox in infoboxes for key in infobox if key != 'template_type']
+    field_bindings = transformer._field_bindings
+    table = Table(title=f"Field resolution only ({len(keys)} fields, x{repeat})")
+    table.add_column("Path", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("ns/field", style="green")
+    table.add_column("Speedup", style="magenta")
+
+    legacy_seconds = run_resolution(lambda key: legacy_resolve_field(transformer, key), keys, repeat)
+    table.add_row("key.lower() + if/elif", f"{legacy_seconds:.2f}", f"{legacy_seconds / fields * 1e9:.0f}", "1.0x")
+    seconds = run_resolution(
+        lambda key: field_bindings.get(key, _UNBOUND) is not _UNBOUND or transformer._bind_field(key),
+        keys, repeat
+    )
+    table.add_row("compiled bindings", f"{seconds:.2f}", f"{seconds / fields * 1e9:.0f}",
+                  f"{legacy_seconds / seconds:.1f}x")
+    console.print(table)
+
+
+if __name__ == '__main__':
+    main()
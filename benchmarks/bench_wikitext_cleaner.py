@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Wikitext Cleaner Benchmark
+
+Compares the single-scan clean_wiki_markup with the original chain of regex
+substitutions on a corpus built from data/raw/articles.json, re-wrapping the
+collected values in the markup the cleaner has to strip. The same corpus,
+with the original function's output, is the golden fixture of the tests.
+"""
+
+import re
+import sys
+import json
+import time
+from pathlib import Path
+from typing import List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collectors.wikitext_parser import clean_wiki_markup
+
+console = Console()
+
+ROOT = Path(__file__).resolve().parent.parent
+GOLDEN_PATH = ROOT / "tests" / "fixtures" / "wikitext_cleaner_golden.json"
+DUMP_FIXTURE = ROOT / "tests" / "fixtures" / "viwiki-sample-pages-articles.xml"
+
+MARKUP_VARIANTS = [
+    "{value}",
+    "[[{value}]]",
+    "[[{value}|{value}]]",
+    "'''{value}'''",
+    "''[[{value}]]''",
+    "{value}<ref>{{{{chú thích web|url=https://vi.wikipedia.org|tiêu đề={value}}}}}</ref>",
+    "{{{{nowrap|{value}}}}} <!-- {value} -->",
+    "{value}<br />[[Tập tin:Flag.svg|20px]] {{{{flagicon|VIE}}}}",
+    "[https://vi.wikipedia.org/wiki/{index} {value}]",
+    "[[File:{index}.jpg|nhỏ|[[{value}]]]]",
+    "{{{{birth date|df=y|1890|5|19}}}} ({{{{tuổi|{index}}}}}) {value}",
+    "<small>{value}</small>\n* {value}",
+]
+
+EDGE_CASES = [
+    "{{a|{{b|{{c}}}}}} x", "{{{1}}} y", "{{a}b}}", "{{unclosed", "[[a|b]] [[c]]",
+    "[[a|{{b}}]]", "[[{{a}}]]", "[[]]", "[[a]b]]", "[{{x}}[b]]", "[http://a]",
+    "[http://a b c]", "[http://a] b]", "http://a.b/c<br>d", "<a http://x> y <b>",
+    "'''''a'''''", "''a'''b'''c''", "'''a''b'''", "<!-- unterminated [[x]]",
+    "[[Image:a [[File:b]] c]]", "[[File:a\n]]", "a  b\t\nc",
+]
+
+
+def legacy_clean_wiki_markup(text: str) -> str:
+    """The original regex-chain implementation of clean_wiki_markup."""
+    if not text:
+        return ""
+
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+    text = re.sub(r"\[\[[Ff]ile:.*?\]\]", "", text)
+    text = re.sub(r"\[\[[Ii]mage:.*?\]\]", "", text)
+
+    max_iterations = 10
+    iteration_count = 0
+    while "{{" in text and iteration_count < max_iterations:
+        text = re.sub(r"{{[^{}]*}}", "", text)
+        iteration_count += 1
+
+    text = re.sub(r"\[\[([^|\]]+)\|([^\]]+)\]\]", r"\2", text)
+    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
+    text = re.sub(r"\[https?://[^\s]+ ([^\]]+)\]", r"\1", text)
+    text = re.sub(r"\[https?://[^\]]+\]", "", text)
+    text = re.sub(r"https?://[^\s]+", "", text)
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"'''([^']+)'''", r"\1", text)
+    text = re.sub(r"''([^']+)''", r"\1", text)
+    text = re.sub(r"\[\[", "", text)
+    text = re.sub(r"\]\]", "", text)
+    text = re.sub(r"[\[\]]", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def build_corpus() -> List[str]:
+    """Build cleaner inputs from the collected articles and the fixture dump."""
+    with open(ROOT / "data" / "raw" / "articles.json", "r", encoding="utf-8") as file:
+        articles = json.load(file)
+
+    values = []
+    for article in articles:
+        values.append(article["title"])
+        values.extend(v for v in article["infobox"].values() if isinstance(v, str))
+
+    corpus = [
+        variant.format(value=value, index=index)
+        for index, value in enumerate(dict.fromkeys(values))
+        for variant in MARKUP_VARIANTS
+    ]
+    corpus.extend(article["abstract"] for article in articles)
+    corpus.append(DUMP_FIXTURE.read_text(encoding="utf-8"))
+    corpus.extend(EDGE_CASES)
+    return corpus
+
+
+def time_cleaner(cleaner, corpus: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            cleaner(text)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--repeat', default=20, help='Passes over the corpus')
+@click.option('--write-golden', is_flag=True, help='Regenerate the golden test fixture')
+def main(repeat: int, write_golden: bool):
+    """Benchmark the wikitext cleaner against the original regex chain."""
+    corpus = build_corpus()
+    expected = [legacy_clean_wiki_markup(text) for text in corpus]
+
+    if write_golden:
+        golden = [{"input": text, "expected": output} for text, output in zip(corpus, expected)]
+        GOLDEN_PATH.write_text(json.dumps(golden, ensure_ascii=False, indent=0), encoding="utf-8")
+        console.print(f"Wrote {len(golden)} golden cases to {GOLDEN_PATH}")
+
+    mismatches = sum(clean_wiki_markup(text) != output for text, output in zip(corpus, expected))
+    legacy_seconds = time_cleaner(legacy_clean_wiki_markup, corpus, repeat)
+    scanner_seconds = time_cleaner(clean_wiki_markup, corpus, repeat)
+    calls = len(corpus) * repeat
+
+    table = Table(title=f"clean_wiki_markup ({len(corpus)} inputs x {repeat})")
+    table.add_column("Implementation", style="cyan")
+    table.add_column("Seconds", style="green")
+    table.add_column("µs/call", style="green")
+    table.add_row("regex chain", f"{legacy_seconds:.3f}", f"{legacy_seconds / calls * 1e6:.1f}")
+    table.add_row("single scan", f"{scanner_seconds:.3f}", f"{scanner_seconds / calls * 1e6:.1f}")
+    console.print(table)
+    console.print(f"Speedup: {legacy_seconds / scanner_seconds:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,8 @@ project including data collection, transformation, loading, and querying.
 import os
 import sys
 import json
+import time
+import tempfile
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -24,7 +26,20 @@ from rich.logging import RichHandler
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.async_collector import AsyncWikipediaCollector
+from src.collectors.pipeline_collector import PipelineCollector
+from src.collectors.crawl_journal import CrawlJournal
+from src.collectors.article_store import iter_articles, iter_article_dicts
+from src.collectors.article_archive import ArchiveWriter
+from src.collectors.indexed_store import IndexedArticleStore, IndexedStoreWriter, open_article_index
+from src.collectors.dump_reader import DumpReader
+from src.collectors.wikitext_store import WikitextStore, reparse_articles
+from src.collectors.title_aliases import TitleAliasTable
+from src.collectors.work_frontier import WorkFrontier, FrontierWorker
+from src.collectors.multi_wiki_collector import MultiWikiCollector
 from src.transformers.rdf_transformer import RDFTransformer
+from src.transformers.ntriples_writer import NTRIPLES_SUFFIX, NQUADS_SUFFIX
+from src.transformers.parallel_transform import transform_parallel, merge_partials, load_partials
 from src.ontology.vietnam_ontology import VietnamOntology
 from src.graphdb.graphdb_manager import GraphDBManager
 from src.graphdb.graphdb_loader import GraphDBLoader
@@ -154,12 +169,54 @@ def collect():
 @click.option('--articles', default='sample', help='Articles to collect: sample, categories, or custom file')
 @click.option('--output', default='data/raw/articles.json', help='Output file path')
 @click.option('--limit', default=100, help='Maximum articles to collect')
-def collect_wikipedia(articles: str, output: str, limit: int):
+@click.option('--mode', type=click.Choice(['sync', 'async', 'pipeline']), default=None,
+              help='Collection engine (default: concurrency.mode from config)')
+@click.option('--max-in-flight', default=None, type=int, help='Concurrent requests in async mode')
+@click.option('--parse-workers', default=None, type=int, help='Parser processes in pipeline mode')
+@click.option('--no-cache', is_flag=True, help='Bypass the on-disk response cache')
+@click.option('--store-wikitext', is_flag=True,
+              help='Keep raw section-0 wikitext for offline re-parsing (default: wikitext_store.enabled)')
+@click.option('--journal', default=None, help='Crawl journal path (default: <output>.journal.jsonl)')
+@click.option('--resume', is_flag=True, help='Resume an interrupted crawl from its journal')
+@click.option('--restart', is_flag=True, help='Discard an existing crawl journal and start over')
+@click.option('--checkpoint-every', default=None, type=int, help='Flush the journal every N records')
+@click.option('--counterparts', default=None,
+              help='Also collect the same entities from other wikis listed under "wikis" (e.g. en,fr)')
+def collect_wikipedia(articles: str, output: str, limit: int, mode: Optional[str],
+                      max_in_flight: Optional[int], parse_workers: Optional[int], no_cache: bool,
+                      store_wikitext: bool, journal: Optional[str], resume: bool, restart: bool,
+                      checkpoint_every: Optional[int], counterparts: Optional[str]):
     """Collect Wikipedia articles."""
+    journal_path = journal or f"{output}.journal.jsonl"
+    if resume and restart:
+        console.print("[red]✗ --resume and --restart cannot be used together[/red]")
+        sys.exit(1)
+    # Opening a journal without --resume truncates it, losing the checkpoints of an earlier crawl
+    if not resume and not restart and os.path.isfile(journal_path) and os.path.getsize(journal_path):
+        console.print(f"[red]✗ Crawl journal {journal_path} already exists; "
+                      f"pass --resume to continue that crawl or --restart to discard it[/red]")
+        sys.exit(1)
+
+    crawl_journal = None
     try:
         console.print("[bold blue]Collecting Wikipedia articles...[/bold blue]")
         
-        collector = WikipediaCollector()
+        collector = WikipediaCollector(
+            use_cache=False if no_cache else None,
+            store_wikitext=True if store_wikitext else None,
+        )
+        mode = mode or collector.concurrency_config.get('mode', 'sync')
+        if mode == 'async':
+            engine = AsyncWikipediaCollector(collector, max_in_flight=max_in_flight)
+        elif mode == 'pipeline':
+            engine = PipelineCollector(collector, parse_workers=parse_workers)
+        else:
+            engine = collector
+        
+        # Checkpoint every fetched article so an interrupted crawl can be resumed
+        checkpoint_every = checkpoint_every or collector.extraction_config.get('checkpoint_every', 50)
+        crawl_journal = CrawlJournal(journal_path, flush_every=checkpoint_every).open(resume=resume)
+        collector.use_journal(crawl_journal)
         
         with Progress(
             SpinnerColumn(),
@@ -169,21 +226,20 @@ def collect_wikipedia(articles: str, output: str, limit: int):
             task = progress.add_task("Collecting articles...", total=None)
             
             if articles == 'sample':
-                collected_articles = collector.collect_sample_articles()
+                collected_articles = engine.collect_sample_articles()
                 progress.update(task, description="Collected sample articles")
             elif articles == 'categories':
-                collected_articles = collector.collect_articles_by_categories(limit // 5)
+                collected_articles = engine.collect_articles_by_categories(limit // 5)
                 progress.update(task, description="Collected articles from categories")
             else:
                 # Custom file with article titles
                 with open(articles, 'r', encoding='utf-8') as f:
                     titles = [line.strip() for line in f if line.strip()]
                 
-                collected_articles = []
-                for title in titles[:limit]:
-                    article = collector.get_article_by_title(title)
-                    if article:
-                        collected_articles.append(article)
+                if mode in ('async', 'pipeline'):
+                    collected_articles = engine.collect_titles(titles[:limit])
+                else:
+                    collected_articles = collector.get_articles_by_titles(titles[:limit])
                 
                 progress.update(task, description=f"Collected {len(collected_articles)} custom articles")
             
@@ -191,8 +247,15 @@ def collect_wikipedia(articles: str, output: str, limit: int):
             collector.save_articles_to_json(collected_articles, output)
             progress.update(task, description="Articles saved")
         
+        # The crawl finished and its articles are saved, so there is nothing left to resume
+        crawl_journal.close()
+        crawl_journal = None
+        os.remove(journal_path)
+        
         # Show statistics
         stats = collector.get_collection_statistics()
+        if mode == 'pipeline':
+            stats['pipeline'] = engine.get_statistics()
         table = Table(title="Collection Statistics")
         table.add_column("Metric", style="cyan")
         table.add_column("Count", style="green")
@@ -207,9 +270,297 @@ def collect_wikipedia(articles: str, output: str, limit: int):
         console.print(table)
         console.print(f"[green]✓[/green] Articles saved to: {output}")
         
+        if counterparts:
+            _collect_counterparts(collector, collected_articles, output,
+                                  [wiki.strip() for wiki in counterparts.split(',') if wiki.strip()],
+                                  use_cache=False if no_cache else None,
+                                  mode='async' if mode == 'async' else 'sync')
+        
+    except KeyboardInterrupt:
+        console.print(f"[yellow]⚠ Interrupted; rerun with --resume to continue the crawl[/yellow]")
+        sys.exit(130)
     except Exception as e:
         console.print(f"[red]✗ Failed to collect articles: {e}[/red]")
         sys.exit(1)
+    finally:
+        if crawl_journal is not None:
+            crawl_journal.close()
+
+
+def _wiki_output_path(output: str, wiki: str) -> str:
+    """Insert the wiki language before the extensions: articles.jsonl.gz -> articles.en.jsonl.gz."""
+    path = Path(output)
+    stem, _, suffixes = path.name.partition('.')
+    return str(path.with_name(f"{stem}.{wiki}.{suffixes}" if suffixes else f"{stem}.{wiki}"))
+
+
+def _collect_counterparts(collector: WikipediaCollector, collected_articles: List[Any], output: str,
+                          wikis: List[str], use_cache: Optional[bool], mode: str) -> None:
+    """Collect the other-language counterparts of collected articles, one wiki per thread."""
+    console.print(f"[bold blue]Collecting counterparts from {', '.join(wikis)}...[/bold blue]")
+    multi = MultiWikiCollector(wikis, use_cache=use_cache, mode=mode)
+    results = multi.collect_counterparts(collector, collected_articles)
+
+    links_path = str(Path(output).with_name(Path(output).name.partition('.')[0] + '.langlinks.json'))
+    with open(links_path, 'w', encoding='utf-8') as f:
+        json.dump(multi.language_links, f, ensure_ascii=False, indent=2)
+
+    stats = multi.get_statistics()
+    table = Table(title="Counterpart Collection")
+    table.add_column("Wiki", style="cyan")
+    table.add_column("Articles", style="green")
+    table.add_column("Seconds", style="green")
+    table.add_column("Output", style="green")
+    for wiki, wiki_articles in results.items():
+        wiki_output = _wiki_output_path(output, wiki)
+        multi.collectors[wiki].save_articles_to_json(wiki_articles, wiki_output)
+        table.add_row(wiki, str(len(wiki_articles)),
+                      f"{stats['wiki_seconds'].get(wiki, 0.0):.1f}", wiki_output)
+
+    console.print(table)
+    console.print(f"Wall time {stats['elapsed_seconds']:.1f}s "
+                  f"(wikis one after another: {stats['sequential_seconds']:.1f}s)")
+    console.print(f"[green]✓[/green] Language links saved to: {links_path}")
+
+
+@collect.command('dump')
+@click.option('--input', required=True, help='pages-articles XML dump (.xml, .xml.bz2 or .xml.gz)')
+@click.option('--output', default='data/raw/articles.jsonl.gz', help='Output JSON Lines article file')
+@click.option('--workers', default=None, type=int, help='Parser processes (default: CPU count)')
+@click.option('--limit', default=None, type=int, help='Maximum articles to ingest')
+@click.option('--language', default='vi', help='Wikipedia language edition of the dump')
+@click.option('--include-content', is_flag=True, help='Also store the cleaned full article text')
+def collect_dump(input: str, output: str, workers: Optional[int], limit: Optional[int],
+                 language: str, include_content: bool):
+    """Ingest articles from an offline Wikipedia XML dump."""
+    try:
+        console.print("[bold blue]Ingesting Wikipedia dump...[/bold blue]")
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Parsing dump...", total=None)
+            reader = DumpReader(input, workers=workers, language=language,
+                                include_content=include_content)
+            stats = reader.write_to_store(output, limit)
+            progress.update(task, description="Dump ingested")
+        
+        table = Table(title="Dump Ingestion Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        for key, value in stats.items():
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            table.add_row(key.replace('_', ' ').title(), str(value))
+        
+        console.print(table)
+        console.print(f"[green]✓[/green] Articles saved to: {output}")
+        
+    except Exception as e:
+        console.print(f"[red]✗ Failed to ingest dump: {e}[/red]")
+        sys.exit(1)
+
+
+def _open_frontier(collector: WikipediaCollector, frontier: Optional[str],
+                   worker_id: Optional[str] = None) -> WorkFrontier:
+    """Open the shared work frontier configured for a collector."""
+    frontier_config = collector.frontier_config
+    return WorkFrontier(
+        frontier or frontier_config.get('path', 'data/frontier.sqlite'),
+        lease_seconds=frontier_config.get('lease_seconds', 600),
+        max_attempts=frontier_config.get('max_attempts', 3),
+        worker_id=worker_id,
+    )
+
+
+def _print_frontier_counts(work_frontier: WorkFrontier) -> None:
+    table = Table(title="Frontier")
+    table.add_column("State", style="cyan")
+    table.add_column("Titles", style="green")
+    for state, count in work_frontier.counts().items():
+        table.add_row(state, str(count))
+    console.print(table)
+
+
+@collect.command('enqueue')
+@click.option('--articles', default='sample', help='Titles to add: sample, categories, or custom file')
+@click.option('--frontier', default=None, help='Shared frontier database (default: frontier.path)')
+@click.option('--limit', default=100, help='Maximum titles per category')
+def collect_enqueue(articles: str, frontier: Optional[str], limit: int):
+    """Add titles to the shared work frontier for collect worker nodes."""
+    try:
+        collector = WikipediaCollector()
+        if articles == 'sample':
+            titles = collector.get_sample_titles()
+        elif articles == 'categories':
+            titles = collector.crawl_target_categories(limit)
+        else:
+            with open(articles, 'r', encoding='utf-8') as f:
+                titles = [line.strip() for line in f if line.strip()]
+
+        with _open_frontier(collector, frontier) as work_frontier:
+            added = work_frontier.add_titles(titles)
+            console.print(f"[green]✓[/green] Added {added} new titles ({len(titles) - added} already queued)")
+            _print_frontier_counts(work_frontier)
+
+    except Exception as e:
+        console.print(f"[red]✗ Failed to enqueue titles: {e}[/red]")
+        sys.exit(1)
+
+
+@collect.command('worker')
+@click.option('--frontier', default=None, help='Shared frontier database (default: frontier.path)')
+@click.option('--output', default='data/raw/frontier/articles-{worker}.jsonl.gz',
+              help='Article file of this worker ({worker} is replaced by the worker id)')
+@click.option('--worker-id', default=None, help='Worker id (default: <hostname>-<pid>)')
+@click.option('--batch-size', default=None, type=int, help='Titles claimed per lease')
+@click.option('--no-cache', is_flag=True, help='Bypass the on-disk response cache')
+def collect_worker(frontier: Optional[str], output: str, worker_id: Optional[str],
+                   batch_size: Optional[int], no_cache: bool):
+    """Collect titles from the shared work frontier until it is drained.
+
+    Run one worker per process or machine against the same frontier; the
+    configured rate limit is shared by all of them.
+    """
+    try:
+        collector = WikipediaCollector(use_cache=False if no_cache else None)
+        with _open_frontier(collector, frontier, worker_id) as work_frontier:
+            worker = FrontierWorker(
+                collector, work_frontier, output,
+                batch_size=batch_size or collector.frontier_config.get('batch_size', 50),
+            )
+            console.print(f"[bold blue]Worker {work_frontier.worker_id} collecting...[/bold blue]")
+            stats = worker.run()
+
+            table = Table(title="Worker Statistics")
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", style="green")
+            for key, value in stats.items():
+                if isinstance(value, dict):
+                    for sub_key, sub_value in value.items():
+                        table.add_row(f"{key}: {sub_key}", str(sub_value))
+                else:
+                    table.add_row(key.replace('_', ' ').title(), str(value))
+            console.print(table)
+            _print_frontier_counts(work_frontier)
+            console.print(f"[green]✓[/green] Articles saved to: {worker.output_path}")
+
+    except KeyboardInterrupt:
+        console.print("[yellow]⚠ Interrupted; leased titles return to the frontier when their lease expires[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"[red]✗ Worker failed: {e}[/red]")
+        sys.exit(1)
+
+
+@collect.command('reparse')
+@click.option('--input', default='data/raw/articles.json', help='Collected articles file')
+@click.option('--wikitext', default='data/raw/wikitext.sqlite', help='Wikitext store written during collection')
+@click.option('--output', required=True, help='Output JSON Lines article file')
+@click.option('--workers', default=None, type=int, help='Parser processes (default: CPU count)')
+def collect_reparse(input: str, wikitext: str, output: str, workers: Optional[int]):
+    """Rebuild article infoboxes from stored wikitext, without network access."""
+    try:
+        if not os.path.exists(wikitext):
+            console.print(f"[red]✗ Wikitext store not found: {wikitext}[/red]")
+            console.print("Collect with --store-wikitext to create it")
+            sys.exit(1)
+
+        console.print("[bold blue]Re-parsing stored wikitext...[/bold blue]")
+        with WikitextStore(wikitext) as store:
+            stats = reparse_articles(input, store, output, workers=workers)
+
+        table = Table(title="Reparse Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        for key, value in stats.items():
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            table.add_row(key.replace('_', ' ').title(), str(value))
+
+        console.print(table)
+        console.print(f"[green]✓[/green] Articles saved to: {output}")
+
+    except Exception as e:
+        console.print(f"[red]✗ Failed to reparse articles: {e}[/red]")
+        sys.exit(1)
+
+
+@collect.command('archive')
+@click.option('--input', default='data/raw/articles.json', help='Collected articles file')
+@click.option('--output', default='data/raw/articles.zarc', help='Output article archive (.zarc)')
+@click.option('--dictionary', default=None, help='zstd dictionary to reuse; trained and saved here if missing')
+@click.option('--dict-size', default=112, help='Dictionary size in KB when training')
+@click.option('--training-records', default=2000, help='Articles sampled to train the dictionary')
+def collect_archive(input: str, output: str, dictionary: Optional[str], dict_size: int,
+                    training_records: int):
+    """Convert an article file into a dictionary-compressed archive."""
+    try:
+        trained = None
+        if dictionary and os.path.exists(dictionary):
+            with open(dictionary, 'rb') as file:
+                trained = file.read()
+            console.print(f"Using dictionary {dictionary} ({len(trained)} bytes)")
+
+        console.print("[bold blue]Archiving articles...[/bold blue]")
+        with ArchiveWriter(output, dictionary=trained, dict_size=dict_size * 1024,
+                           training_records=training_records) as writer:
+            for article_dict in iter_article_dicts(input):
+                writer.write_dict(article_dict)
+
+        if dictionary and trained is None and writer.dictionary:
+            Path(dictionary).parent.mkdir(parents=True, exist_ok=True)
+            with open(dictionary, 'wb') as file:
+                file.write(writer.dictionary)
+            console.print(f"Saved dictionary to {dictionary}")
+
+        table = Table(title="Archive Statistics")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        for key, value in writer.get_statistics().items():
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            table.add_row(key.replace('_', ' ').title(), str(value))
+
+        console.print(table)
+        console.print(f"[green]✓[/green] Archive saved to: {output}")
+
+    except Exception as e:
+        console.print(f"[red]✗ Failed to archive articles: {e}[/red]")
+        sys.exit(1)
+
+
+@collect.command('index')
+@click.option('--input', default='data/raw/articles.json', help='Collected articles file')
+@click.option('--output', default=None, help='Indexed store (.aix, default: <input>.aix)')
+@click.option('--title', 'titles', multiple=True, help='Look up an article after indexing')
+def collect_index(input: str, output: Optional[str], titles: List[str]):
+    """Build a memory-mapped article index for lookups by title or page id."""
+    try:
+        console.print("[bold blue]Indexing articles...[/bold blue]")
+        if output:
+            with IndexedStoreWriter(output) as writer:
+                for article_dict in iter_article_dicts(input):
+                    writer.write_dict(article_dict)
+            store = IndexedArticleStore(output)
+        else:
+            store = open_article_index(input)
+
+        with store:
+            for title in titles:
+                article = store.get(title)
+                if article is None:
+                    console.print(f"[yellow]⚠ Not found: {title}[/yellow]")
+                else:
+                    console.print(f"[cyan]{article['title']}[/cyan] (page {article['page_id']}): "
+                                  f"{article['abstract'][:200]}")
+            console.print(f"[green]✓[/green] {len(store)} articles indexed in: {store.store_path}")
+
+    except Exception as e:
+        console.print(f"[red]✗ Failed to index articles: {e}[/red]")
+        sys.exit(1)
 
 
 @cli.group()
@@ -222,9 +573,16 @@ def transform():
 @click.option('--input', default='data/raw/articles.json', help='Input articles JSON file')
 @click.option('--output-dir', default='data/rdf', help='Output directory for RDF files')
 @click.option('--formats', default='turtle,xml,jsonld', help='RDF formats to export')
-def transform_rdf(input: str, output_dir: str, formats: str):
+@click.option('--stream', is_flag=True, help='Stream N-Triples to disk instead of building an in-memory graph')
+@click.option('--graph', default=None, help='Named graph URI; with --stream, writes N-Quads instead of N-Triples')
+@click.option('--workers', default=1, help='Transform processes, each writing a partial N-Quads file (0 = CPU count)')
+def transform_rdf(input: str, output_dir: str, formats: str, stream: bool, graph: Optional[str], workers: int):
     """Transform articles to RDF format."""
     try:
+        if stream:
+            _stream_rdf(input, output_dir, graph, workers)
+            return
+        
         console.print("[bold blue]Transforming articles to RDF...[/bold blue]")
         
         with Progress(
@@ -234,14 +592,24 @@ def transform_rdf(input: str, output_dir: str, formats: str):
         ) as progress:
             task = progress.add_task("Loading articles...", total=None)
             
-            # Load articles
-            collector = WikipediaCollector()
-            articles = collector.load_articles_from_json(input)
-            progress.update(task, description=f"Loaded {len(articles)} articles")
+            # Stream articles from the input file
+            articles = iter_articles(input)
+            progress.update(task, description="Streaming articles...")
             
             # Transform to RDF
             transformer = RDFTransformer()
-            transformer.transform_articles_batch(articles)
+            if workers == 1:
+                transformer.transform_articles_batch(articles)
+            else:
+                # Transform in worker processes, then load their partial files into one graph;
+                # the partials go to a fresh directory so nothing of the user's is deleted with it
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                with tempfile.TemporaryDirectory(prefix="parts-", dir=output_dir) as shard_dir:
+                    partials, stats = transform_parallel(input, shard_dir, workers=workers or None)
+                    progress.update(task, description="Merging partial files...")
+                    load_partials(partials, transformer.graph)
+                # The merged worker stats hold the cache counters; the parent transformer's are empty
+                stats['triples_generated'] = stats['current_graph_size'] = len(transformer.graph)
             progress.update(task, description="Transformed to RDF")
             
             # Export in different formats
@@ -277,20 +645,9 @@ def transform_rdf(input: str, output_dir: str, formats: str):
             validation = transformer.validate_rdf()
             progress.update(task, description="Validation complete")
         
-        # Show statistics
-        stats = transformer.get_transformation_statistics()
-        table = Table(title="Transformation Statistics")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Count", style="green")
-        
-        for key, value in stats.items():
-            if isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    table.add_row(f"{key}: {sub_key}", str(sub_value))
-            else:
-                table.add_row(key.replace('_', ' ').title(), str(value))
-        
-        console.print(table)
+        if workers == 1:
+            stats = transformer.get_transformation_statistics()
+        _print_transformation_statistics(stats)
         console.print(f"[green]✓[/green] RDF files exported to: {output_dir}")
         console.print(f"[green]✓[/green] Validation errors: {len(validation['validation_errors'])}")
         
@@ -299,6 +656,46 @@ def transform_rdf(input: str, output_dir: str, formats: str):
         sys.exit(1)
 
 
+def _print_transformation_statistics(stats: Dict[str, Any]) -> None:
+    table = Table(title="Transformation Statistics")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Count", style="green")
+    
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                table.add_row(f"{key}: {sub_key}", str(sub_value))
+        else:
+            table.add_row(key.replace('_', ' ').title(), str(value))
+    
+    console.print(table)
+
+
+def _stream_rdf(input: str, output_dir: str, graph: Optional[str], workers: int = 1) -> None:
+    """Stream articles to one N-Triples (or N-Quads) file in constant memory."""
+    suffix = NQUADS_SUFFIX if graph else NTRIPLES_SUFFIX
+    output_path = Path(output_dir) / f"vietnamese_dbpedia{suffix}"
+    console.print(f"[bold blue]Streaming articles to {output_path}...[/bold blue]")
+    
+    start = time.perf_counter()
+    if workers == 1:
+        transformer = RDFTransformer()
+        triples = transformer.stream_rdf(iter_articles(input), str(output_path), graph=graph)['triples_written']
+        stats = transformer.get_transformation_statistics()
+    else:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="parts-", dir=output_dir) as shard_dir:
+            partials, stats = transform_parallel(input, shard_dir, workers=workers or None, graph=graph)
+            merge_partials(partials, str(output_path))
+        triples = stats['triples_generated']
+    elapsed = time.perf_counter() - start
+    
+    _print_transformation_statistics(stats)
+    console.print(f"[green]✓[/green] {triples} triples "
+                  f"({output_path.stat().st_size / 1e6:.1f} MB) written to: {output_path} "
+                  f"in {elapsed:.1f}s")
+
+
 @cli.group()
 def graphdb():
     """GraphDB management commands."""
@@ -477,8 +874,10 @@ def link():
 @click.option('--load-to-graphdb', is_flag=True, help='Load entity links into GraphDB')
 @click.option('--repository', default='vietnamese_dbpedia', help='GraphDB repository name')
 @click.option('--threshold', default=0.8, help='Confidence threshold')
+@click.option('--aliases', default='data/cache/title_aliases.sqlite',
+              help='Title alias table written by the collector')
 def link_entities(input: str, output: str, rdf_output: str, no_rdf: bool,
-                 load_to_graphdb: bool, repository: str, threshold: float):
+                 load_to_graphdb: bool, repository: str, threshold: float, aliases: str):
     """Link Vietnamese entities to English DBPedia with optional RDF export and GraphDB loading."""
     try:
         console.print("[bold blue]Linking entities to English DBPedia...[/bold blue]")
@@ -490,13 +889,12 @@ def link_entities(input: str, output: str, rdf_output: str, no_rdf: bool,
         ) as progress:
             task = progress.add_task("Loading articles...", total=None)
             
-            # Load articles
-            collector = WikipediaCollector()
-            articles = collector.load_articles_from_json(input)
-            progress.update(task, description=f"Loaded {len(articles)} articles")
+            # Stream articles from the input file
+            articles = iter_articles(input)
+            progress.update(task, description="Streaming articles...")
             
             # Link entities
-            linker = EntityLinker()
+            linker = EntityLinker(aliases=TitleAliasTable(aliases))
             linker.confidence_threshold = threshold
             
             all_matches = linker.link_articles_batch(articles)
@@ -684,14 +1082,16 @@ def show_samples():
 @click.option('--host', default='0.0.0.0', help='Host address')
 @click.option('--port', default=5000, help='Port number')
 @click.option('--debug', is_flag=True, help='Enable debug mode')
-def web(host: str, port: int, debug: bool):
+@click.option('--articles', default='data/raw/articles.json',
+              help='Collected articles served by /api/article (indexed on first use)')
+def web(host: str, port: int, debug: bool, articles: str):
     """Start web interface."""
     try:
         console.print(f"[bold blue]Starting Vietnamese DBPedia Web Interface...[/bold blue]")
         console.print(f"[green]✓[/green] Server: http://{host}:{port}")
         console.print(f"[green]✓[/green] Debug mode: {'enabled' if debug else 'disabled'}")
         
-        run_web_interface(host=host, port=port, debug=debug)
+        run_web_interface(host=host, port=port, debug=debug, articles_path=articles)
         
     except Exception as e:
         console.print(f"[red]✗ Failed to start web interface: {e}[/red]")
@@ -0,0 +1,312 @@
+"""
+Article Archive Module
+
+This module provides a compact archive format for collected articles. Every
+article is compressed on its own with zstd and a dictionary trained on the
+corpus, so records stay independently decompressible while the repetitive
+Vietnamese boilerplate (categories, templates, infobox keys) is stored once
+in the dictionary instead of once per record.
+
+Layout of an archive file::
+
+    MAGIC | record 0 | record 1 | ... | dictionary | index | footer
+
+The index is a compressed JSON list of ``[offset, length, page_id, title]``
+entries and the fixed-size footer points at the dictionary and the index, so
+a reader can seek straight to any record.
+"""
+
+import os
+import json
+import struct
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".zarc"
+MAGIC = b"VDBARC1\n"
+# dictionary offset, dictionary length, index offset, index length, record count, magic
+FOOTER = struct.Struct("<QQQQQ8s")
+
+DEFAULT_DICT_SIZE = 112 * 1024
+DEFAULT_TRAINING_RECORDS = 2000
+DEFAULT_LEVEL = 10
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstandard is required for article archives") from e
+    return zstandard
+
+
+def is_archive_path(path: str) -> bool:
+    """Check whether a path uses the article archive format."""
+    return str(path).endswith(ARCHIVE_SUFFIX)
+
+
+def _encode(article_dict: Dict[str, Any]) -> bytes:
+    return json.dumps(article_dict, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def train_dictionary(samples: List[bytes], dict_size: int = DEFAULT_DICT_SIZE,
+                     level: int = DEFAULT_LEVEL) -> Optional[bytes]:
+    """Train a zstd dictionary on encoded records, or return None if there are too few."""
+    zstandard = _zstandard()
+    try:
+        dictionary = zstandard.train_dictionary(dict_size, samples, level=level)
+    except zstandard.ZstdError as e:
+        logger.warning(f"Could not train a dictionary on {len(samples)} records: {e}")
+        return None
+    return dictionary.as_bytes()
+
+
+def train_dictionary_from_articles(article_dicts: Iterable[Dict[str, Any]],
+                                   dict_size: int = DEFAULT_DICT_SIZE,
+                                   max_records: int = DEFAULT_TRAINING_RECORDS) -> Optional[bytes]:
+    """Train a dictionary on up to ``max_records`` article dictionaries."""
+    samples = []
+    for article_dict in article_dicts:
+        samples.append(_encode(article_dict))
+        if len(samples) >= max_records:
+            break
+    return train_dictionary(samples, dict_size)
+
+
+class ArchiveWriter:
+    """Writer that compresses every article on its own against a shared dictionary.
+
+    Without a ``dictionary``, the first ``training_records`` articles are
+    buffered and used to train one before anything is written; with
+    ``training_records=0`` records are compressed without a dictionary.
+    """
+
+    def __init__(self, output_path: str, dictionary: Optional[bytes] = None,
+                 dict_size: int = DEFAULT_DICT_SIZE,
+                 training_records: int = DEFAULT_TRAINING_RECORDS,
+                 level: int = DEFAULT_LEVEL):
+        self.output_path = output_path
+        self.dict_size = dict_size
+        self.training_records = training_records
+        self.level = level
+        self.count = 0
+        self.index: List[List[Any]] = []
+        self.pending: List[Dict[str, Any]] = []
+        self.stats = {
+            'raw_bytes': 0,
+            'compressed_bytes': 0,
+            'dictionary_bytes': 0
+        }
+
+        self.dictionary = dictionary
+        self.compressor = None
+        if dictionary is not None:
+            self._start_compressor(dictionary)
+
+        # Built in a sibling temp file so a failed write never leaves a truncated archive behind
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        self.temp_path = f"{output_path}.tmp-{os.getpid()}"
+        self.file = open(self.temp_path, "wb")
+        self.file.write(MAGIC)
+        self.offset = len(MAGIC)
+
+    def _start_compressor(self, dictionary: Optional[bytes]) -> None:
+        zstandard = _zstandard()
+        # The dictionary is stored in the archive, so frames need not carry its id
+        self.compressor = zstandard.ZstdCompressor(
+            level=self.level,
+            dict_data=zstandard.ZstdCompressionDict(dictionary) if dictionary else None,
+            write_dict_id=False,
+        )
+        self.dictionary = dictionary
+        self.stats['dictionary_bytes'] = len(dictionary) if dictionary else 0
+
+    def _append(self, article_dict: Dict[str, Any]) -> None:
+        raw = _encode(article_dict)
+        frame = self.compressor.compress(raw)
+        self.file.write(frame)
+        self.index.append([self.offset, len(frame), article_dict.get("page_id"), article_dict.get("title")])
+        self.offset += len(frame)
+        self.stats['raw_bytes'] += len(raw)
+        self.stats['compressed_bytes'] += len(frame)
+
+    def _flush_pending(self) -> None:
+        if self.compressor is None:
+            dictionary = None
+            if self.training_records > 0:
+                dictionary = train_dictionary(
+                    [_encode(article_dict) for article_dict in self.pending], self.dict_size, self.level
+                )
+            self._start_compressor(dictionary)
+        for article_dict in self.pending:
+            self._append(article_dict)
+        self.pending = []
+
+    def write_dict(self, article_dict: Dict[str, Any]) -> None:
+        """Write a single article in dictionary form."""
+        self.count += 1
+        if self.compressor is not None:
+            self._append(article_dict)
+            return
+        self.pending.append(article_dict)
+        if len(self.pending) >= self.training_records:
+            self._flush_pending()
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self._flush_pending()
+
+        dictionary = self.dictionary or b""
+        index = _zstandard().ZstdCompressor(level=self.level).compress(
+            json.dumps(self.index, ensure_ascii=False).encode("utf-8")
+        )
+        dict_offset = self.offset
+        index_offset = dict_offset + len(dictionary)
+        self.file.write(dictionary)
+        self.file.write(index)
+        self.file.write(FOOTER.pack(dict_offset, len(dictionary), index_offset, len(index),
+                                    self.count, MAGIC))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+        os.replace(self.temp_path, self.output_path)
+        logger.info(
+            f"Archived {self.count} articles to {self.output_path} "
+            f"({self.stats['raw_bytes']} -> {self.stats['compressed_bytes']} bytes)"
+        )
+
+    def abort(self) -> None:
+        """Discard the partial archive, leaving ``output_path`` as it was."""
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        Path(self.temp_path).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        stats['records'] = self.count
+        stats['compression_ratio'] = (
+            stats['raw_bytes'] / stats['compressed_bytes'] if stats['compressed_bytes'] else 0.0
+        )
+        return stats
+
+
+class ArticleArchive:
+    """Random-access reader of an article archive."""
+
+    def __init__(self, archive_path: str):
+        zstandard = _zstandard()
+        self.archive_path = archive_path
+        self.lock = threading.Lock()
+        self.file = open(archive_path, "rb")
+
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f"{archive_path} is not an article archive")
+        self.file.seek(-FOOTER.size, 2)
+        dict_offset, dict_length, index_offset, index_length, count, magic = FOOTER.unpack(
+            self.file.read(FOOTER.size)
+        )
+        if magic != MAGIC:
+            self.file.close()
+            raise ValueError(f"{archive_path} is truncated (no archive footer)")
+
+        self.file.seek(dict_offset)
+        self.dictionary = self.file.read(dict_length) or None
+        self.file.seek(index_offset)
+        self.index = json.loads(zstandard.ZstdDecompressor().decompress(self.file.read(index_length)))
+        self.data_end = dict_offset
+
+        self.decompressor = zstandard.ZstdDecompressor(
+            dict_data=zstandard.ZstdCompressionDict(self.dictionary) if self.dictionary else None
+        )
+        self._positions_by_title: Optional[Dict[str, int]] = None
+        self._positions_by_page_id: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _decode(self, frame: bytes) -> Dict[str, Any]:
+        return json.loads(self.decompressor.decompress(frame))
+
+    def __getitem__(self, position: int) -> Dict[str, Any]:
+        """Decompress the article dictionary at ``position``."""
+        offset, length = self.index[position][:2]
+        with self.lock:
+            self.file.seek(offset)
+            frame = self.file.read(length)
+        return self._decode(frame)
+
+    def _build_lookups(self) -> None:
+        self._positions_by_title = {}
+        self._positions_by_page_id = {}
+        for position, (_, _, page_id, title) in enumerate(self.index):
+            self._positions_by_title.setdefault(title, position)
+            self._positions_by_page_id.setdefault(page_id, position)
+
+    def get(self, title: str) -> Optional[Dict[str, Any]]:
+        """Get an article dictionary by title."""
+        if self._positions_by_title is None:
+            self._build_lookups()
+        position = self._positions_by_title.get(title)
+        return None if position is None else self[position]
+
+    def get_by_page_id(self, page_id: int) -> Optional[Dict[str, Any]]:
+        """Get an article dictionary by page id."""
+        if self._positions_by_page_id is None:
+            self._build_lookups()
+        position = self._positions_by_page_id.get(page_id)
+        return None if position is None else self[position]
+
+    def titles(self) -> List[str]:
+        return [entry[3] for entry in self.index]
+
+    def iter_dicts(self, chunk_bytes: int = 4 * 1024 * 1024) -> Iterator[Dict[str, Any]]:
+        """Yield every article dictionary in order, reading the file in large chunks."""
+        position = 0
+        while position < len(self.index):
+            start = self.index[position][0]
+            end = position
+            # Gather the records that fit in one read
+            while end < len(self.index) and self.index[end][0] + self.index[end][1] - start <= chunk_bytes:
+                end += 1
+            end = max(end, position + 1)
+            last_offset, last_length = self.index[end - 1][:2]
+            with self.lock:
+                self.file.seek(start)
+                block = self.file.read(last_offset + last_length - start)
+            for offset, length, _, _ in self.index[position:end]:
+                yield self._decode(block[offset - start:offset - start + length])
+            position = end
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_archive_dicts(archive_path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield article dictionaries from an archive."""
+    with ArticleArchive(archive_path) as archive:
+        yield from archive.iter_dicts()
@@ -0,0 +1,236 @@
+"""
+Article Store Module
+
+This module provides a streaming JSON Lines format for collected Wikipedia
+articles. Articles are written one record per line (optionally gzip or zstd
+compressed) and read back lazily through generators, so memory use of
+downstream stages does not grow with corpus size. Paths ending in ``.zarc``
+are written as dictionary-compressed article archives instead (see
+``article_archive``), paths ending in ``.aix`` as memory-mapped indexed
+stores (see ``indexed_store``).
+"""
+
+import io
+import os
+import json
+import gzip
+import zlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator
+
+from src.collectors.wikipedia_collector import WikipediaArticle, article_to_dict
+from src.collectors.article_archive import ArchiveWriter, is_archive_path, iter_archive_dicts
+from src.collectors.indexed_store import IndexedStoreWriter, is_indexed_path, iter_indexed_dicts
+
+logger = logging.getLogger(__name__)
+
+JSONL_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+
+
+def is_jsonl_path(path: str) -> bool:
+    """Check whether a path uses the JSON Lines article format."""
+    return str(path).endswith(JSONL_SUFFIXES)
+
+
+def _open_text(path: str, mode: str) -> IO[str]:
+    """Open a possibly compressed file in text mode."""
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstandard is required for .zst article files") from e
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor(level=10).stream_writer(open(path, mode + "b"), closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class ArticleWriter:
+    """Incremental writer that appends one article per JSON line."""
+
+    def __init__(self, output_path: str, append: bool = False):
+        self.output_path = output_path
+        self.count = 0
+        # Archives and indexed stores are written by their own writers
+        self.records = None
+        self.file = None
+        if is_archive_path(output_path) or is_indexed_path(output_path):
+            if append:
+                raise ValueError(f"{output_path} is a sealed article file and cannot be appended to")
+            writer_class = ArchiveWriter if is_archive_path(output_path) else IndexedStoreWriter
+            self.records = writer_class(output_path)
+            return
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        self.file = _open_text(output_path, "a" if append else "w")
+
+    def write(self, article: WikipediaArticle) -> None:
+        """Write a single article."""
+        self.write_dict(article_to_dict(article))
+
+    def write_dict(self, article_dict: Dict[str, Any]) -> None:
+        """Write a single article that is already in dictionary form."""
+        if self.records is not None:
+            self.records.write_dict(article_dict)
+            self.count += 1
+            return
+        self.file.write(json.dumps(article_dict, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def write_many(self, articles: Iterable[WikipediaArticle]) -> int:
+        """Write articles from any iterable, returning how many were written."""
+        for article in articles:
+            self.write(article)
+        return self.count
+
+    def close(self) -> None:
+        if self.records is not None:
+            self.records.close()
+            self.records = None
+        if self.file:
+            self.file.close()
+            self.file = None
+            logger.info(f"Wrote {self.count} articles to {self.output_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if self.records is not None:
+            # Sealed formats discard a partial file when writing failed
+            records, self.records = self.records, None
+            records.__exit__(exc_type, *exc)
+        self.close()
+
+
+def _encode_batch(output_path: str, data: bytes) -> bytes:
+    """Encode JSON Lines as one self-contained chunk: a gzip member or a zstd frame."""
+    if output_path.endswith(".gz"):
+        return gzip.compress(data)
+    if output_path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstandard is required for .zst article files") from e
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return data
+
+
+def _new_decompressor(path: str):
+    """Start decompressing one gzip member or zstd frame."""
+    if path.endswith(".gz"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    import zstandard
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+def _complete_length(path: str) -> int:
+    """Get the length of the longest prefix of an article file made of whole records or chunks."""
+    if path.endswith((".gz", ".zst")):
+        complete = position = 0
+        decompressor = _new_decompressor(path)
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                while block:
+                    decompressor.decompress(block)
+                    if not decompressor.eof:
+                        position += len(block)
+                        break
+                    # A member or frame ended inside this block; the rest starts the next one
+                    position += len(block) - len(decompressor.unused_data)
+                    complete = position
+                    block = decompressor.unused_data
+                    decompressor = _new_decompressor(path)
+        return complete
+
+    # Plain JSON Lines: everything up to the last newline
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        end = size
+        while end > 0:
+            start = max(0, end - (1 << 16))
+            file.seek(start)
+            newline = file.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def truncate_torn_tail(output_path: str) -> int:
+    """Cut off a chunk or record left half-written by a crash, returning how many bytes were dropped."""
+    if not os.path.exists(output_path):
+        return 0
+    size = os.path.getsize(output_path)
+    complete = _complete_length(output_path)
+    if complete < size:
+        logger.warning(f"Dropping {size - complete} bytes of a torn write at the end of {output_path}")
+        with open(output_path, "r+b") as file:
+            file.truncate(complete)
+            file.flush()
+            os.fsync(file.fileno())
+    return size - complete
+
+
+def append_article_batch(output_path: str, articles: Iterable[WikipediaArticle]) -> int:
+    """Durably append a batch of articles as one self-contained chunk, returning how many were written.
+
+    The chunk is flushed and fsynced before returning, so the batch is on
+    disk once this returns. A crash mid-write leaves at most a torn last
+    chunk, which ``truncate_torn_tail`` removes before the next append.
+    """
+    output_path = str(output_path)
+    if is_archive_path(output_path) or is_indexed_path(output_path):
+        raise ValueError(f"{output_path} is a sealed article file and cannot be appended to")
+    lines = [json.dumps(article_to_dict(article), ensure_ascii=False) + "\n" for article in articles]
+    if not lines:
+        return 0
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "ab") as file:
+        file.write(_encode_batch(output_path, "".join(lines).encode("utf-8")))
+        file.flush()
+        os.fsync(file.fileno())
+    return len(lines)
+
+
+def iter_article_dicts(input_path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield article dictionaries from a JSON Lines, archive, indexed or legacy JSON file."""
+    if is_archive_path(input_path):
+        yield from iter_archive_dicts(input_path)
+        return
+    if is_indexed_path(input_path):
+        yield from iter_indexed_dicts(input_path)
+        return
+
+    if not is_jsonl_path(input_path):
+        # Legacy pretty-printed JSON array; it has to be parsed as a whole
+        with open(input_path, "r", encoding="utf-8") as file:
+            yield from json.load(file)
+        return
+
+    with _open_text(input_path, "r") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed article record at {input_path}:{line_number}: {e}")
+
+
+def iter_articles(input_path: str) -> Iterator[WikipediaArticle]:
+    """Lazily yield articles from a JSON Lines, archive, indexed or legacy JSON file."""
+    for article_dict in iter_article_dicts(input_path):
+        yield WikipediaArticle(**article_dict)
+
+
+def write_articles(articles: Iterable[WikipediaArticle], output_path: str) -> int:
+    """Stream articles into a JSON Lines file, returning how many were written."""
+    with ArticleWriter(output_path) as writer:
+        return writer.write_many(articles)
@@ -0,0 +1,231 @@
+"""
+Asynchronous Wikipedia Collection Module
+
+This module provides an asyncio-based collection engine that keeps a bounded
+window of batched MediaWiki API requests in flight while drawing from the same
+per-host rate limiter as the synchronous WikipediaCollector, producing the
+same WikipediaArticle objects.
+"""
+
+import asyncio
+import functools
+import logging
+from typing import Dict, List, Optional, Any, Iterable
+
+import aiohttp
+
+from src.collectors.wikipedia_collector import WikipediaCollector, WikipediaArticle
+from src.utils.rate_limiter import RateLimiter, THROTTLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWikipediaCollector:
+    """Asyncio collection engine built on top of a WikipediaCollector."""
+
+    def __init__(
+        self,
+        collector: Optional[WikipediaCollector] = None,
+        config_path: str = "config/wikipedia.yaml",
+        max_in_flight: Optional[int] = None,
+    ):
+        self.collector = collector or WikipediaCollector(config_path)
+        self.config = self.collector.config
+        self.api_config = self.collector.api_config
+        self.max_in_flight = max_in_flight or self.collector.concurrency_config.get(
+            "max_in_flight", 8
+        )
+
+        self.request_count = 0
+
+    @property
+    def collected_articles(self) -> Dict[str, WikipediaArticle]:
+        return self.collector.collected_articles
+
+    @property
+    def failed_articles(self):
+        return self.collector.failed_articles
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session sized to the in-flight window."""
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(total=self.api_config["timeout"])
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={
+                "User-Agent": self.config["user_agent"],
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            },
+        )
+
+    async def _make_api_request(
+        self,
+        session: aiohttp.ClientSession,
+        rate_limiter: RateLimiter,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Make rate-limited API request to Wikipedia."""
+        params = self.collector._with_default_params(params)
+        # aiohttp only accepts str/int/float query values
+        query = {
+            key: (str(value).lower() if isinstance(value, bool) else value)
+            for key, value in self.collector._request_params(params).items()
+        }
+
+        logger.debug(f"Making async API request with params: {params}")
+
+        max_retries = self.api_config["max_retries"]
+        backoff_factor = self.api_config["backoff_factor"]
+
+        for attempt in range(max_retries):
+            await rate_limiter.acquire_async()
+            try:
+                self.request_count += 1
+                async with session.get(self.config["base_url"], params=query) as response:
+                    if response.status in THROTTLE_STATUS_CODES:
+                        self.collector._server_throttled(response.status, response.headers)
+                        logger.warning(
+                            f"Async API request throttled (attempt {attempt + 1}): HTTP {response.status}"
+                        )
+                        continue
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                    if self.collector._server_throttled(response.status, response.headers, data):
+                        logger.warning(f"Async API request hit maxlag (attempt {attempt + 1})")
+                        continue
+                    return data
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Async API request failed (attempt {attempt + 1}): {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(backoff_factor**attempt)
+
+        logger.error(f"All API request attempts failed for params: {params}")
+        return None
+
+    async def _query_with_continuation(
+        self,
+        session: aiohttp.ClientSession,
+        rate_limiter: RateLimiter,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Run a query, following ``continue`` tokens and merging all parts."""
+        merged = self.collector._empty_query_result()
+        continuation: Dict[str, Any] = {}
+
+        while True:
+            response = await self._make_api_request(
+                session, rate_limiter, {**params, **continuation}
+            )
+            if not response or "query" not in response:
+                return None
+
+            self.collector._merge_query_result(merged, response["query"])
+            continuation = response.get("continue")
+            if not continuation:
+                return merged
+
+    async def _fetch_batch(
+        self,
+        session: aiohttp.ClientSession,
+        rate_limiter: RateLimiter,
+        window: asyncio.Semaphore,
+        titles: List[str],
+    ) -> None:
+        """Fetch one batch of articles, holding a slot of the in-flight window."""
+        collector = self.collector
+
+        async with window:
+            logger.info(f"Fetching batch of {len(titles)} articles")
+            result = await self._query_with_continuation(
+                session, rate_limiter, collector._batch_query_params(titles)
+            )
+            if result is None:
+                logger.error(f"Failed to fetch batch starting with: {titles[0]}")
+                collector._record_failures(titles)
+                return
+
+            # Matching, caching, building and journaling the batch write to disk; keep them off the loop
+            loop = asyncio.get_running_loop()
+            matched = await loop.run_in_executor(None, collector._match_batch_pages, titles, result)
+            await loop.run_in_executor(None, collector._cache_batch_pages, matched)
+            include_content = collector.extraction_config.get("include_content", False)
+            articles = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    collector._store_batch_results,
+                    matched, fetch_content=False, record=not include_content,
+                ),
+            )
+
+            if include_content:
+                for article in articles:
+                    response = await self._make_api_request(
+                        session, rate_limiter, collector._content_query_params(article.title)
+                    )
+                    article.content = collector._content_from_response(response) or ""
+                await loop.run_in_executor(
+                    None, lambda: [collector._record_article(a.title, a) for a in articles]
+                )
+
+    async def collect_titles_async(self, titles: Iterable[str]) -> List[WikipediaArticle]:
+        """Collect articles concurrently, returning them in input order."""
+        titles = list(titles)
+        pending = self.collector._pending_titles(titles)
+        # Revalidate cached pages up front; it is one batched prop=info call per 50 titles
+        pending = await asyncio.get_running_loop().run_in_executor(
+            None, self.collector._serve_cached_pages, pending
+        )
+
+        rate_limiter = self.collector.rate_limiter
+        window = asyncio.Semaphore(self.max_in_flight)
+
+        async with self._create_session() as session:
+            batches = self.collector._chunk_titles(pending)
+            results = await asyncio.gather(
+                *(
+                    self._fetch_batch(session, rate_limiter, window, batch)
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to collect batch starting with {batch[0]}: {result}")
+                self.collector._record_failures(batch)
+
+        return self.collector._collected_in_order(titles)
+
+    def collect_titles(self, titles: Iterable[str]) -> List[WikipediaArticle]:
+        """Collect articles concurrently from synchronous code."""
+        return asyncio.run(self.collect_titles_async(titles))
+
+    def collect_sample_articles(self) -> List[WikipediaArticle]:
+        """Collect predefined sample articles."""
+        logger.info("Collecting sample articles (async)")
+        articles = self.collect_titles(self.collector.get_sample_titles())
+        logger.info(f"Collected {len(articles)} sample articles")
+        return articles
+
+    def get_articles_from_category(
+        self, category: str, limit: int = 50
+    ) -> List[WikipediaArticle]:
+        """Get articles from a Wikipedia category."""
+        logger.info(f"Collecting articles from category: {category}")
+        titles = self.collector.get_category_member_titles(category, limit)
+        articles = self.collect_titles(titles)
+        logger.info(f"Collected {len(articles)} articles from category: {category}")
+        return articles
+
+    def collect_articles_by_categories(
+        self, max_per_category: int = 20
+    ) -> List[WikipediaArticle]:
+        """Collect articles from target categories."""
+        logger.info("Collecting articles from target categories (async)")
+        titles = self.collector.crawl_target_categories(max_per_category)
+        articles = self.collect_titles(titles)
+        logger.info(f"Collected {len(articles)} unique articles from categories")
+        return articles
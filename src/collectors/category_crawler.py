@@ -0,0 +1,197 @@
+"""
+Category Crawler Module
+
+This module provides a breadth-first crawler over the Wikipedia category
+graph. Category listings are paged with ``cmcontinue``, subcategories are
+followed up to a configurable depth, each level of the frontier is expanded
+concurrently, and member pages are deduplicated by page id before any
+article is fetched.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Any, Iterable, Tuple
+
+from src.collectors.wikipedia_collector import WikipediaCollector
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_NAMESPACE = 14
+
+
+@dataclass
+class CategoryMember:
+    """A page or subcategory listed in a category."""
+    page_id: int
+    title: str
+    namespace: int = 0
+
+    @property
+    def is_subcategory(self) -> bool:
+        return self.namespace == CATEGORY_NAMESPACE
+
+
+class CategoryCrawler:
+    """Breadth-first crawler that expands categories into unique article titles."""
+
+    def __init__(self, collector: WikipediaCollector,
+                 max_depth: Optional[int] = None, max_workers: Optional[int] = None):
+        self.collector = collector
+        crawl_config = collector.category_crawl_config
+        self.max_depth = max_depth if max_depth is not None else crawl_config.get("max_depth", 1)
+        self.max_workers = max(1, max_workers or crawl_config.get("max_workers", 4))
+        self.page_size = crawl_config.get("page_size", 500)
+        self.lock = threading.Lock()
+        self.stats = {
+            'categories_expanded': 0,
+            'listing_requests': 0,
+            'pages_found': 0,
+            'duplicates_skipped': 0
+        }
+
+    def list_members(self, category: str, limit: Optional[int] = None) -> List[CategoryMember]:
+        """List the pages and subcategories of one category, following ``cmcontinue``.
+
+        With a ``limit``, paging stops once that many pages have been listed;
+        subcategories are always listed in full.
+        """
+        journal = self.collector.journal
+        if journal is not None:
+            journaled = journal.get_category_members(category, limit)
+            if journaled is not None:
+                return self._limit_pages([CategoryMember(**member) for member in journaled], limit)
+
+        members, complete, truncated = self._list(category, "page|subcat", limit)
+        if complete and truncated:
+            # The API lists pages before subcategories, so those may all lie past the cut
+            subcategories, complete, _ = self._list(category, "subcat")
+            listed = {member.title for member in members}
+            members += [member for member in subcategories if member.title not in listed]
+
+        # Only finished listings are journaled, so a resumed crawl never sees a failed one
+        if journal is not None and complete:
+            journal.record_category(
+                category,
+                [m.title for m in members if not m.is_subcategory],
+                members=[m.__dict__ for m in members],
+                limit=limit if truncated else None,
+            )
+        return self._limit_pages(members, limit)
+
+    def _list(self, category: str, member_types: str,
+              limit: Optional[int] = None) -> Tuple[List[CategoryMember], bool, bool]:
+        """Page through one listing of a category.
+
+        Returns the members, whether the listing finished and whether it was
+        cut after ``limit`` pages.
+        """
+        params = {
+            "list": "categorymembers",
+            "cmtitle": category,
+            "cmtype": member_types,
+            "cmnamespace": f"0|{CATEGORY_NAMESPACE}",
+            "cmprop": "ids|title",
+            "cmlimit": self.page_size,
+        }
+
+        members: List[CategoryMember] = []
+        page_count = 0
+        while True:
+            response = self.collector._make_api_request(params)
+            with self.lock:
+                self.stats['listing_requests'] += 1
+            if not response or "query" not in response:
+                logger.error(f"Failed to get category members: {category}")
+                return members, False, False
+
+            for member in response["query"].get("categorymembers", []):
+                if member.get("title"):
+                    members.append(CategoryMember(
+                        page_id=member.get("pageid", 0),
+                        title=member["title"],
+                        namespace=member.get("ns", 0),
+                    ))
+                    page_count += not members[-1].is_subcategory
+
+            continuation = response.get("continue")
+            if not continuation:
+                return members, True, False
+            if limit is not None and page_count >= limit:
+                return members, True, True
+            params = {**params, **continuation}
+
+    @staticmethod
+    def _limit_pages(members: List[CategoryMember], limit: Optional[int]) -> List[CategoryMember]:
+        """Keep subcategories and at most ``limit`` pages, preserving order."""
+        if limit is None:
+            return members
+        limited = []
+        page_count = 0
+        for member in members:
+            if not member.is_subcategory:
+                if page_count >= limit:
+                    continue
+                page_count += 1
+            limited.append(member)
+        return limited
+
+    def crawl(self, categories: Iterable[str],
+              max_per_category: Optional[int] = None) -> List[str]:
+        """Collect unique article titles reachable from the given root categories.
+
+        Each root category contributes at most ``max_per_category`` new pages,
+        counting only pages no other category has already contributed.
+        """
+        roots = list(dict.fromkeys(categories))
+        seen_pages: Set[int] = set()
+        seen_categories: Set[str] = set(roots)
+        quota: Dict[str, int] = {root: 0 for root in roots}
+        titles: List[str] = []
+
+        frontier = [(root, root) for root in roots]
+        depth = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while frontier:
+                include_subcategories = depth < self.max_depth
+                listings = executor.map(
+                    lambda node: self.list_members(node[0], max_per_category), frontier
+                )
+
+                next_frontier = []
+                # Results are consumed in frontier order so the crawl is deterministic
+                for (category, root), members in zip(frontier, listings):
+                    self.stats['categories_expanded'] += 1
+                    for member in members:
+                        if member.is_subcategory:
+                            if include_subcategories and member.title not in seen_categories:
+                                seen_categories.add(member.title)
+                                next_frontier.append((member.title, root))
+                            continue
+
+                        if max_per_category is not None and quota[root] >= max_per_category:
+                            break
+                        if member.page_id in seen_pages:
+                            self.stats['duplicates_skipped'] += 1
+                            continue
+                        seen_pages.add(member.page_id)
+                        quota[root] += 1
+                        titles.append(member.title)
+
+                frontier = [
+                    (category, root) for category, root in next_frontier
+                    if max_per_category is None or quota[root] < max_per_category
+                ]
+                depth += 1
+
+        self.stats['pages_found'] = len(titles)
+        logger.info(
+            f"Category crawl found {len(titles)} unique pages in "
+            f"{self.stats['categories_expanded']} categories "
+            f"({self.stats['duplicates_skipped']} duplicates skipped)"
+        )
+        return titles
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.stats.copy()
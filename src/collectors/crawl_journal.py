@@ -0,0 +1,164 @@
+"""
+Crawl Journal Module
+
+This module provides an append-only JSON Lines journal for long-running
+Wikipedia crawls. Every fetched article, failed title and expanded category
+is appended as it happens and flushed to disk every N records, so an
+interrupted crawl can be resumed without refetching completed work.
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Any
+
+from src.collectors.wikipedia_collector import WikipediaArticle, article_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlJournal:
+    """Append-only journal of fetched articles, failures and category frontiers."""
+
+    def __init__(self, journal_path: str, flush_every: int = 50):
+        self.journal_path = journal_path
+        self.flush_every = max(1, flush_every)
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.failed: Set[str] = set()
+        self.categories: Dict[str, List[str]] = {}
+        self.category_members: Dict[str, List[Dict[str, Any]]] = {}
+        self.category_limits: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.file = None
+        self.unflushed = 0
+
+    def open(self, resume: bool = False) -> "CrawlJournal":
+        """Open the journal, replaying existing records when resuming."""
+        Path(self.journal_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if resume and Path(self.journal_path).exists():
+            self._replay()
+            logger.info(
+                f"Resuming crawl from {self.journal_path}: {len(self.completed)} articles done, "
+                f"{len(self.failed)} failed, {len(self.categories)} categories expanded"
+            )
+            self.file = open(self.journal_path, "a", encoding="utf-8")
+        else:
+            self.file = open(self.journal_path, "w", encoding="utf-8")
+        return self
+
+    def _replay(self) -> None:
+        """Rebuild crawl state from the records already in the journal."""
+        with open(self.journal_path, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last record half-written
+                    logger.warning(f"Skipping truncated journal record at line {line_number}")
+                    continue
+                self._apply(record)
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        record_type = record.get("type")
+        if record_type == "article":
+            self.completed[record["requested"]] = record["article"]
+            self.failed.discard(record["requested"])
+        elif record_type == "failed":
+            if record["title"] not in self.completed:
+                self.failed.add(record["title"])
+        elif record_type == "category":
+            self.categories[record["category"]] = record["titles"]
+            if "members" in record:
+                self.category_members[record["category"]] = record["members"]
+            if record.get("limit") is not None:
+                self.category_limits[record["category"]] = record["limit"]
+            else:
+                self.category_limits.pop(record["category"], None)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self.lock:
+            self._apply(record)
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.unflushed += 1
+            if self.unflushed >= self.flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unflushed = 0
+
+    def record_category(self, category: str, titles: List[str],
+                        members: Optional[List[Dict[str, Any]]] = None,
+                        limit: Optional[int] = None) -> None:
+        """Record the member titles (and optionally full member listing) of a category.
+
+        A ``limit`` marks a listing whose pages were cut after that many.
+        """
+        record = {"type": "category", "category": category, "titles": titles}
+        if members is not None:
+            record["members"] = members
+        if limit is not None:
+            record["limit"] = limit
+        self._append(record)
+
+    def record_article(self, requested_title: str, article: WikipediaArticle) -> None:
+        """Record a fetched article under the title it was requested with."""
+        self._append({
+            "type": "article",
+            "requested": requested_title,
+            "article": article_to_dict(article),
+        })
+
+    def record_failure(self, title: str) -> None:
+        """Record a title that could not be fetched."""
+        self._append({"type": "failed", "title": title})
+
+    def is_completed(self, title: str) -> bool:
+        return title in self.completed
+
+    def _covers(self, category: str, limit: Optional[int]) -> bool:
+        """Check whether the journaled listing of a category holds the first ``limit`` pages."""
+        listed_limit = self.category_limits.get(category)
+        return listed_limit is None or (limit is not None and limit <= listed_limit)
+
+    def get_category_titles(self, category: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """Get the journaled member titles of a category, if it was expanded far enough."""
+        if not self._covers(category, limit):
+            return None
+        return self.categories.get(category)
+
+    def get_category_members(self, category: str,
+                             limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """Get the journaled pages and subcategories of a category, if listed far enough."""
+        if not self._covers(category, limit):
+            return None
+        return self.category_members.get(category)
+
+    def restore_articles(self) -> Dict[str, WikipediaArticle]:
+        """Rebuild the completed articles keyed by requested title."""
+        return {
+            title: WikipediaArticle(**article_dict)
+            for title, article_dict in self.completed.items()
+        }
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.file:
+                self._flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file:
+                self._flush()
+                self.file.close()
+                self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,194 @@
+"""
+Wikipedia Dump Reader Module
+
+This module ingests offline ``pages-articles`` XML dumps (optionally bz2 or
+gzip compressed). Pages are stream-parsed with ``iterparse`` in constant
+memory, handed in chunks to a process pool that runs the collector's wikitext
+parsing, and written straight into the JSON Lines article store.
+"""
+
+import os
+import bz2
+import gzip
+import time
+import logging
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Iterator
+
+from src.collectors.wikipedia_collector import WikipediaArticle, article_url
+from src.collectors.article_store import ArticleWriter
+from src.collectors import wikitext_parser
+
+logger = logging.getLogger(__name__)
+
+
+def _open_dump(dump_path: str):
+    """Open a possibly compressed dump file for binary reading."""
+    if dump_path.endswith(".bz2"):
+        return bz2.open(dump_path, "rb")
+    if dump_path.endswith(".gz"):
+        return gzip.open(dump_path, "rb")
+    return open(dump_path, "rb")
+
+
+def _local_name(tag: str) -> str:
+    """Strip the export schema namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_dump_pages(dump_path: str) -> Iterator[Dict[str, Any]]:
+    """Stream every page of a dump as a plain dictionary."""
+    with _open_dump(dump_path) as file:
+        context = ET.iterparse(file, events=("start", "end"))
+        _, root = next(context)
+
+        for event, element in context:
+            if event != "end" or _local_name(element.tag) != "page":
+                continue
+
+            page = {"redirect": False}
+            for child in element:
+                name = _local_name(child.tag)
+                if name == "title":
+                    page["title"] = child.text or ""
+                elif name == "ns":
+                    page["namespace"] = int(child.text or 0)
+                elif name == "id":
+                    page["page_id"] = int(child.text or 0)
+                elif name == "redirect":
+                    page["redirect"] = True
+                elif name == "revision":
+                    for field in child:
+                        field_name = _local_name(field.tag)
+                        if field_name == "id":
+                            page["revision_id"] = int(field.text or 0)
+                        elif field_name == "timestamp":
+                            page["timestamp"] = field.text
+                        elif field_name == "text":
+                            page["text"] = field.text or ""
+            yield page
+
+            # Drop parsed pages so memory does not grow with the dump
+            element.clear()
+            root.clear()
+
+
+def article_from_dump_page(page: Dict[str, Any], language: str = "vi",
+                           include_content: bool = False) -> WikipediaArticle:
+    """Build a WikipediaArticle from a dump page using the collector's wikitext parsing."""
+    title = page["title"]
+    wikitext = page.get("text", "")
+
+    return WikipediaArticle(
+        title=title,
+        page_id=page.get("page_id", 0),
+        url=article_url(title, language),
+        abstract=wikitext_parser.extract_abstract(wikitext),
+        content=wikitext_parser.clean_wiki_markup(wikitext) if include_content else "",
+        infobox=wikitext_parser.parse_infobox(wikitext),
+        categories=wikitext_parser.extract_categories(wikitext),
+        templates=wikitext_parser.extract_template_names(wikitext),
+        language=language,
+        last_modified=page.get("timestamp"),
+        revision_id=page.get("revision_id"),
+    )
+
+
+def _parse_pages(pages: List[Dict[str, Any]], language: str,
+                 include_content: bool) -> List[WikipediaArticle]:
+    """Worker entry point: parse a chunk of dump pages."""
+    return [article_from_dump_page(page, language, include_content) for page in pages]
+
+
+class DumpReader:
+    """Parallel reader that turns a pages-articles dump into WikipediaArticle records."""
+
+    def __init__(self, dump_path: str, workers: Optional[int] = None,
+                 chunk_size: int = 100, language: str = "vi",
+                 include_content: bool = False):
+        self.dump_path = dump_path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.language = language
+        self.include_content = include_content
+        self.stats = {
+            'pages_read': 0,
+            'articles': 0,
+            'skipped': 0,
+            'elapsed_seconds': 0.0
+        }
+
+    def _iter_article_pages(self, limit: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield chunks of main-namespace, non-redirect pages."""
+        chunk = []
+        selected = 0
+        for page in iter_dump_pages(self.dump_path):
+            self.stats['pages_read'] += 1
+            if page.get("namespace", 0) != 0 or page["redirect"]:
+                self.stats['skipped'] += 1
+                continue
+
+            chunk.append(page)
+            selected += 1
+            if len(chunk) >= self.chunk_size or selected == limit:
+                yield chunk
+                chunk = []
+            if selected == limit:
+                return
+        if chunk:
+            yield chunk
+
+    def iter_articles(self, limit: Optional[int] = None) -> Iterator[WikipediaArticle]:
+        """Yield parsed articles in dump order."""
+        start = time.perf_counter()
+        chunks = self._iter_article_pages(limit)
+
+        try:
+            if self.workers == 1:
+                for chunk in chunks:
+                    for article in _parse_pages(chunk, self.language, self.include_content):
+                        self.stats['articles'] += 1
+                        yield article
+                return
+
+            workers = self.workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Keep a bounded number of chunks in flight so memory stays constant
+                max_pending = workers * 2
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(
+                        _parse_pages, chunk, self.language, self.include_content
+                    ))
+                    if len(pending) >= max_pending:
+                        for article in pending.popleft().result():
+                            self.stats['articles'] += 1
+                            yield article
+
+                while pending:
+                    for article in pending.popleft().result():
+                        self.stats['articles'] += 1
+                        yield article
+        finally:
+            self.stats['elapsed_seconds'] = time.perf_counter() - start
+
+    def write_to_store(self, output_path: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Parse the dump into a JSON Lines article file and return ingestion statistics."""
+        logger.info(f"Ingesting dump {self.dump_path} into {output_path}")
+        with ArticleWriter(output_path) as writer:
+            writer.write_many(self.iter_articles(limit))
+
+        stats = self.get_statistics()
+        logger.info(
+            f"Ingested {stats['articles']} articles from {stats['pages_read']} pages "
+            f"({stats['pages_per_second']:.1f} pages/s)"
+        )
+        return stats
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        elapsed = stats['elapsed_seconds']
+        stats['pages_per_second'] = stats['pages_read'] / elapsed if elapsed else 0.0
+        return stats
@@ -0,0 +1,365 @@
+"""
+Indexed Article Store Module
+
+This module provides a memory-mapped article store with constant-time
+lookup by title or page id. The file holds the JSON records back to back,
+a titles column, fixed-width ``page_id``/``revision_id``/offset columns and
+two open-addressing hash tables, all little-endian and 8-byte aligned.
+Opening a store maps the file and reads the footer only; lookups and column
+scans are served straight from the mapping, so several processes reading the
+same store share one copy of its pages in the OS page cache.
+
+Layout of a store file::
+
+    MAGIC | records | titles | record offsets | title offsets | page ids |
+    revision ids | title table | page id table | footer
+
+A store is written to a temporary file and moved into place only once it is
+complete, so an interrupted build never leaves a store that looks valid.
+"""
+
+import os
+import sys
+import mmap
+import json
+import struct
+import hashlib
+import logging
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+from src.collectors.wikipedia_collector import WikipediaArticle
+
+logger = logging.getLogger(__name__)
+
+INDEXED_SUFFIX = ".aix"
+MAGIC = b"VDBAIX2\n"
+# count, table size, the offsets of the eight sections after the records, then the size and
+# mtime (ns) of the file the store was indexed from, both zero for stores written directly
+FOOTER = struct.Struct("<QQ8QQq8s")
+
+_EMPTY = 0
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def is_indexed_path(path: str) -> bool:
+    """Check whether a path uses the indexed article store format."""
+    return str(path).endswith(INDEXED_SUFFIX)
+
+
+def _title_hash(title: bytes) -> int:
+    # Python's hash() is salted per process, so lookups need a stable hash
+    return int.from_bytes(hashlib.blake2b(title, digest_size=8).digest(), "little")
+
+
+def _page_id_hash(page_id: int) -> int:
+    return ((page_id & _MASK64) * _FIBONACCI) & _MASK64
+
+
+def _table_size(count: int) -> int:
+    """Power-of-two slot count that keeps the load factor at or below one half."""
+    size = 8
+    while size < count * 2:
+        size *= 2
+    return size
+
+
+def _build_table(hashes: List[int], size: int) -> array:
+    """Open-addressing table of record numbers plus one (zero marks an empty slot)."""
+    table = array("Q", bytes(8 * size))
+    mask = size - 1
+    for record, key_hash in enumerate(hashes):
+        slot = key_hash & mask
+        while table[slot] != _EMPTY:
+            slot = (slot + 1) & mask
+        table[slot] = record + 1
+    return table
+
+
+def _little_endian(column: array) -> bytes:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class IndexedStoreWriter:
+    """Writer of an indexed article store.
+
+    Records are streamed to a temporary file as they arrive; the columns and
+    hash tables are written when the store is closed, and only then does the
+    store replace ``output_path``. Leaving the ``with`` block on an exception
+    discards the partial store. ``source`` is the ``(size, mtime_ns)`` of the
+    file being indexed, recorded so stale indexes can be detected.
+    """
+
+    def __init__(self, output_path: str, source: Optional[Tuple[int, int]] = None):
+        self.output_path = output_path
+        self.source = source or (0, 0)
+        self.count = 0
+        self.titles: List[bytes] = []
+        self.page_ids = array("q")
+        self.revision_ids = array("q")
+        self.record_offsets = array("Q")
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        self.temp_path = f"{output_path}.tmp-{os.getpid()}"
+        self.file = open(self.temp_path, "wb")
+        self.file.write(MAGIC)
+        self.offset = len(MAGIC)
+
+    def write_dict(self, article_dict: Dict[str, Any]) -> None:
+        """Write a single article in dictionary form."""
+        record = json.dumps(article_dict, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.record_offsets.append(self.offset)
+        self.titles.append(str(article_dict.get("title", "")).encode("utf-8"))
+        self.page_ids.append(article_dict.get("page_id") or 0)
+        self.revision_ids.append(article_dict.get("revision_id") or 0)
+        self.file.write(record)
+        self.offset += len(record)
+        self.count += 1
+
+    def _write_section(self, data: bytes) -> int:
+        """Write an 8-byte aligned section, returning its offset."""
+        padding = -self.offset % 8
+        self.file.write(b"\0" * padding)
+        self.offset += padding
+        start = self.offset
+        self.file.write(data)
+        self.offset += len(data)
+        return start
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.record_offsets.append(self.offset)
+
+        title_offsets = array("Q", [0])
+        for title in self.titles:
+            title_offsets.append(title_offsets[-1] + len(title))
+        size = _table_size(self.count)
+
+        sections = [
+            self._write_section(b"".join(self.titles)),
+            self._write_section(_little_endian(self.record_offsets)),
+            self._write_section(_little_endian(title_offsets)),
+            self._write_section(_little_endian(self.page_ids)),
+            self._write_section(_little_endian(self.revision_ids)),
+            self._write_section(_little_endian(
+                _build_table([_title_hash(title) for title in self.titles], size)
+            )),
+            self._write_section(_little_endian(
+                _build_table([_page_id_hash(page_id) for page_id in self.page_ids], size)
+            )),
+        ]
+        sections.append(self.offset)
+        self.file.write(FOOTER.pack(self.count, size, *sections, *self.source, MAGIC))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+        os.replace(self.temp_path, self.output_path)
+        logger.info(f"Indexed {self.count} articles in {self.output_path}")
+
+    def abort(self) -> None:
+        """Discard the partial store, leaving ``output_path`` as it was."""
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        Path(self.temp_path).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class IndexedArticleStore:
+    """Read-only, memory-mapped view of an indexed article store."""
+
+    def __init__(self, store_path: str):
+        if sys.byteorder != "little":
+            raise ValueError("Indexed article stores are only readable on little-endian machines")
+        self.store_path = store_path
+        with open(store_path, "rb") as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mapping)
+
+        footer = FOOTER.unpack(self.view[-FOOTER.size:]) \
+            if len(self.view) >= len(MAGIC) + FOOTER.size else None
+        if footer is None or bytes(self.view[:len(MAGIC)]) != MAGIC or footer[-1] != MAGIC:
+            self.close()
+            raise ValueError(f"{store_path} is not an indexed article store")
+        self.count, self.table_size = footer[0], footer[1]
+        (titles, record_offsets, title_offsets, page_ids, revision_ids,
+         title_table, page_table, end) = footer[2:10]
+        # Size and mtime of the file this store was indexed from
+        self.source = tuple(footer[10:12])
+
+        def column(start: int, items: int, typecode: str) -> memoryview:
+            return self.view[start:start + 8 * items].cast(typecode)
+
+        self.titles_blob = self.view[titles:record_offsets]
+        self.record_offsets = column(record_offsets, self.count + 1, "Q")
+        self.title_offsets = column(title_offsets, self.count + 1, "Q")
+        self.page_ids = column(page_ids, self.count, "q")
+        self.revision_ids = column(revision_ids, self.count, "q")
+        self.title_table = column(title_table, self.table_size, "Q")
+        self.page_table = column(page_table, self.table_size, "Q")
+        self.stats = {
+            'lookups': 0,
+            'misses': 0,
+            'probes': 0
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, position: int) -> memoryview:
+        """Get the raw JSON record at ``position`` without copying it."""
+        return self.view[self.record_offsets[position]:self.record_offsets[position + 1]]
+
+    def title(self, position: int) -> str:
+        return bytes(self.titles_blob[self.title_offsets[position]:self.title_offsets[position + 1]]).decode("utf-8")
+
+    def __getitem__(self, position: int) -> Dict[str, Any]:
+        """Decode the article dictionary at ``position``."""
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        return json.loads(bytes(self.record(position)))
+
+    def _find(self, table: memoryview, key_hash: int, matches) -> Optional[int]:
+        self.stats['lookups'] += 1
+        mask = self.table_size - 1
+        slot = key_hash & mask
+        while True:
+            self.stats['probes'] += 1
+            entry = table[slot]
+            if entry == _EMPTY:
+                self.stats['misses'] += 1
+                return None
+            if matches(entry - 1):
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def position_of(self, title: str) -> Optional[int]:
+        """Get the record number of a title."""
+        encoded = title.encode("utf-8")
+        offsets = self.title_offsets
+        blob = self.titles_blob
+        return self._find(
+            self.title_table, _title_hash(encoded),
+            lambda position: blob[offsets[position]:offsets[position + 1]] == encoded,
+        )
+
+    def position_of_page_id(self, page_id: int) -> Optional[int]:
+        """Get the record number of a page id."""
+        page_ids = self.page_ids
+        return self._find(
+            self.page_table, _page_id_hash(page_id),
+            lambda position: page_ids[position] == page_id,
+        )
+
+    def get(self, title: str) -> Optional[Dict[str, Any]]:
+        """Get an article dictionary by title."""
+        position = self.position_of(title)
+        return None if position is None else self[position]
+
+    def get_by_page_id(self, page_id: int) -> Optional[Dict[str, Any]]:
+        """Get an article dictionary by page id."""
+        position = self.position_of_page_id(page_id)
+        return None if position is None else self[position]
+
+    def get_article(self, title: str) -> Optional[WikipediaArticle]:
+        """Get an article by title."""
+        article_dict = self.get(title)
+        return None if article_dict is None else WikipediaArticle(**article_dict)
+
+    def __contains__(self, title: str) -> bool:
+        return self.position_of(title) is not None
+
+    def iter_records(self) -> Iterator[memoryview]:
+        """Yield the raw JSON records in order, as views into the mapping."""
+        view = self.view
+        offsets = self.record_offsets
+        for position in range(self.count):
+            yield view[offsets[position]:offsets[position + 1]]
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield every article dictionary in order."""
+        for record in self.iter_records():
+            yield json.loads(bytes(record))
+
+    def iter_articles(self) -> Iterator[WikipediaArticle]:
+        for article_dict in self.iter_dicts():
+            yield WikipediaArticle(**article_dict)
+
+    def titles(self) -> List[str]:
+        return [self.title(position) for position in range(self.count)]
+
+    def close(self) -> None:
+        # Views into the mapping must be released before it can be closed
+        for name in ("titles_blob", "record_offsets", "title_offsets", "page_ids",
+                     "revision_ids", "title_table", "page_table", "view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        stats['articles'] = self.count
+        stats['bytes'] = len(self.mapping)
+        stats['probes_per_lookup'] = stats['probes'] / stats['lookups'] if stats['lookups'] else 0.0
+        return stats
+
+
+def iter_indexed_dicts(store_path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield article dictionaries from an indexed store."""
+    with IndexedArticleStore(store_path) as store:
+        yield from store.iter_dicts()
+
+
+def open_article_index(input_path: str) -> IndexedArticleStore:
+    """Open ``input_path`` as an indexed store, indexing other article files first.
+
+    The index of a JSON, JSON Lines or archive file is kept next to it as
+    ``<input_path>.aix``. It records the size and mtime of the source file and
+    is rebuilt whenever they no longer match.
+    """
+    from src.collectors.article_store import iter_article_dicts
+
+    if is_indexed_path(input_path):
+        return IndexedArticleStore(input_path)
+
+    index_path = f"{input_path}{INDEXED_SUFFIX}"
+    stat = os.stat(input_path)
+    source = (stat.st_size, stat.st_mtime_ns)
+    if Path(index_path).exists():
+        try:
+            store = IndexedArticleStore(index_path)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Rebuilding unreadable index {index_path}: {e}")
+        else:
+            if store.source == source:
+                return store
+            store.close()
+
+    logger.info(f"Indexing {input_path} into {index_path}")
+    with IndexedStoreWriter(index_path, source=source) as writer:
+        for article_dict in iter_article_dicts(input_path):
+            writer.write_dict(article_dict)
+    return IndexedArticleStore(index_path)
@@ -0,0 +1,291 @@
+"""
+Pipelined Wikipedia Collection Module
+
+This module provides a producer/consumer collection engine. Fetch threads
+issue the batched MediaWiki queries (I/O bound) and push raw page payloads
+into a bounded queue; a process pool turns them into WikipediaArticle
+objects (CPU bound wikitext parsing) without contending for the GIL. When
+parsing falls behind, the queue fills up and fetchers block, so memory stays
+bounded. Each stage reports its own throughput.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+from src.collectors.wikipedia_collector import (
+    WikipediaCollector, WikipediaArticle, article_from_page
+)
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of one fetch worker's output
+_DONE = object()
+
+
+ParsedPages = Tuple[List[Tuple[str, WikipediaArticle]], float]
+
+
+def _parse_pages(pages: List[Tuple[str, Dict[str, Any]]], language: str = "vi") -> ParsedPages:
+    """Worker entry point: parse fetched pages, returning articles and the time taken."""
+    start = time.perf_counter()
+    articles = [(title, article_from_page(page_data, language)) for title, page_data in pages]
+    return articles, time.perf_counter() - start
+
+
+class _FetchPayload:
+    """Raw pages of one fetched batch, waiting to be parsed."""
+
+    __slots__ = ("pages", "contents")
+
+    def __init__(self, pages: List[Tuple[str, Dict[str, Any]]], contents: Dict[str, str]):
+        self.pages = pages
+        self.contents = contents
+
+
+class PipelineCollector:
+    """Fetch/parse pipeline built on top of a WikipediaCollector."""
+
+    def __init__(
+        self,
+        collector: Optional[WikipediaCollector] = None,
+        config_path: str = "config/wikipedia.yaml",
+        fetch_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.collector = collector or WikipediaCollector(config_path)
+        pipeline_config = self.collector.concurrency_config.get("pipeline", {})
+        self.fetch_workers = max(1, fetch_workers or pipeline_config.get("fetch_workers", 4))
+        self.parse_workers = max(
+            1, parse_workers or pipeline_config.get("parse_workers") or os.cpu_count() or 1
+        )
+        self.queue_size = max(1, queue_size or pipeline_config.get("queue_size", 16))
+
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            'fetched_batches': 0,
+            'fetched_pages': 0,
+            'fetch_seconds': 0.0,
+            'fetch_blocked_seconds': 0.0,
+            'max_queue_depth': 0,
+            'parsed_pages': 0,
+            'parse_seconds': 0.0,
+            'elapsed_seconds': 0.0
+        }
+
+    @property
+    def collected_articles(self) -> Dict[str, WikipediaArticle]:
+        return self.collector.collected_articles
+
+    @property
+    def failed_articles(self):
+        return self.collector.failed_articles
+
+    def _count(self, **increments: float) -> None:
+        with self.stats_lock:
+            for key, value in increments.items():
+                self.stats[key] += value
+
+    def _fetch_batch(self, titles: List[str]) -> Optional[_FetchPayload]:
+        """Fetch one batch and split it into found pages and failures."""
+        collector = self.collector
+        logger.info(f"Fetching batch of {len(titles)} articles")
+        result = collector._query_with_continuation(
+            collector._batch_query_params(titles), use_cache=False
+        )
+        if result is None:
+            logger.error(f"Failed to fetch batch starting with: {titles[0]}")
+            collector._record_failures(titles)
+            return None
+        matched = collector._match_batch_pages(titles, result)
+        collector._cache_batch_pages(matched)
+
+        pages = []
+        for title, page_data in matched.items():
+            if page_data is None or "missing" in page_data or "invalid" in page_data:
+                logger.warning(f"Article not found: {title}")
+                collector._record_failures([title])
+                continue
+            pages.append((title, page_data))
+        collector._store_wikitext(page_data for _, page_data in pages)
+
+        # Full text is another request per article, so it belongs to the I/O stage
+        contents = {}
+        if collector.extraction_config.get("include_content", False):
+            for title, page_data in pages:
+                contents[title] = collector._get_article_content(page_data.get("title", title)) or ""
+        return _FetchPayload(pages, contents)
+
+    def _fetch_worker(self, batches: "queue.Queue", fetched: "queue.Queue",
+                      stop: threading.Event) -> None:
+        """Fetch batches until none are left, blocking while the parse queue is full."""
+        try:
+            while not stop.is_set():
+                try:
+                    titles = batches.get_nowait()
+                except queue.Empty:
+                    return
+
+                start = time.perf_counter()
+                try:
+                    payload = self._fetch_batch(titles)
+                except Exception as e:
+                    logger.error(f"Failed to fetch batch starting with {titles[0]}: {e}")
+                    self.collector._record_failures(titles)
+                    payload = None
+                self._count(fetch_seconds=time.perf_counter() - start, fetched_batches=1)
+                if payload is None:
+                    continue
+
+                self._count(fetched_pages=len(payload.pages))
+                self._put(fetched, payload, stop)
+        finally:
+            self._put(fetched, _DONE, stop)
+
+    def _put(self, fetched: "queue.Queue", item: Any, stop: threading.Event) -> None:
+        """Put an item on the bounded queue, recording how long backpressure held us."""
+        start = time.perf_counter()
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self._count(fetch_blocked_seconds=time.perf_counter() - start)
+        with self.stats_lock:
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], fetched.qsize())
+
+    def _store_parsed(self, payload: _FetchPayload, parsed: ParsedPages) -> None:
+        """Record parsed articles as collected."""
+        articles, seconds = parsed
+        self._count(parsed_pages=len(articles), parse_seconds=seconds)
+        for title, article in articles:
+            if title in payload.contents:
+                article.content = payload.contents[title]
+            self.collected_articles[article.title] = article
+            self.collector._record_article(title, article)
+            logger.info(f"Successfully collected article: {title}")
+
+    def collect_titles(self, titles: Iterable[str]) -> List[WikipediaArticle]:
+        """Collect articles through the fetch/parse pipeline, returning them in input order."""
+        titles = list(titles)
+        pending = self.collector._serve_cached_pages(self.collector._pending_titles(titles))
+
+        start = time.perf_counter()
+        try:
+            self._run(self.collector._chunk_titles(pending))
+        finally:
+            self.stats['elapsed_seconds'] += time.perf_counter() - start
+
+        return self.collector._collected_in_order(titles)
+
+    def _run(self, batches: List[List[str]]) -> None:
+        if not batches:
+            return
+
+        batch_queue: "queue.Queue" = queue.Queue()
+        for batch in batches:
+            batch_queue.put(batch)
+        fetched: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        workers = [
+            threading.Thread(
+                target=self._fetch_worker, args=(batch_queue, fetched, stop),
+                name=f"pipeline-fetch-{index}", daemon=True,
+            )
+            for index in range(min(self.fetch_workers, len(batches)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            if self.parse_workers == 1:
+                self._consume(fetched, len(workers), None)
+            else:
+                with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+                    self._consume(fetched, len(workers), executor)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    def _consume(self, fetched: "queue.Queue", producers: int,
+                 executor: Optional[ProcessPoolExecutor]) -> None:
+        """Hand fetched payloads to the parsers, keeping a bounded number in flight."""
+        # Stop taking from the queue while parsers are busy, so fetchers feel backpressure
+        max_pending = self.parse_workers * 2
+        pending: "deque[Tuple[_FetchPayload, Future]]" = deque()
+
+        while producers:
+            payload = fetched.get()
+            if payload is _DONE:
+                producers -= 1
+                continue
+
+            if executor is None:
+                self._store_parsed(payload, _parse_pages(payload.pages, self.collector.language))
+                continue
+
+            pending.append((payload, executor.submit(_parse_pages, payload.pages, self.collector.language)))
+            if len(pending) >= max_pending:
+                done_payload, future = pending.popleft()
+                self._store_parsed(done_payload, future.result())
+
+        while pending:
+            done_payload, future = pending.popleft()
+            self._store_parsed(done_payload, future.result())
+
+    def collect_sample_articles(self) -> List[WikipediaArticle]:
+        """Collect predefined sample articles."""
+        logger.info("Collecting sample articles (pipeline)")
+        articles = self.collect_titles(self.collector.get_sample_titles())
+        logger.info(f"Collected {len(articles)} sample articles")
+        return articles
+
+    def get_articles_from_category(
+        self, category: str, limit: int = 50
+    ) -> List[WikipediaArticle]:
+        """Get articles from a Wikipedia category."""
+        logger.info(f"Collecting articles from category: {category}")
+        titles = self.collector.get_category_member_titles(category, limit)
+        articles = self.collect_titles(titles)
+        logger.info(f"Collected {len(articles)} articles from category: {category}")
+        return articles
+
+    def collect_articles_by_categories(
+        self, max_per_category: int = 20
+    ) -> List[WikipediaArticle]:
+        """Collect articles from target categories."""
+        logger.info("Collecting articles from target categories (pipeline)")
+        titles = self.collector.crawl_target_categories(max_per_category)
+        articles = self.collect_titles(titles)
+        logger.info(f"Collected {len(articles)} unique articles from categories")
+        return articles
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-stage throughput of the pipeline.
+
+        Stage rates are pages per second of stage time scaled by the stage's
+        worker count, i.e. what the stage can sustain when it is never idle;
+        ``pages_per_second`` is the end-to-end rate.
+        """
+        with self.stats_lock:
+            stats = self.stats.copy()
+        elapsed = stats['elapsed_seconds']
+        stats['fetch_pages_per_second'] = (
+            stats['fetched_pages'] / stats['fetch_seconds'] * self.fetch_workers
+            if stats['fetch_seconds'] else 0.0
+        )
+        stats['parse_pages_per_second'] = (
+            stats['parsed_pages'] / stats['parse_seconds'] * self.parse_workers
+            if stats['parse_seconds'] else 0.0
+        )
+        stats['pages_per_second'] = stats['parsed_pages'] / elapsed if elapsed else 0.0
+        return stats
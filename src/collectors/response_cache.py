@@ -0,0 +1,261 @@
+"""
+MediaWiki Response Cache Module
+
+This module provides a persistent, revision-aware on-disk cache for MediaWiki
+API responses. Generic responses are keyed by their normalized request
+parameters, while article pages are stored individually together with their
+revision id so they can be revalidated cheaply with a batched ``prop=info``
+query instead of being refetched in full.
+"""
+
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """SQLite-backed cache for API responses and article pages with LRU eviction."""
+
+    def __init__(self, cache_path: str = "data/cache/wikipedia_cache.sqlite",
+                 max_size_bytes: int = 512 * 1024 * 1024,
+                 ttl_seconds: Optional[float] = 86400):
+        self.cache_path = cache_path
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'page_hits': 0,
+            'page_misses': 0,
+            'revalidated': 0,
+            'stale': 0,
+            'stores': 0,
+            'evictions': 0
+        }
+
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(cache_path, check_same_thread=False)
+        self._create_tables()
+        self.total_size = self._compute_total_size()
+        logger.info(f"Response cache opened at {cache_path}")
+
+    def _create_tables(self) -> None:
+        """Create cache tables if they do not exist yet."""
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    title TEXT PRIMARY KEY,
+                    page_id INTEGER,
+                    revision_id INTEGER,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+
+    def _compute_total_size(self) -> int:
+        row = self.connection.execute("""
+            SELECT (SELECT COALESCE(SUM(size), 0) FROM responses)
+                 + (SELECT COALESCE(SUM(size), 0) FROM pages)
+        """).fetchone()
+        return row[0]
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Build a cache key from request parameters, independent of their order."""
+        normalized = {}
+        for key, value in params.items():
+            if isinstance(value, bool):
+                value = "1" if value else ""
+            normalized[str(key)] = str(value)
+        encoded = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    @staticmethod
+    def _decode(body: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(body).decode("utf-8"))
+
+    # Generic responses
+
+    def get_response(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a cached response for the given request parameters."""
+        key = self.make_key(params)
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (
+                self.ttl_seconds is not None and time.time() - row[1] > self.ttl_seconds
+            ):
+                self.stats['misses'] += 1
+                return None
+
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+            self.stats['hits'] += 1
+        return self._decode(row[0])
+
+    def put_response(self, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response for the given request parameters."""
+        key = self.make_key(params)
+        body = self._encode(response)
+        now = time.time()
+        with self.lock:
+            with self.connection:
+                self._remove_row("responses", "key", key)
+                self.connection.execute(
+                    "INSERT INTO responses (key, body, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, body, len(body), now, now),
+                )
+            self.total_size += len(body)
+            self.stats['stores'] += 1
+            self._evict_if_needed()
+
+    # Article pages
+
+    def get_page(self, title: str) -> Optional[Dict[str, Any]]:
+        """Get the cached page payload stored under a requested title."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body FROM pages WHERE title = ?", (title,)
+            ).fetchone()
+            if row is None:
+                self.stats['page_misses'] += 1
+                return None
+
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE pages SET accessed = ? WHERE title = ?", (time.time(), title)
+                )
+            self.stats['page_hits'] += 1
+        return self._decode(row[0])
+
+    def get_page_revisions(self, titles: Iterable[str]) -> Dict[str, int]:
+        """Get the cached revision id for each of the given titles that is cached."""
+        titles = list(titles)
+        revisions = {}
+        with self.lock:
+            for i in range(0, len(titles), 500):
+                chunk = titles[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT title, revision_id FROM pages WHERE title IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                revisions.update({title: revision_id for title, revision_id in rows})
+        return revisions
+
+    def put_page(self, title: str, page_data: Dict[str, Any]) -> None:
+        """Store a page payload under the title it was requested with."""
+        revisions = page_data.get("revisions") or [{}]
+        body = self._encode(page_data)
+        with self.lock:
+            with self.connection:
+                self._remove_row("pages", "title", title)
+                self.connection.execute(
+                    """INSERT INTO pages (title, page_id, revision_id, last_modified, body, size, accessed)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (title, page_data.get("pageid"), revisions[0].get("revid"),
+                     revisions[0].get("timestamp"), body, len(body), time.time()),
+                )
+            self.total_size += len(body)
+            self.stats['stores'] += 1
+            self._evict_if_needed()
+
+    def record_revalidation(self, current: int, stale: int, uncached: int = 0) -> None:
+        """Record the outcome of a revalidation round."""
+        with self.lock:
+            self.stats['revalidated'] += current
+            self.stats['stale'] += stale
+            self.stats['page_misses'] += uncached
+
+    def invalidate_pages(self, titles: Iterable[str]) -> None:
+        """Drop cached pages that are known to be out of date."""
+        with self.lock:
+            with self.connection:
+                for title in titles:
+                    self._remove_row("pages", "title", title)
+
+    def _remove_row(self, table: str, column: str, key: str) -> None:
+        row = self.connection.execute(
+            f"SELECT size FROM {table} WHERE {column} = ?", (key,)
+        ).fetchone()
+        if row:
+            self.connection.execute(f"DELETE FROM {table} WHERE {column} = ?", (key,))
+            self.total_size -= row[0]
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used entries until the cache fits its size budget."""
+        if self.total_size <= self.max_size_bytes:
+            return
+
+        # Evict down to 90% of the budget so that eviction does not run on every insert
+        target = int(self.max_size_bytes * 0.9)
+        rows = self.connection.execute("""
+            SELECT 'responses', key, size, accessed FROM responses
+            UNION ALL
+            SELECT 'pages', title, size, accessed FROM pages
+            ORDER BY accessed ASC
+        """).fetchall()
+
+        with self.connection:
+            for table, key, size, _ in rows:
+                if self.total_size <= target:
+                    break
+                column = "key" if table == "responses" else "title"
+                self.connection.execute(f"DELETE FROM {table} WHERE {column} = ?", (key,))
+                self.total_size -= size
+                self.stats['evictions'] += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self.lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM responses")
+                self.connection.execute("DELETE FROM pages")
+            self.total_size = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters and size information."""
+        with self.lock:
+            stats = self.stats.copy()
+            stats['cached_responses'] = self.connection.execute(
+                "SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats['cached_pages'] = self.connection.execute(
+                "SELECT COUNT(*) FROM pages").fetchone()[0]
+        stats['size_bytes'] = self.total_size
+        lookups = stats['hits'] + stats['misses'] + stats['page_hits'] + stats['page_misses']
+        stats['hit_rate'] = (
+            (stats['hits'] + stats['page_hits']) / lookups * 100 if lookups else 0.0
+        )
+        return stats
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,144 @@
+"""
+Title Alias Module
+
+This module maps the titles articles are requested under (underscored
+titles from the config, lower-case first letters, redirects) to the
+canonical page title and page id reported by MediaWiki. The table is filled
+from the ``normalized`` and ``redirects`` parts of API responses, persisted
+in SQLite so later runs and the entity linker can reuse it, and consulted
+before every fetch so a page is downloaded once however it is named.
+"""
+
+import re
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"[\s_]+")
+
+
+def normalize_title(title: str) -> str:
+    """Apply MediaWiki's own title normalization.
+
+    Underscores and runs of whitespace become single spaces and the first
+    letter is upper-cased, as on wikis with ``$wgCapitalLinks`` (all
+    Wikipedias). Section fragments are dropped.
+    """
+    title = _WHITESPACE.sub(" ", title.split("#", 1)[0]).strip()
+    return title[:1].upper() + title[1:]
+
+
+class TitleAliasTable:
+    """Persistent alias -> (canonical title, page id) table.
+
+    Entries are held in memory and written through to SQLite when a path is
+    given, so lookups cost a dictionary access.
+    """
+
+    def __init__(self, table_path: Optional[str] = None):
+        self.table_path = table_path
+        self.lock = threading.Lock()
+        self.aliases: Dict[str, Tuple[str, Optional[int]]] = {}
+        self.stats = {
+            'lookups': 0,
+            'resolved': 0,
+            'recorded': 0
+        }
+
+        self.connection = None
+        if table_path:
+            Path(table_path).parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(table_path, check_same_thread=False)
+            with self.connection:
+                self.connection.execute("""
+                    CREATE TABLE IF NOT EXISTS aliases (
+                        alias TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        page_id INTEGER
+                    )
+                """)
+            for alias, title, page_id in self.connection.execute(
+                "SELECT alias, title, page_id FROM aliases"
+            ):
+                self.aliases[alias] = (title, page_id)
+            logger.info(f"Loaded {len(self.aliases)} title aliases from {table_path}")
+
+    def lookup(self, title: str) -> Optional[Tuple[str, Optional[int]]]:
+        """Get the canonical title and page id of a known alias."""
+        with self.lock:
+            self.stats['lookups'] += 1
+            entry = self.aliases.get(normalize_title(title))
+            if entry is not None:
+                self.stats['resolved'] += 1
+            return entry
+
+    def resolve(self, title: str) -> str:
+        """Get the canonical title of ``title``, or its normalized form if unknown."""
+        entry = self.lookup(title)
+        return entry[0] if entry else normalize_title(title)
+
+    def add_many(self, entries: Iterable[Tuple[str, str, Optional[int]]]) -> None:
+        """Record ``(alias, canonical title, page id)`` entries."""
+        rows = []
+        with self.lock:
+            for alias, title, page_id in entries:
+                alias = normalize_title(alias)
+                if self.aliases.get(alias) == (title, page_id):
+                    continue
+                self.aliases[alias] = (title, page_id)
+                rows.append((alias, title, page_id))
+            self.stats['recorded'] += len(rows)
+            if rows and self.connection is not None:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO aliases (alias, title, page_id) VALUES (?, ?, ?)",
+                        rows,
+                    )
+
+    def add(self, alias: str, title: str, page_id: Optional[int] = None) -> None:
+        """Record that ``alias`` names the page ``title``."""
+        self.add_many([(alias, title, page_id)])
+
+    def record_query(self, matched: Dict[str, Optional[Dict[str, Any]]],
+                     result: Dict[str, Any]) -> None:
+        """Record the aliases learnt from a query.
+
+        ``matched`` maps requested titles to their page entries; the
+        ``normalized`` and ``redirects`` hops of ``result`` are recorded too,
+        so intermediate names resolve without another request.
+        """
+        entries: List[Tuple[str, str, Optional[int]]] = []
+        pages_by_title = {
+            page_data.get("title"): page_data for page_data in result.get("pages", {}).values()
+        }
+        for requested, page_data in matched.items():
+            if page_data is None or "missing" in page_data or "invalid" in page_data:
+                continue
+            title = page_data.get("title", requested)
+            entries.append((requested, title, page_data.get("pageid")))
+            entries.append((title, title, page_data.get("pageid")))
+        for item in result.get("redirects", []):
+            page_data = pages_by_title.get(item["to"])
+            if page_data is not None and "missing" not in page_data:
+                entries.append((item["from"], item["to"], page_data.get("pageid")))
+        self.add_many(entries)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.aliases)
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = self.stats.copy()
+            stats['aliases'] = len(self.aliases)
+        return stats
@@ -6,84 +6,277 @@ for Vietnamese articles with advanced rate limiting and error handling.
 """
 
 import requests
+import sys
 import time
+import zlib
 import json
 import yaml
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import (
+    Dict, List, Optional, Set, Tuple, Any, Callable, Iterable, Union, TYPE_CHECKING
+)
 from pathlib import Path
 from urllib.parse import quote, unquote
 from bs4 import BeautifulSoup
 import re
-from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import threading
+
+from src.collectors.response_cache import ResponseCache
+from src.collectors.wikitext_store import WikitextStore
+from src.collectors.title_aliases import TitleAliasTable
+from src.collectors import wikitext_parser
+from src.utils.http_transport import create_session, get_transport_statistics
+from src.utils.rate_limiter import (
+    RateLimiter, THROTTLE_STATUS_CODES, get_rate_limiter, parse_retry_after
+)
+
+if TYPE_CHECKING:
+    from src.collectors.crawl_journal import CrawlJournal
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of titles the MediaWiki API accepts in one query
+MAX_TITLES_PER_QUERY = 50
+
+
+# Text fields longer than this are kept zlib-compressed and decoded on access
+COMPRESS_TEXT_THRESHOLD = 1024
+
+# Lazily loaded text: a plain string, compressed UTF-8 bytes or a loader callable
+LazyText = Union[str, bytes, Callable[[], str]]
+
+
+def _pack_text(text: LazyText) -> LazyText:
+    """Store long strings compressed; bytes and loaders are kept as they are."""
+    if isinstance(text, str) and len(text) > COMPRESS_TEXT_THRESHOLD:
+        return zlib.compress(text.encode("utf-8"), 1)
+    return text
+
+
+def _unpack_text(value: LazyText) -> str:
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    if callable(value):
+        return value() or ""
+    return value
+
+
+def _intern_names(names: Iterable[str]) -> Tuple[str, ...]:
+    """Share one copy of each category/template name across all articles."""
+    return tuple(sys.intern(name) for name in names)
+
+
+def _intern_infobox(infobox: Dict[str, Any]) -> Dict[str, Any]:
+    """Share infobox keys and template types, which repeat across articles."""
+    if not infobox:
+        return {}
+    return {
+        sys.intern(key): sys.intern(value) if key == "template_type" and isinstance(value, str) else value
+        for key, value in infobox.items()
+    }
+
+
+def article_url(title: str, language: str = "vi") -> str:
+    """Build the canonical Wikipedia URL of an article."""
+    return f"https://{language}.wikipedia.org/wiki/{quote(title)}"
+
 
-@dataclass
 class WikipediaArticle:
-    """Data structure for Wikipedia article information."""
-
-    title: str
-    page_id: int
-    url: str
-    abstract: str
-    content: str
-    infobox: Dict[str, Any]
-    categories: List[str]
-    templates: List[str]
-    language: str = "vi"
-    last_modified: Optional[str] = None
-    revision_id: Optional[int] = None
-
-
-class RateLimiter:
-    """Thread-safe rate limiter for API requests."""
-
-    def __init__(self, requests_per_second: float = 1.0, burst_limit: int = 5):
-        self.requests_per_second = requests_per_second
-        self.burst_limit = burst_limit
-        self.tokens = burst_limit
-        self.last_update = time.time()
-        self.lock = threading.Lock()
-
-    def acquire(self) -> None:
-        """Acquire a token for making a request."""
-        with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.burst_limit, self.tokens + elapsed * self.requests_per_second
-            )
-            self.last_update = now
+    """Data structure for Wikipedia article information.
+
+    Articles are kept compact so that large corpora fit in memory: the class
+    uses ``__slots__``, category and template names are interned and stored
+    as tuples, the URL is only stored when it differs from the canonical one,
+    and long ``abstract``/``content`` values are kept compressed (or behind a
+    loader callable) until they are read. Attributes behave as on the former
+    dataclass; ``categories`` and ``templates`` return fresh lists, so assign
+    them to change them.
+    """
+
+    __slots__ = (
+        "title", "page_id", "_url", "_abstract", "_content", "infobox",
+        "_categories", "_templates", "language", "last_modified", "revision_id",
+    )
+
+    _FIELDS = (
+        "title", "page_id", "url", "abstract", "content", "infobox",
+        "categories", "templates", "language", "last_modified", "revision_id",
+    )
+
+    def __init__(self, title: str, page_id: int, url: Optional[str], abstract: LazyText,
+                 content: LazyText, infobox: Dict[str, Any], categories: Iterable[str],
+                 templates: Iterable[str], language: str = "vi",
+                 last_modified: Optional[str] = None, revision_id: Optional[int] = None):
+        self.title = title
+        self.page_id = page_id
+        self.language = sys.intern(language)
+        self.url = url
+        self.abstract = abstract
+        self.content = content
+        self.infobox = _intern_infobox(infobox)
+        self.categories = categories
+        self.templates = templates
+        self.last_modified = last_modified
+        self.revision_id = revision_id
+
+    @property
+    def url(self) -> str:
+        return self._url or article_url(self.title, self.language)
+
+    @url.setter
+    def url(self, value: Optional[str]) -> None:
+        self._url = None if value == article_url(self.title, self.language) else value
+
+    @property
+    def abstract(self) -> str:
+        return _unpack_text(self._abstract)
+
+    @abstract.setter
+    def abstract(self, value: LazyText) -> None:
+        self._abstract = _pack_text(value)
+
+    @property
+    def content(self) -> str:
+        return _unpack_text(self._content)
+
+    @content.setter
+    def content(self, value: LazyText) -> None:
+        self._content = _pack_text(value)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    @categories.setter
+    def categories(self, value: Iterable[str]) -> None:
+        self._categories = _intern_names(value)
+
+    @property
+    def templates(self) -> List[str]:
+        return list(self._templates)
+
+    @templates.setter
+    def templates(self, value: Iterable[str]) -> None:
+        self._templates = _intern_names(value)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, WikipediaArticle):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"WikipediaArticle(title={self.title!r}, page_id={self.page_id!r})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        # Loaders may not be picklable, so lazy text is materialized first
+        return tuple(
+            _pack_text(_unpack_text(value)) if callable(value) else value
+            for value in (getattr(self, name) for name in self.__slots__)
+        )
 
-            if self.tokens >= 1:
-                self.tokens -= 1
-            else:
-                # Wait until we have a token
-                wait_time = (1 - self.tokens) / self.requests_per_second
-                time.sleep(wait_time)
-                self.tokens = 0
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        # Re-intern names so unpickled articles share the receiving process' copies
+        self.language = sys.intern(self.language)
+        self._categories = _intern_names(self._categories)
+        self._templates = _intern_names(self._templates)
+        self.infobox = _intern_infobox(self.infobox)
+
+
+def article_to_dict(article: WikipediaArticle) -> Dict[str, Any]:
+    """Convert an article to a JSON-serializable dictionary."""
+    return {
+        "title": article.title,
+        "page_id": article.page_id,
+        "url": article.url,
+        "abstract": article.abstract,
+        "content": article.content,
+        "infobox": article.infobox,
+        "categories": article.categories,
+        "templates": article.templates,
+        "language": article.language,
+        "last_modified": article.last_modified,
+        "revision_id": article.revision_id,
+    }
+
+
+def wikitext_from_page(page_data: Dict[str, Any]) -> str:
+    """Get the section-0 wikitext returned by ``prop=revisions``."""
+    revisions = page_data.get("revisions", [])
+    if not revisions:
+        return ""
+    revision = revisions[0]
+    main_slot = revision.get("slots", {}).get("main", {})
+    return main_slot.get("*", main_slot.get("content", revision.get("*", "")))
+
+
+def build_article(page_data: Dict[str, Any], infobox: Dict[str, Any],
+                  language: str = "vi") -> WikipediaArticle:
+    """Create a WikipediaArticle from a query page entry and its parsed infobox."""
+    page_title = page_data.get("title", "")
+
+    # Get revision information
+    revisions = page_data.get("revisions", [])
+    last_modified = None
+    revision_id = None
+    if revisions:
+        last_modified = revisions[0].get("timestamp")
+        revision_id = revisions[0].get("revid")
+
+    return WikipediaArticle(
+        title=page_title,
+        page_id=page_data.get("pageid", 0),
+        url=article_url(page_title, language),
+        abstract=page_data.get("extract", ""),
+        content="",  # Will be populated if needed
+        infobox=infobox,
+        categories=[cat["title"] for cat in page_data.get("categories", [])],
+        templates=[tpl["title"] for tpl in page_data.get("templates", [])],
+        language=language,
+        last_modified=last_modified,
+        revision_id=revision_id,
+    )
+
+
+def article_from_page(page_data: Dict[str, Any], language: str = "vi") -> WikipediaArticle:
+    """Parse the wikitext of a query page entry into a WikipediaArticle.
+
+    This is the CPU-bound half of collection; it only depends on its
+    argument so it can run in a worker process.
+    """
+    wikitext = wikitext_from_page(page_data)
+    infobox = wikitext_parser.parse_infobox(wikitext) if wikitext else {}
+    return build_article(page_data, infobox, language)
 
 
 class WikipediaCollector:
     """Advanced Wikipedia data collector with comprehensive extraction capabilities."""
 
-    def __init__(self, config_path: str = "config/wikipedia.yaml"):
+    def __init__(self, config_path: str = "config/wikipedia.yaml",
+                 use_cache: Optional[bool] = None,
+                 store_wikitext: Optional[bool] = None,
+                 wiki: Optional[str] = None):
         self.config_path = config_path
-        self.session = requests.Session()
-        self.rate_limiter = None
+        self.wiki = wiki
+        self.session: Optional[requests.Session] = None
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.cache: Optional[ResponseCache] = None
+        self.wikitext_store: Optional[WikitextStore] = None
+        self.aliases: Optional[TitleAliasTable] = None
+        self.journal: Optional["CrawlJournal"] = None
         self.collected_articles: Dict[str, WikipediaArticle] = {}
         self.failed_articles: Set[str] = set()
 
         self._load_config()
         self._setup_session()
         self._setup_rate_limiter()
+        self._setup_cache(use_cache)
+        self._setup_wikitext_store(store_wikitext)
+        self._setup_aliases()
 
     def _load_config(self) -> None:
         """Load Wikipedia collector configuration."""
@@ -95,39 +288,147 @@ class WikipediaCollector:
                 self.extraction_config = config["extraction"]
                 self.target_categories = config["target_categories"]
                 self.sample_articles = config["sample_articles"]
+                self.concurrency_config = config.get("concurrency", {})
+                self.cache_config = config.get("cache", {})
+                self.category_crawl_config = config.get("category_crawl", {})
+                self.wikitext_store_config = config.get("wikitext_store", {})
+                self.aliases_config = config.get("title_aliases", {})
+                self.frontier_config = config.get("frontier", {})
+                if self.wiki and self.wiki != self.config.get("language", "vi"):
+                    self._select_wiki(config.get("wikis", {}))
+                self.wiki = self.language = self.config.get("language", "vi")
                 logger.info("Wikipedia collector configuration loaded")
         except Exception as e:
             logger.error(f"Failed to load Wikipedia config: {e}")
             raise
 
+    def _select_wiki(self, wikis: Dict[str, Any]) -> None:
+        """Point the collector at another language edition listed under ``wikis``.
+
+        The wiki gets its own API URL and rate limit, and its own cache,
+        alias table and wikitext store files, since titles and page ids are
+        only unique within one wiki.
+        """
+        if self.wiki not in wikis:
+            raise ValueError(f"Wiki '{self.wiki}' is not configured under 'wikis'")
+        target = wikis[self.wiki] or {}
+        self.config = {
+            **self.config,
+            "base_url": f"https://{self.wiki}.wikipedia.org/w/api.php",
+            **target,
+            "language": self.wiki,
+            "rate_limit": {**self.config["rate_limit"], **target.get("rate_limit", {})},
+        }
+        for section in ("cache_config", "wikitext_store_config", "aliases_config"):
+            section_config = dict(getattr(self, section))
+            if section_config.get("path"):
+                path = Path(section_config["path"])
+                section_config["path"] = str(path.with_name(f"{path.stem}.{self.wiki}{path.suffix}"))
+            setattr(self, section, section_config)
+
     def _setup_session(self) -> None:
-        """Set up HTTP session with proper headers."""
-        self.session.headers.update(
-            {
+        """Set up the pooled HTTP session with proper headers."""
+        # One keep-alive connection per thread that may share the session
+        pool_size = max(
+            self.concurrency_config.get("max_in_flight", 8),
+            self.category_crawl_config.get("max_workers", 4),
+        )
+        self.session = create_session(
+            headers={
                 "User-Agent": self.config["user_agent"],
                 "Accept": "application/json",
-                "Accept-Encoding": "gzip, deflate",
-            }
+            },
+            timeout=self.api_config["timeout"],
+            pool_size=pool_size,
+            # _request_api retries itself so it can take a rate limiter token per attempt
+            max_retries=0,
         )
-
-        # Set timeout
-        self.session.timeout = self.api_config["timeout"]
         logger.info("HTTP session configured")
 
     def _setup_rate_limiter(self) -> None:
         """Set up rate limiter based on configuration."""
         rate_config = self.config["rate_limit"]
-        self.rate_limiter = RateLimiter(
+        # Shared with every other client of the same host in this process
+        self.rate_limiter = get_rate_limiter(
+            self.config["base_url"],
             requests_per_second=rate_config["requests_per_second"],
             burst_limit=rate_config["burst_limit"],
         )
         logger.info("Rate limiter configured")
 
-    def _make_api_request(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Make rate-limited API request to Wikipedia."""
-        self.rate_limiter.acquire()
+    def _setup_cache(self, use_cache: Optional[bool]) -> None:
+        """Set up the on-disk response cache if enabled."""
+        enabled = self.cache_config.get("enabled", False) if use_cache is None else use_cache
+        if not enabled:
+            return
+
+        ttl_seconds = self.cache_config.get("ttl_seconds")
+        self.cache = ResponseCache(
+            cache_path=self.cache_config.get("path", "data/cache/wikipedia_cache.sqlite"),
+            max_size_bytes=int(self.cache_config.get("max_size_mb", 512) * 1024 * 1024),
+            ttl_seconds=ttl_seconds,
+        )
+        logger.info("Response cache configured")
 
-        # Add default parameters
+    def _setup_wikitext_store(self, store_wikitext: Optional[bool]) -> None:
+        """Set up the raw wikitext side store if enabled."""
+        enabled = (
+            self.wikitext_store_config.get("enabled", False)
+            if store_wikitext is None else store_wikitext
+        )
+        if not enabled:
+            return
+
+        self.wikitext_store = WikitextStore(
+            self.wikitext_store_config.get("path", "data/raw/wikitext.sqlite")
+        )
+        logger.info("Wikitext store configured")
+
+    def _setup_aliases(self) -> None:
+        """Set up the title alias table, persisted if a path is configured."""
+        self.aliases = TitleAliasTable(self.aliases_config.get("path"))
+        logger.info("Title alias table configured")
+
+    def canonical_title(self, title: str) -> str:
+        """Get the canonical title of a requested title, following known aliases."""
+        return self.aliases.resolve(title)
+
+    def get_collected_article(self, title: str) -> Optional[WikipediaArticle]:
+        """Get an already collected article by any of its titles."""
+        return self.collected_articles.get(self.canonical_title(title))
+
+    def _pending_titles(self, titles: Iterable[str]) -> List[str]:
+        """Get the canonical titles that still have to be fetched, without duplicates."""
+        return [
+            title for title in dict.fromkeys(self.canonical_title(t) for t in titles)
+            if title not in self.collected_articles
+        ]
+
+    def _collected_in_order(self, titles: Iterable[str]) -> List[WikipediaArticle]:
+        """Get the collected articles for requested titles, once per page, in input order."""
+        articles = {}
+        for title in titles:
+            article = self.get_collected_article(title)
+            if article is not None:
+                articles.setdefault(article.title, article)
+        return list(articles.values())
+
+    def _store_wikitext(self, pages: Iterable[Dict[str, Any]]) -> None:
+        """Keep the section-0 wikitext of fetched pages so they can be re-parsed offline."""
+        if self.wikitext_store is None:
+            return
+        records = []
+        for page_data in pages:
+            revisions = page_data.get("revisions", [])
+            revision_id = revisions[0].get("revid") if revisions else None
+            records.append((
+                page_data.get("pageid", 0), revision_id,
+                page_data.get("title", ""), wikitext_from_page(page_data),
+            ))
+        self.wikitext_store.put_many(records)
+
+    def _with_default_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the default action/format parameters to an API request."""
         default_params = {
             "action": (
                 self.api_config["action"]
@@ -137,272 +438,374 @@ class WikipediaCollector:
             "format": self.api_config["format"],
         }
         params.update(default_params)
+        return params
 
+    def _make_api_request(
+        self, params: Dict[str, Any], use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Make rate-limited API request to Wikipedia."""
+        params = self._with_default_params(params)
+
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get_response(params)
+            if cached is not None:
+                logger.debug(f"Cache hit for params: {params}")
+                return cached
+
+        response = self._request_api(params)
+        if use_cache and response is not None and "error" not in response:
+            self.cache.put_response(params, response)
+        return response
+
+    def _request_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add per-request parameters that must not be part of cache keys."""
+        maxlag = self.api_config.get("maxlag")
+        return {**params, "maxlag": maxlag} if maxlag else params
+
+    def _server_throttled(self, status: int, headers: Any,
+                          payload: Optional[Dict[str, Any]] = None) -> bool:
+        """Feed a response back into the rate limiter, returning True if it was throttled.
+
+        HTTP 429/503 and MediaWiki ``maxlag`` errors slow the bucket down for
+        the advertised ``Retry-After``; anything else lets it recover.
+        """
+        lagged = bool(payload) and payload.get("error", {}).get("code") == "maxlag"
+        if status in THROTTLE_STATUS_CODES or lagged:
+            self.rate_limiter.record_throttle(parse_retry_after(headers.get("Retry-After")))
+            return True
+        self.rate_limiter.record_success()
+        return False
+
+    def _request_api(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send an API request with retries, bypassing the cache."""
         logger.debug(f"Making API request with params: {params}")
 
         max_retries = self.api_config["max_retries"]
         backoff_factor = self.api_config["backoff_factor"]
 
         for attempt in range(max_retries):
+            # Retries take a token too; after a throttle the wait is the server's Retry-After
+            self.rate_limiter.acquire()
             try:
-                response = self.session.get(self.config["base_url"], params=params)
+                response = self.session.get(self.config["base_url"], params=self._request_params(params))
+                if response.status_code in THROTTLE_STATUS_CODES:
+                    self._server_throttled(response.status_code, response.headers)
+                    logger.warning(f"API request throttled (attempt {attempt + 1}): HTTP {response.status_code}")
+                    continue
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                if self._server_throttled(response.status_code, response.headers, data):
+                    logger.warning(f"API request hit maxlag (attempt {attempt + 1})")
+                    continue
+                return data
 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"API request failed (attempt {attempt + 1}): {e}")
                 if attempt < max_retries - 1:
                     wait_time = backoff_factor**attempt
                     time.sleep(wait_time)
-                else:
-                    logger.error(
-                        f"All API request attempts failed for params: {params}"
-                    )
-                    return None
 
+        logger.error(f"All API request attempts failed for params: {params}")
         return None
 
     def get_article_by_title(self, title: str) -> Optional[WikipediaArticle]:
         """Get Wikipedia article by title."""
-        if title in self.collected_articles:
-            return self.collected_articles[title]
+        article = self.get_collected_article(title)
+        if article is not None:
+            return article
 
         logger.info(f"Fetching article: {title}")
-
-        # Get basic article information
-        params = {
-            "prop": "extracts|info|categories|links|templates",
-            "titles": title,
+        articles = self.get_articles_by_titles([title])
+        return articles[0] if articles else None
+
+    def get_articles_by_titles(self, titles: List[str]) -> List[WikipediaArticle]:
+        """Get many Wikipedia articles using batched multi-title queries.
+
+        Each batch fetches extracts, page info, categories, templates and the
+        section-0 wikitext in one query (following ``continue`` tokens), so no
+        per-article ``action=parse`` round-trip is needed. Titles are resolved
+        through the alias table first, so a page is fetched once however it
+        is named.
+        """
+        titles = list(titles)
+        pending = self._serve_cached_pages(self._pending_titles(titles))
+
+        for batch in self._chunk_titles(pending):
+            logger.info(f"Fetching batch of {len(batch)} articles")
+            result = self._query_with_continuation(
+                self._batch_query_params(batch), use_cache=False
+            )
+            if result is None:
+                logger.error(f"Failed to fetch batch starting with: {batch[0]}")
+                self._record_failures(batch)
+                continue
+            matched = self._match_batch_pages(batch, result)
+            self._cache_batch_pages(matched)
+            self._store_batch_results(matched)
+
+        return self._collected_in_order(titles)
+
+    def get_language_links(
+        self, titles: Iterable[str], languages: Iterable[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """Get the titles of the same pages on other language editions.
+
+        Returns ``{canonical title: {language: title}}`` for the pages that
+        have a counterpart in at least one of ``languages``.
+        """
+        languages = set(languages)
+        links: Dict[str, Dict[str, str]] = {}
+        for batch in self._chunk_titles(list(dict.fromkeys(self.canonical_title(t) for t in titles))):
+            result = self._query_with_continuation({
+                "prop": "langlinks",
+                "titles": "|".join(batch),
+                "lllimit": "max",
+                "redirects": True,
+            })
+            if result is None:
+                logger.error(f"Failed to fetch language links for batch starting with: {batch[0]}")
+                continue
+            for page_data in self._match_batch_pages(batch, result).values():
+                if page_data is None or "missing" in page_data:
+                    continue
+                page_links = {
+                    link["lang"]: link.get("*", link.get("title"))
+                    for link in page_data.get("langlinks", [])
+                    if link.get("lang") in languages
+                }
+                if page_links:
+                    links[page_data["title"]] = page_links
+        return links
+
+    def _chunk_titles(self, titles: List[str]) -> List[List[str]]:
+        """Split titles into batches no larger than the API allows."""
+        batch_size = min(self.extraction_config.get("batch_size", MAX_TITLES_PER_QUERY),
+                         MAX_TITLES_PER_QUERY)
+        batch_size = max(1, batch_size)
+        return [titles[i:i + batch_size] for i in range(0, len(titles), batch_size)]
+
+    def _batch_query_params(self, titles: List[str]) -> Dict[str, Any]:
+        """Build the query parameters for fetching a batch of articles."""
+        return {
+            "prop": "extracts|info|categories|templates|revisions",
+            "titles": "|".join(titles),
             "exintro": True,
             "explaintext": True,
             "exsectionformat": "plain",
-            "cllimit": 500,
-            "tllimit": 500,
-            "rvprop": "timestamp|ids",
-            "rvlimit": 1,
-            # "redirects": True,  # Follow redirects automatically
+            "exlimit": "max",
+            "cllimit": "max",
+            "tllimit": "max",
+            "rvprop": "timestamp|ids|content",
+            "rvslots": "main",
+            "rvsection": 0,
+            "redirects": True,
         }
 
-        response = self._make_api_request(params)
-        if not response or "query" not in response:
-            logger.error(f"Failed to fetch basic info for: {title}")
-            self.failed_articles.add(title)
-            return None
-
-        pages = response["query"].get("pages", {})
-        if not pages:
-            logger.warning(f"No pages found for: {title}")
-            return None
-
-        # Get the first (and should be only) page
-        page_data = next(iter(pages.values()))
-
-        if "missing" in page_data:
-            logger.warning(f"Article not found: {title}")
-            self.failed_articles.add(title)
-            return None
-
-        # Extract basic information
-        page_id = page_data.get("pageid", 0)
-        page_title = page_data.get("title", title)
-        abstract = page_data.get("extract", "")
-        categories = [cat["title"] for cat in page_data.get("categories", [])]
-        templates = [tpl["title"] for tpl in page_data.get("templates", [])]
-
-        # Get revision information
-        revisions = page_data.get("revisions", [])
-        last_modified = None
-        revision_id = None
-        if revisions:
-            last_modified = revisions[0].get("timestamp")
-            revision_id = revisions[0].get("revid")
-
-        # Get infobox data
-        infobox = self._extract_infobox(page_title)
-
-        # Create article object
-        article = WikipediaArticle(
-            title=page_title,
-            page_id=page_id,
-            url=f"https://vi.wikipedia.org/wiki/{quote(page_title)}",
-            abstract=abstract,
-            content="",  # Will be populated if needed
-            infobox=infobox,
-            categories=categories,
-            templates=templates,
-            last_modified=last_modified,
-            revision_id=revision_id,
-        )
-
-        # Get full content if requested
-        if self.extraction_config.get("include_content", False):
-            content = self._get_article_content(page_title)
-            article.content = content or ""
-
-        self.collected_articles[title] = article
-        logger.info(f"Successfully collected article: {title}")
-        return article
+    def _query_with_continuation(
+        self, params: Dict[str, Any], use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Run a query, following ``continue`` tokens and merging all parts."""
+        merged = self._empty_query_result()
+        continuation: Dict[str, Any] = {}
+
+        while True:
+            response = self._make_api_request({**params, **continuation}, use_cache)
+            if not response or "query" not in response:
+                return None
+
+            self._merge_query_result(merged, response["query"])
+            continuation = response.get("continue")
+            if not continuation:
+                return merged
+
+    @staticmethod
+    def _empty_query_result() -> Dict[str, Any]:
+        return {"pages": {}, "normalized": [], "redirects": []}
+
+    @staticmethod
+    def _merge_query_result(merged: Dict[str, Any], query: Dict[str, Any]) -> None:
+        """Merge one (possibly continued) query response into the accumulator."""
+        for key in ("normalized", "redirects"):
+            merged[key].extend(query.get(key, []))
+
+        for page_key, page_data in query.get("pages", {}).items():
+            target = merged["pages"].setdefault(page_key, {})
+            for field, value in page_data.items():
+                if isinstance(value, list):
+                    target.setdefault(field, []).extend(value)
+                else:
+                    target.setdefault(field, value)
+
+    def _match_batch_pages(
+        self, titles: List[str], result: Dict[str, Any]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Map each requested title to its page entry, following normalization.
+
+        The aliases learnt on the way are recorded in the alias table.
+        """
+        aliases = {
+            item["from"]: item["to"]
+            for item in result["normalized"] + result["redirects"]
+        }
+        pages_by_title = {
+            page_data.get("title"): page_data for page_data in result["pages"].values()
+        }
 
-    def _extract_infobox(self, title: str) -> Dict[str, Any]:
-        """Extract infobox data from Wikipedia article."""
-        try:
-            params = {
-                "action": "parse",
-                "page": title,
-                "prop": "wikitext",
-                "section": 0,
-                "disablelimitreport": True,
-                "redirects": True,  # Follow redirects automatically
-            }
-
-            response = self._make_api_request(params)
-            if not response or "parse" not in response:
-                logger.warning(f"Failed to get wikitext for: {title}")
-                return {}
-
-            wikitext = response["parse"].get("wikitext", {}).get("*", "")
-            if not wikitext:
-                logger.debug(f"No wikitext found for: {title}")
-                return {}
-
-            return self._parse_infobox_from_wikitext(wikitext)
-        
-        except Exception as e:
-            logger.error(f"Error extracting infobox for {title}: {e}")
-            return {}
-
-    def _parse_infobox_from_wikitext(self, wikitext: str) -> Dict[str, Any]:
-        """Parse infobox data from wikitext."""
-        infobox = {}
-
-        # Common Vietnamese infobox patterns
-        infobox_patterns = [
-            r"\{\{\s*[Tt]hông tin\s+([^}]+?)\}\}",
-            r"\{\{\s*[Hh]ộp thông tin\s+([^}]+?)\}\}",
-            r"\{\{\s*[Ii]nfobox\s+([^}]+?)\}\}",
-            r"\{\{\s*[Tt]hông\s+tin\s+([^}]+?)\}\}",
+        matched = {}
+        for title in titles:
+            resolved = title
+            # At most one normalization and one redirect hop
+            for _ in range(2):
+                resolved = aliases.get(resolved, resolved)
+            matched[title] = pages_by_title.get(resolved)
+        self.aliases.record_query(matched, result)
+        return matched
+
+    def _serve_cached_pages(self, titles: List[str]) -> List[str]:
+        """Build articles for cached pages that are still current.
+
+        The cached revision ids are revalidated with batched ``prop=info``
+        queries; only titles that are uncached or have changed are returned
+        for a full fetch.
+        """
+        if self.cache is None or not titles:
+            return titles
+
+        cached_revisions = self.cache.get_page_revisions(titles)
+        if not cached_revisions:
+            self.cache.record_revalidation(0, 0, uncached=len(titles))
+            return titles
+
+        current_revisions = self._fetch_current_revisions(list(cached_revisions))
+        current = [
+            title for title, revision_id in cached_revisions.items()
+            if revision_id is not None and current_revisions.get(title) == revision_id
         ]
+        current_set = set(current)
+        stale = [title for title in cached_revisions if title not in current_set]
+        self.cache.invalidate_pages(stale)
+        self.cache.record_revalidation(
+            len(current), len(stale), uncached=len(titles) - len(cached_revisions)
+        )
 
-        for pattern in infobox_patterns:
-            matches = re.finditer(pattern, wikitext, re.IGNORECASE | re.DOTALL)
-
-            for match in matches:
-                infobox_content = match.group(1)
-                template_name = infobox_content.split("|")[0].strip()
-                infobox["template_type"] = template_name
-
-                # Parse infobox parameters
-                params = self._parse_infobox_parameters(infobox_content)
-                infobox.update(params)
-
-                if infobox:  # If we found an infobox, we're done
-                    break
-
-        return infobox
-
-    def _parse_infobox_parameters(self, content: str) -> Dict[str, str]:
-        """Parse parameters from infobox content."""
-        params = {}
-
-        # Split by | but handle nested braces
-        parts = []
-        current_part = ""
-        brace_depth = 0
-
-        for char in content:
-            if char == "{":
-                brace_depth += 1
-            elif char == "}":
-                brace_depth -= 1
-            elif char == "|" and brace_depth == 0:
-                parts.append(current_part.strip())
-                current_part = ""
+        for title in current:
+            page_data = self.cache.get_page(title)
+            if page_data is None:
                 continue
+            result = self._empty_query_result()
+            result["pages"][str(page_data.get("pageid"))] = page_data
+            if page_data.get("title") != title:
+                result["normalized"].append({"from": title, "to": page_data.get("title")})
+            self._store_batch_results(self._match_batch_pages([title], result))
+
+        logger.info(
+            f"Served {len(current)} articles from cache, {len(stale)} changed since caching"
+        )
+        return self._pending_titles(titles)
+
+    def _fetch_current_revisions(self, titles: List[str]) -> Dict[str, Optional[int]]:
+        """Look up the latest revision id of many pages with batched ``prop=info`` calls."""
+        revisions: Dict[str, Optional[int]] = {}
+        for batch in self._chunk_titles(titles):
+            result = self._query_with_continuation(
+                {"prop": "info", "titles": "|".join(batch), "redirects": True}, use_cache=False
+            )
+            if result is None:
+                continue
+            for title, page_data in self._match_batch_pages(batch, result).items():
+                revisions[title] = page_data.get("lastrevid") if page_data else None
+        return revisions
+
+    def _cache_batch_pages(self, matched: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Store the pages of a fetched batch, as matched by ``_match_batch_pages``, in the page cache."""
+        if self.cache is None:
+            return
+        for title, page_data in matched.items():
+            if page_data and "missing" not in page_data and "invalid" not in page_data:
+                self.cache.put_page(title, page_data)
+
+    def _store_batch_results(
+        self, matched: Dict[str, Optional[Dict[str, Any]]],
+        fetch_content: bool = True, record: bool = True
+    ) -> List[WikipediaArticle]:
+        """Build articles for a fetched batch, as matched by ``_match_batch_pages``, and record them.
 
-            current_part += char
-
-        if current_part.strip():
-            parts.append(current_part.strip())
-
-        # Parse each parameter
-        for part in parts[1:]:  # Skip template name
-            if "=" in part:
-                key, value = part.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Clean up value (remove wiki markup)
-                value = self._clean_wiki_markup(value)
-
-                if key and value:
-                    params[key] = value
-
-        return params
-
-    def _clean_wiki_markup(self, text: str) -> str:
-        """Clean Wikipedia markup from text."""
-        if not text:
-            return ""
-
-        # Remove HTML comments first
-        text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
-
-        # Remove file/image links (these can be complex)
-        text = re.sub(r"\[\[[Ff]ile:.*?\]\]", "", text)
-        text = re.sub(r"\[\[[Ii]mage:.*?\]\]", "", text)
-
-        # Remove templates {{template}} (handle nested ones)
-        max_iterations = 10  # Safety limit to prevent infinite loops
-        iteration_count = 0
-        while "{{" in text and iteration_count < max_iterations:
-            # old_text = text
-            text = re.sub(r"{{[^{}]*}}", "", text)
-            iteration_count += 1
-            # If text didn't change, break to prevent infinite loop
-            # if text == old_text:
-            #     break
-
-        # Remove wiki links with display text [[link|text]] -> text
-        text = re.sub(r"\[\[([^|\]]+)\|([^\]]+)\]\]", r"\2", text)
-
-        # Remove simple wiki links [[link]] -> link
-        text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
-
-        # Remove external links with text [url text] -> text
-        text = re.sub(r"\[https?://[^\s]+ ([^\]]+)\]", r"\1", text)
-
-        # Remove standalone external links
-        text = re.sub(r"\[https?://[^\]]+\]", "", text)
-        text = re.sub(r"https?://[^\s]+", "", text)
-
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        With ``record=False`` the articles are not journaled yet; the caller
+        must call ``_record_article`` once they are complete.
+        """
+        articles = []
+        self._store_wikitext(
+            page_data for page_data in matched.values()
+            if page_data is not None and "missing" not in page_data and "invalid" not in page_data
+        )
+        for title, page_data in matched.items():
+            if page_data is None or "missing" in page_data or "invalid" in page_data:
+                logger.warning(f"Article not found: {title}")
+                self._record_failures([title])
+                continue
 
-        # Remove formatting
-        text = re.sub(r"'''([^']+)'''", r"\1", text)  # Bold
-        text = re.sub(r"''([^']+)''", r"\1", text)  # Italic
+            article = article_from_page(page_data, self.language)
 
-        # Clean up any remaining brackets or markup
-        text = re.sub(r"\[\[", "", text)  # Remove any leftover [[
-        text = re.sub(r"\]\]", "", text)  # Remove any leftover ]]
-        text = re.sub(r"[\[\]]", "", text)  # Remove any single brackets
+            # Get full content if requested
+            if fetch_content and self.extraction_config.get("include_content", False):
+                content = self._get_article_content(article.title)
+                article.content = content or ""
 
-        # Clean up whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
+            self.collected_articles[article.title] = article
+            if record:
+                self._record_article(title, article)
+            articles.append(article)
+            logger.info(f"Successfully collected article: {title}")
+        return articles
 
-        return text
+    def _record_article(self, title: str, article: WikipediaArticle) -> None:
+        """Checkpoint a collected article to the crawl journal, if any."""
+        if self.journal is not None:
+            self.journal.record_article(title, article)
+
+    def _record_failures(self, titles: List[str]) -> None:
+        """Mark titles as failed and checkpoint them to the crawl journal, if any."""
+        self.failed_articles.update(titles)
+        if self.journal is not None:
+            for title in titles:
+                self.journal.record_failure(title)
+
+    def use_journal(self, journal: "CrawlJournal") -> None:
+        """Checkpoint all further collection to a journal, restoring completed work.
+
+        Articles already in the journal are restored into ``collected_articles``
+        so they are skipped by every collection method, and journaled category
+        listings are reused instead of being requested again.
+        """
+        self.journal = journal
+        restored = journal.restore_articles()
+        for title, article in restored.items():
+            self.collected_articles.setdefault(article.title, article)
+        self.aliases.add_many(
+            (title, article.title, article.page_id) for title, article in restored.items()
+        )
+        if restored:
+            logger.info(f"Restored {len(restored)} articles from crawl journal")
 
     def _get_article_content(self, title: str) -> Optional[str]:
         """Get full article content."""
-        params = {
+        response = self._make_api_request(self._content_query_params(title))
+        return self._content_from_response(response)
+
+    def _content_query_params(self, title: str) -> Dict[str, Any]:
+        """Build the query parameters for fetching the full plain-text extract."""
+        return {
             "prop": "extracts",
             "titles": title,
             "explaintext": True,
             "exsectionformat": "plain",
         }
 
-        response = self._make_api_request(params)
+    def _content_from_response(
+        self, response: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Pull the plain-text extract out of a content query response."""
         if not response or "query" not in response:
             return None
 
@@ -418,47 +821,42 @@ class WikipediaCollector:
     ) -> List[WikipediaArticle]:
         """Get articles from a Wikipedia category."""
         logger.info(f"Collecting articles from category: {category}")
-        articles = []
+        titles = self.get_category_member_titles(category, limit)
+        articles = self.get_articles_by_titles(titles)
 
-        params = {
-            "list": "categorymembers",
-            "cmtitle": category,
-            "cmlimit": min(limit, 500),
-            "cmnamespace": 0,  # Main namespace only
-        }
+        logger.info(f"Collected {len(articles)} articles from category: {category}")
+        return articles
 
-        response = self._make_api_request(params)
-        if not response or "query" not in response:
-            logger.error(f"Failed to get category members: {category}")
-            return articles
+    def get_category_member_titles(self, category: str, limit: int = 50) -> List[str]:
+        """List the article titles that belong to a Wikipedia category."""
+        from src.collectors.category_crawler import CategoryCrawler
 
-        members = response["query"].get("categorymembers", [])
+        if self.journal is not None:
+            journaled_titles = self.journal.get_category_titles(category, limit)
+            if journaled_titles is not None:
+                return journaled_titles[:limit]
 
-        for member in members[:limit]:
-            title = member.get("title", "")
-            if title:
-                article = self.get_article_by_title(title)
-                if article:
-                    articles.append(article)
+        members = CategoryCrawler(self).list_members(category, limit)
+        return [member.title for member in members if not member.is_subcategory]
 
-        logger.info(f"Collected {len(articles)} articles from category: {category}")
-        return articles
+    def get_sample_titles(self) -> List[str]:
+        """Get the configured sample article titles in order."""
+        all_titles = []
+        for category_articles in self.sample_articles.values():
+            all_titles.extend(category_articles)
+        return all_titles
 
     def collect_sample_articles(self) -> List[WikipediaArticle]:
         """Collect predefined sample articles."""
         logger.info("Collecting sample articles")
         articles = []
 
-        all_titles = []
-        for category_articles in self.sample_articles.values():
-            all_titles.extend(category_articles)
+        all_titles = self.get_sample_titles()
 
         with tqdm(total=len(all_titles), desc="Collecting articles") as pbar:
-            for title in all_titles:
-                article = self.get_article_by_title(title)
-                if article:
-                    articles.append(article)
-                pbar.update(1)
+            for batch in self._chunk_titles(all_titles):
+                articles.extend(self.get_articles_by_titles(batch))
+                pbar.update(len(batch))
 
         logger.info(f"Collected {len(articles)} sample articles")
         return articles
@@ -466,52 +864,52 @@ class WikipediaCollector:
     def collect_articles_by_categories(
         self, max_per_category: int = 20
     ) -> List[WikipediaArticle]:
-        """Collect articles from target categories."""
+        """Collect articles from target categories and their subcategories."""
         logger.info("Collecting articles from target categories")
-        all_articles = []
-
-        for category_type, categories in self.target_categories.items():
-            logger.info(f"Processing {category_type} categories")
+        titles = self.crawl_target_categories(max_per_category)
 
-            for category in categories:
-                articles = self.get_articles_from_category(category, max_per_category)
-                all_articles.extend(articles)
+        articles = []
+        with tqdm(total=len(titles), desc="Collecting articles") as pbar:
+            for batch in self._chunk_titles(titles):
+                articles.extend(self.get_articles_by_titles(batch))
+                pbar.update(len(batch))
 
-                # Add delay between categories
-                time.sleep(self.config["rate_limit"]["delay_between_requests"])
+        logger.info(f"Collected {len(articles)} unique articles from categories")
+        return articles
 
-        # Remove duplicates
-        unique_articles = {}
-        for article in all_articles:
-            if article.title not in unique_articles:
-                unique_articles[article.title] = article
+    def crawl_target_categories(self, max_per_category: Optional[int] = 20) -> List[str]:
+        """Expand the target categories into unique article titles, deduplicated by page id."""
+        from src.collectors.category_crawler import CategoryCrawler
 
-        final_articles = list(unique_articles.values())
-        logger.info(f"Collected {len(final_articles)} unique articles from categories")
-        return final_articles
+        categories = [
+            category
+            for category_list in self.target_categories.values()
+            for category in category_list
+        ]
+        return CategoryCrawler(self).crawl(categories, max_per_category)
 
     def save_articles_to_json(
         self, articles: List[WikipediaArticle], output_path: str
     ) -> None:
-        """Save collected articles to JSON file."""
+        """Save collected articles to JSON file.
+
+        Paths ending in ``.jsonl`` (optionally ``.gz``/``.zst``) are written
+        incrementally in the JSON Lines article format, paths ending in
+        ``.zarc`` as an article archive and paths ending in ``.aix`` as an
+        indexed article store.
+        """
+        from src.collectors.article_store import (
+            is_archive_path, is_indexed_path, is_jsonl_path, write_articles
+        )
+
         try:
+            if is_jsonl_path(output_path) or is_archive_path(output_path) or is_indexed_path(output_path):
+                count = write_articles(articles, output_path)
+                logger.info(f"Saved {count} articles to {output_path}")
+                return
+
             # Convert articles to dictionaries
-            articles_data = []
-            for article in articles:
-                article_dict = {
-                    "title": article.title,
-                    "page_id": article.page_id,
-                    "url": article.url,
-                    "abstract": article.abstract,
-                    "content": article.content,
-                    "infobox": article.infobox,
-                    "categories": article.categories,
-                    "templates": article.templates,
-                    "language": article.language,
-                    "last_modified": article.last_modified,
-                    "revision_id": article.revision_id,
-                }
-                articles_data.append(article_dict)
+            articles_data = [article_to_dict(article) for article in articles]
 
             # Ensure output directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
@@ -527,15 +925,19 @@ class WikipediaCollector:
             raise
 
     def load_articles_from_json(self, input_path: str) -> List[WikipediaArticle]:
-        """Load articles from JSON file."""
-        try:
-            with open(input_path, "r", encoding="utf-8") as file:
-                articles_data = json.load(file)
+        """Load articles from any article file through its indexed store.
 
-            articles = []
-            for article_dict in articles_data:
-                article = WikipediaArticle(**article_dict)
-                articles.append(article)
+        Files other than ``.aix`` stores are indexed first (see
+        ``open_article_index``). This materializes the whole file; use
+        ``article_store.iter_articles`` to stream large corpora instead, or
+        ``open_article_index`` to look up single articles.
+        """
+        from src.collectors.indexed_store import open_article_index
+
+        try:
+            with open_article_index(input_path) as store:
+                articles = list(store.iter_articles())
+            for article in articles:
                 self.collected_articles[article.title] = article
 
             logger.info(f"Loaded {len(articles)} articles from {input_path}")
@@ -545,10 +947,27 @@ class WikipediaCollector:
             logger.error(f"Failed to load articles: {e}")
             raise
 
+    def open_article_index(self, input_path: str):
+        """Open an indexed article store for lookups by title or page id.
+
+        Other article files are indexed first, into ``<input_path>.aix``;
+        the index is rebuilt when the size or mtime of the source changes.
+        """
+        from src.collectors.indexed_store import open_article_index
+
+        return open_article_index(input_path)
+
     def get_collection_statistics(self) -> Dict[str, Any]:
         """Get statistics about collected articles."""
         if not self.collected_articles:
-            return {"total_articles": 0}
+            stats = {"total_articles": 0}
+            if self.cache is not None:
+                stats["cache"] = self.cache.get_statistics()
+            if self.wikitext_store is not None:
+                stats["wikitext_store"] = self.wikitext_store.get_statistics()
+            stats["rate_limiter"] = self.rate_limiter.get_statistics()
+            stats["http"] = get_transport_statistics(self.session)
+            return stats
 
         stats = {
             "total_articles": len(self.collected_articles),
@@ -576,6 +995,13 @@ class WikipediaCollector:
                     stats["infobox_templates"].get(template, 0) + 1
                 )
 
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_statistics()
+        if self.wikitext_store is not None:
+            stats["wikitext_store"] = self.wikitext_store.get_statistics()
+        stats["rate_limiter"] = self.rate_limiter.get_statistics()
+        stats["http"] = get_transport_statistics(self.session)
+
         return stats
 
 
@@ -0,0 +1,556 @@
+"""
+Wikitext Parser Module
+
+This module holds the wikitext parsing used by the collectors: template and
+infobox extraction, infobox parameter splitting and wiki markup cleanup. The
+functions are plain module-level functions so they can be shipped to worker
+processes when parsing offline dumps.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+
+# Template parsing
+#
+# Templates are found in one pass over the page: a single token regex visits
+# only the braces, link brackets, pipes and comments, a stack tracks nesting,
+# and parameters are cut out of the page by slicing between the recorded
+# top-level pipes. Pipes inside nested templates, wiki links and comments do
+# not split parameters.
+
+_TEMPLATE_SCAN_TOKEN = re.compile(r"<!--.*?-->|\{\{|\}\}|\[\[|\]\]|\|", re.DOTALL)
+_INFOBOX_NAME = re.compile(r"(?:hộp\s+thông\s+tin|thông\s+tin|infobox)\s+(.+)", re.IGNORECASE | re.DOTALL)
+_INFOBOX_START = re.compile(r"\{\{\s*(?:hộp\s+thông\s+tin|thông\s+tin|infobox)\s", re.IGNORECASE)
+
+
+@dataclass
+class Template:
+    """A top-level template call with its raw parameter values."""
+    name: str
+    params: Dict[str, str] = field(default_factory=dict)
+    positional: List[str] = field(default_factory=list)
+    start: int = 0
+    end: int = 0
+
+
+def _scan_templates(wikitext: str) -> Iterator[Tuple[int, int, List[int]]]:
+    """Yield top-level template calls as ``(start, end, pipe positions)`` in document order."""
+    # Frames are [start, top-level pipes, open link count, completed children]
+    stack = []
+    for match in _TEMPLATE_SCAN_TOKEN.finditer(wikitext):
+        token = match.group()
+        if token == "|":
+            if stack and not stack[-1][2]:
+                stack[-1][1].append(match.start())
+        elif token == "{{":
+            stack.append([match.start(), [], 0, []])
+        elif token == "}}":
+            if stack:
+                frame = stack.pop()
+                call = (frame[0], match.end(), frame[1])
+                if stack:
+                    stack[-1][3].append(call)
+                else:
+                    yield call
+        elif token == "[[":
+            if stack:
+                stack[-1][2] += 1
+        elif token == "]]":
+            if stack and stack[-1][2]:
+                stack[-1][2] -= 1
+
+    # An unclosed "{{" is literal text, so calls completed inside it are top-level
+    while len(stack) > 1:
+        children = stack.pop()[3]
+        stack[-1][3].extend(children)
+    if stack:
+        yield from stack[0][3]
+
+
+def _top_level_pipes(text: str, start: int, end: int) -> List[int]:
+    """Find the pipes of a template body that separate its parameters."""
+    pipes = []
+    template_depth = 0
+    link_depth = 0
+    for match in _TEMPLATE_SCAN_TOKEN.finditer(text, start, end):
+        token = match.group()
+        if token == "|":
+            if not template_depth and not link_depth:
+                pipes.append(match.start())
+        elif token == "{{":
+            template_depth += 1
+        elif token == "}}":
+            template_depth = max(0, template_depth - 1)
+        elif token == "[[":
+            link_depth += not template_depth
+        elif token == "]]":
+            if not template_depth:
+                link_depth = max(0, link_depth - 1)
+    return pipes
+
+
+def _split_parameters(text: str, start: int, end: int,
+                      pipes: List[int]) -> Tuple[str, Dict[str, str], List[str]]:
+    """Slice a template body into its name, named and positional parameters."""
+    stops = pipes + [end]
+    name = " ".join(text[start:stops[0]].split())
+
+    params = {}
+    positional = []
+    for pipe, stop in zip(pipes, stops[1:]):
+        key, equals, value = text[pipe + 1:stop].partition("=")
+        # "=" only names a parameter when it is not inside nested markup
+        if equals and "{{" not in key and "[[" not in key:
+            params[key.strip()] = value.strip()
+        else:
+            positional.append((key + equals + value).strip())
+    return name, params, positional
+
+
+def _template_key(name: str) -> str:
+    """Normalize a template name for comparisons."""
+    return " ".join(name.split()).casefold()
+
+
+def _clean_parameters(params: Dict[str, str]) -> Dict[str, str]:
+    """Clean the wiki markup of parameter values, dropping empty ones."""
+    cleaned = {}
+    for key, value in params.items():
+        value = clean_wiki_markup(value)
+        if key and value:
+            cleaned[key] = value
+    return cleaned
+
+
+def parse_templates(wikitext: str, names: Optional[Iterable[str]] = None) -> List[Template]:
+    """Parse the top-level templates of a page in document order.
+
+    With ``names``, only templates with one of those names are returned
+    (compared case-insensitively).
+    """
+    wanted = {_template_key(name) for name in names} if names is not None else None
+
+    templates = []
+    for start, end, pipes in _scan_templates(wikitext):
+        name, params, positional = _split_parameters(wikitext, start + 2, end - 2, pipes)
+        if wanted is None or _template_key(name) in wanted:
+            templates.append(Template(name, params, positional, start, end))
+    return templates
+
+
+def infobox_type(template: Template) -> Optional[str]:
+    """Get the infobox type of a template, or None if it is not an infobox."""
+    match = _INFOBOX_NAME.fullmatch(template.name)
+    return match.group(1) if match else None
+
+
+def infobox_to_dict(template: Template) -> Dict[str, Any]:
+    """Build the article infobox dictionary from an infobox template."""
+    infobox = {"template_type": infobox_type(template) or template.name}
+    infobox.update(_clean_parameters(template.params))
+    return infobox
+
+
+def parse_infobox_and_templates(
+    wikitext: str, names: Optional[Iterable[str]] = None
+) -> Tuple[Dict[str, Any], List[Template]]:
+    """Parse the first infobox and the other top-level templates of a page.
+
+    With ``names``, only other templates with one of those names are returned.
+    """
+    wanted = {_template_key(name) for name in names} if names is not None else None
+
+    infobox = {}
+    templates = []
+    for template in parse_templates(wikitext):
+        if not infobox and infobox_type(template) is not None:
+            infobox = infobox_to_dict(template)
+        elif wanted is None or _template_key(template.name) in wanted:
+            templates.append(template)
+    return infobox, templates
+
+
+def parse_infobox(wikitext: str) -> Dict[str, Any]:
+    """Parse infobox data from wikitext."""
+    # Pages without an infobox are rejected without scanning their templates,
+    # and the scan stops at the first infobox
+    if not _INFOBOX_START.search(wikitext):
+        return {}
+    for start, end, pipes in _scan_templates(wikitext):
+        name_end = pipes[0] if pipes else end - 2
+        if _INFOBOX_NAME.fullmatch(" ".join(wikitext[start + 2:name_end].split())):
+            name, params, positional = _split_parameters(wikitext, start + 2, end - 2, pipes)
+            return infobox_to_dict(Template(name, params, positional, start, end))
+    return {}
+
+
+def parse_infobox_parameters(content: str) -> Dict[str, str]:
+    """Parse parameters from infobox content."""
+    pipes = _top_level_pipes(content, 0, len(content))
+    _, params, _ = _split_parameters(content, 0, len(content), pipes)
+    return _clean_parameters(params)
+
+
+# Markup cleanup
+#
+# clean_wiki_markup() tokenizes the text in a linear scan instead of running a
+# chain of global regex substitutions. The substitution chain below is the
+# reference definition of the output: the scanner reproduces it exactly and
+# falls back to it for the rare inputs where the result depends on the order
+# of the passes (e.g. links nested in links, stray braces next to templates).
+
+MAX_TEMPLATE_DEPTH = 10
+
+_CLEANUP_PASSES = [
+    # Remove HTML comments first
+    (re.compile(r"<!--.*?-->", re.DOTALL), ""),
+    # Remove file/image links (these can be complex)
+    (re.compile(r"\[\[[Ff]ile:.*?\]\]"), ""),
+    (re.compile(r"\[\[[Ii]mage:.*?\]\]"), ""),
+    # Remove templates {{template}}, innermost first (see _strip_templates_by_passes)
+    None,
+    # Remove wiki links with display text [[link|text]] -> text
+    (re.compile(r"\[\[([^|\]]+)\|([^\]]+)\]\]"), r"\2"),
+    # Remove simple wiki links [[link]] -> link
+    (re.compile(r"\[\[([^\]]+)\]\]"), r"\1"),
+    # Remove external links with text [url text] -> text
+    (re.compile(r"\[https?://[^\s]+ ([^\]]+)\]"), r"\1"),
+    # Remove standalone external links
+    (re.compile(r"\[https?://[^\]]+\]"), ""),
+    (re.compile(r"https?://[^\s]+"), ""),
+    # Remove HTML tags
+    (re.compile(r"<[^>]+>"), ""),
+    # Remove formatting
+    (re.compile(r"'''([^']+)'''"), r"\1"),  # Bold
+    (re.compile(r"''([^']+)''"), r"\1"),  # Italic
+    # Clean up any remaining brackets or markup
+    (re.compile(r"[\[\]]"), ""),
+    # Clean up whitespace
+    (re.compile(r"\s+"), " "),
+]
+_INLINE_PASSES_START = 8  # Index of the bare URL pass
+
+_INNERMOST_TEMPLATE = re.compile(r"{{[^{}]*}}")
+
+
+def _strip_templates_by_passes(text: str) -> str:
+    """Remove templates innermost first, at most MAX_TEMPLATE_DEPTH levels deep."""
+    iteration_count = 0
+    while "{{" in text and iteration_count < MAX_TEMPLATE_DEPTH:
+        text = _INNERMOST_TEMPLATE.sub("", text)
+        iteration_count += 1
+    return text
+
+
+def _clean_wiki_markup_by_passes(text: str, start: int = 0) -> str:
+    """Clean markup with the reference substitution chain, starting at a given pass."""
+    for cleanup_pass in _CLEANUP_PASSES[start:]:
+        if cleanup_pass is None:
+            text = _strip_templates_by_passes(text)
+        else:
+            pattern, replacement = cleanup_pass
+            text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+_WHITESPACE = re.compile(r"\s")
+_STRUCTURE_TOKEN = re.compile(r"\[\[|\[https?://|\{\{")
+_TEMPLATE_TOKEN = re.compile(r"\{\{|\}\}|[{}]|\[\[(?:[Ff]ile|[Ii]mage):")
+_LINK_TOKEN = re.compile(r"\]|\{\{|\[")
+_INLINE_TOKEN = re.compile(r"https?://|<")
+_APOSTROPHE_RUNS = re.compile(r"('+)")
+_FILE_PREFIXES = ("File:", "file:", "Image:", "image:")
+
+
+class _Ambiguous(Exception):
+    """Raised when the scanner cannot reproduce the reference passes exactly."""
+
+
+def _strip_comments(text: str) -> str:
+    """Remove ``<!-- -->`` comments, leaving an unterminated one in place."""
+    pieces = []
+    pos = 0
+    while True:
+        start = text.find("<!--", pos)
+        if start < 0:
+            break
+        end = text.find("-->", start + 4)
+        if end < 0:
+            break
+        pieces.append(text[pos:start])
+        pos = end + 3
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def _file_link_end(text: str, start: int, prefix_end: int) -> int:
+    """Get the end of a file/image link starting at ``start``, or -1 if it is not closed."""
+    end = text.find("]]", prefix_end)
+    if end < 0 or text.find("\n", prefix_end, end) >= 0:
+        return -1
+    span = text[start + 2:end]
+    # File links are removed before templates, and [[File: before [[Image:
+    if "{" in span or "}" in span or any("[[" + prefix in span for prefix in _FILE_PREFIXES):
+        raise _Ambiguous
+    # Removing the link first can join the braces around it into a template
+    if text[start - 1:start] in ("{", "}") or text[end + 2:end + 3] in ("{", "}"):
+        raise _Ambiguous
+    return end + 2
+
+
+def _skip_template(text: str, start: int) -> int:
+    """Get the end of the (possibly nested) template starting at ``start``.
+
+    Returns -1 if the template is never closed; its ``{{`` is then kept as text.
+    """
+    depth = 0
+    pos = start
+    while True:
+        match = _TEMPLATE_TOKEN.search(text, pos)
+        if match is None:
+            return -1
+        token = match.group()
+        if token == "{{":
+            depth += 1
+            if depth > MAX_TEMPLATE_DEPTH:
+                raise _Ambiguous
+        elif token == "}}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        elif token in "{}":
+            # A single brace changes which braces pair up
+            raise _Ambiguous
+        else:
+            end = _file_link_end(text, match.start(), match.end())
+            if end >= 0:
+                pos = end
+                continue
+        pos = match.end()
+
+
+def _scan_link(text: str, start: int, out: List[str]) -> int:
+    """Replace the wiki link starting at ``start`` by its display text."""
+    pieces = []
+    pos = start + 2
+    while True:
+        match = _LINK_TOKEN.search(text, pos)
+        if match is None:
+            raise _Ambiguous
+        pieces.append(text[pos:match.start()])
+        token = match.group()
+        if token == "{{":
+            pos = _skip_template(text, match.start())
+            if pos < 0:
+                pieces.append(token)
+                pos = match.end()
+        elif token == "]" and text.startswith("]]", match.start()):
+            end = match.start() + 2
+            break
+        else:
+            raise _Ambiguous
+
+    content = "".join(pieces)
+    bar = content.find("|")
+    if 0 < bar < len(content) - 1:
+        out.append(content[bar + 1:])
+    elif content:
+        out.append(content)
+    else:
+        raise _Ambiguous
+    return end
+
+
+def _scan_external_link(text: str, start: int, url_start: int, out: List[str]) -> int:
+    """Replace the external link starting at ``start`` by its label, if it has one."""
+    whitespace = _WHITESPACE.search(text, url_start)
+    url_end = whitespace.start() if whitespace else len(text)
+    url = text[url_start:url_end]
+    if "[" in url or "{" in url or "}" in url:
+        raise _Ambiguous
+
+    if url and whitespace and text[url_end] == " ":
+        close = text.find("]", url_end + 1)
+        if close > url_end + 1:
+            label = text[url_end + 1:close]
+            if "[" in label or "{" in label or "}" in label:
+                raise _Ambiguous
+            out.append(label)
+            return close + 1
+
+    close = text.find("]", url_start)
+    if close <= url_start:
+        raise _Ambiguous
+    span = text[url_start:close]
+    if "[" in span or "{" in span or "}" in span:
+        raise _Ambiguous
+    return close + 1
+
+
+def _strip_structure(text: str) -> str:
+    """Remove file links and templates and resolve wiki and external links in one scan."""
+    out = []
+    pos = 0
+    while True:
+        match = _STRUCTURE_TOKEN.search(text, pos)
+        if match is None:
+            break
+        start = match.start()
+        out.append(text[pos:start])
+        token = match.group()
+
+        if token == "{{":
+            pos = _skip_template(text, start)
+            if pos < 0:
+                out.append(token)
+                pos = match.end()
+        elif token == "[[":
+            if text.startswith("[", start + 2):
+                raise _Ambiguous
+            end = -1
+            if text.startswith(_FILE_PREFIXES, start + 2):
+                prefix_end = text.index(":", start) + 1
+                end = _file_link_end(text, start, prefix_end)
+            pos = end if end >= 0 else _scan_link(text, start, out)
+        else:
+            pos = _scan_external_link(text, start, match.end(), out)
+    out.append(text[pos:])
+
+    result = "".join(out)
+    # Removing a span can join the text around it into new link markup
+    if "[[" in result or "[http://" in result or "[https://" in result:
+        raise _Ambiguous
+    return result
+
+
+def _strip_inline(text: str) -> str:
+    """Remove bare URLs and HTML tags in one scan."""
+    out = []
+    pos = 0
+    length = len(text)
+    while True:
+        match = _INLINE_TOKEN.search(text, pos)
+        if match is None:
+            break
+        start = match.start()
+        if match.group() == "<":
+            close = text.find(">", start + 1)
+            if close <= start + 1:
+                out.append(text[pos:start + 1])
+                pos = start + 1
+                continue
+            tag = text[start + 1:close]
+            # URLs are removed before tags, which changes where a tag containing one ends
+            if "http://" in tag or "https://" in tag:
+                raise _Ambiguous
+            out.append(text[pos:start])
+            pos = close + 1
+        else:
+            url_start = match.end()
+            if url_start < length and not text[url_start].isspace():
+                whitespace = _WHITESPACE.search(text, url_start)
+                out.append(text[pos:start])
+                pos = whitespace.start() if whitespace else length
+            else:
+                out.append(text[pos:url_start])
+                pos = url_start
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def _strip_emphasis_runs(parts: List[str], width: int) -> List[str]:
+    """Remove ``width`` apostrophes on each side of emphasized text, left to right.
+
+    ``parts`` alternates text and apostrophe runs, starting and ending with text.
+    """
+    result = [parts[0]]
+    available = None  # Apostrophes of the current run that can still open emphasis
+    for index in range(1, len(parts), 2):
+        run = available if available is not None else len(parts[index])
+        available = None
+        following = parts[index + 1]
+        if (run >= width and following and index + 2 < len(parts)
+                and len(parts[index + 2]) >= width):
+            result.append("'" * (run - width))
+            result.append(following)
+            available = len(parts[index + 2]) - width
+        else:
+            result.append("'" * run)
+            result.append(following)
+    return result
+
+
+def _strip_emphasis(text: str) -> str:
+    """Remove bold and then italic markup."""
+    parts = _APOSTROPHE_RUNS.split(text)
+    parts = _APOSTROPHE_RUNS.split("".join(_strip_emphasis_runs(parts, 3)))
+    return "".join(_strip_emphasis_runs(parts, 2))
+
+
+def clean_wiki_markup(text: str) -> str:
+    """Clean Wikipedia markup from text."""
+    if not text:
+        return ""
+
+    if "<!--" in text:
+        text = _strip_comments(text)
+
+    try:
+        text = _strip_structure(text)
+    except _Ambiguous:
+        return _clean_wiki_markup_by_passes(text, 1)
+
+    try:
+        text = _strip_inline(text)
+    except _Ambiguous:
+        return _clean_wiki_markup_by_passes(text, _INLINE_PASSES_START)
+
+    if "''" in text:
+        text = _strip_emphasis(text)
+    if "[" in text or "]" in text:
+        text = text.replace("[", "").replace("]", "")
+    return " ".join(text.split())
+
+
+CATEGORY_LINK_PATTERN = re.compile(
+    r"\[\[\s*(?:Thể loại|Category)\s*:\s*([^\]|]+?)\s*(?:\|[^\]]*)?\]\]", re.IGNORECASE
+)
+TEMPLATE_NAME_PATTERN = re.compile(r"\{\{\s*([^{}|:#\n]+?)\s*(?:\||\}\})")
+SECTION_HEADING_PATTERN = re.compile(r"^==[^=].*?==\s*$", re.MULTILINE)
+REFERENCE_PATTERN = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+
+
+def extract_categories(wikitext: str, prefix: str = "Thể loại:") -> List[str]:
+    """Extract category links from wikitext, in the ``prop=categories`` title form."""
+    categories = []
+    for match in CATEGORY_LINK_PATTERN.finditer(wikitext):
+        category = prefix + match.group(1).replace("_", " ")
+        if category not in categories:
+            categories.append(category)
+    return categories
+
+
+def extract_template_names(wikitext: str, prefix: str = "Bản mẫu:") -> List[str]:
+    """Extract transcluded template names from wikitext, in the ``prop=templates`` title form."""
+    templates = []
+    for match in TEMPLATE_NAME_PATTERN.finditer(wikitext):
+        name = match.group(1).replace("_", " ")
+        template = prefix + name[:1].upper() + name[1:]
+        if template not in templates:
+            templates.append(template)
+    return templates
+
+
+def lead_section(wikitext: str) -> str:
+    """Get the wikitext before the first section heading."""
+    match = SECTION_HEADING_PATTERN.search(wikitext)
+    return wikitext[:match.start()] if match else wikitext
+
+
+def extract_abstract(wikitext: str) -> str:
+    """Get the plain text of the lead section, without references or category links."""
+    lead = REFERENCE_PATTERN.sub("", lead_section(wikitext))
+    lead = CATEGORY_LINK_PATTERN.sub("", lead)
+    return clean_wiki_markup(lead)
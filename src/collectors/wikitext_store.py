@@ -0,0 +1,198 @@
+"""
+Wikitext Store Module
+
+This module keeps the raw section-0 wikitext of collected articles in a
+compressed SQLite side store keyed by page and revision id. With it, the
+corpus can be re-parsed offline whenever the infobox parser improves:
+``reparse_articles`` rebuilds the infoboxes of a stored article file in a
+process pool without touching the network.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+from src.collectors import wikitext_parser
+
+logger = logging.getLogger(__name__)
+
+# Article dictionaries paired with their stored wikitext, if any
+WikitextChunk = List[Tuple[Dict[str, Any], Optional[str]]]
+
+
+class WikitextStore:
+    """SQLite store of zlib-compressed wikitext keyed by ``(page_id, revision_id)``."""
+
+    def __init__(self, store_path: str = "data/raw/wikitext.sqlite"):
+        self.store_path = store_path
+        self.lock = threading.Lock()
+        self.stats = {
+            'stored': 0,
+            'lookups': 0,
+            'misses': 0,
+            'raw_bytes': 0,
+            'compressed_bytes': 0
+        }
+
+        Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(store_path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS wikitext (
+                    page_id INTEGER NOT NULL,
+                    revision_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    PRIMARY KEY (page_id, revision_id)
+                )
+            """)
+        logger.info(f"Wikitext store opened at {store_path}")
+
+    def put_many(self, pages: Iterable[Tuple[int, Optional[int], str, str]]) -> int:
+        """Store ``(page_id, revision_id, title, wikitext)`` records, returning how many were written."""
+        rows = []
+        raw_bytes = 0
+        for page_id, revision_id, title, wikitext in pages:
+            if not wikitext:
+                continue
+            encoded = wikitext.encode("utf-8")
+            raw_bytes += len(encoded)
+            rows.append((page_id, revision_id or 0, title, zlib.compress(encoded)))
+        if not rows:
+            return 0
+
+        with self.lock:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO wikitext (page_id, revision_id, title, body) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self.stats['stored'] += len(rows)
+            self.stats['raw_bytes'] += raw_bytes
+            self.stats['compressed_bytes'] += sum(len(row[3]) for row in rows)
+        return len(rows)
+
+    def put(self, page_id: int, revision_id: Optional[int], title: str, wikitext: str) -> None:
+        """Store the wikitext of one revision."""
+        self.put_many([(page_id, revision_id, title, wikitext)])
+
+    def get(self, page_id: int, revision_id: Optional[int] = None) -> Optional[str]:
+        """Get the wikitext of a revision, or of the latest stored revision if none is given."""
+        with self.lock:
+            if revision_id is None:
+                row = self.connection.execute(
+                    "SELECT body FROM wikitext WHERE page_id = ? ORDER BY revision_id DESC LIMIT 1",
+                    (page_id,),
+                ).fetchone()
+            else:
+                row = self.connection.execute(
+                    "SELECT body FROM wikitext WHERE page_id = ? AND revision_id = ?",
+                    (page_id, revision_id),
+                ).fetchone()
+            self.stats['lookups'] += 1
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM wikitext").fetchone()[0]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = self.stats.copy()
+        stats['compression_ratio'] = (
+            stats['raw_bytes'] / stats['compressed_bytes'] if stats['compressed_bytes'] else 0.0
+        )
+        return stats
+
+
+def _reparse_chunk(chunk: WikitextChunk) -> List[Dict[str, Any]]:
+    """Worker entry point: rebuild the infoboxes of a chunk of article dictionaries."""
+    articles = []
+    for article_dict, wikitext in chunk:
+        if wikitext is not None:
+            article_dict["infobox"] = wikitext_parser.parse_infobox(wikitext)
+        articles.append(article_dict)
+    return articles
+
+
+def _iter_chunks(article_dicts: Iterable[Dict[str, Any]], store: WikitextStore,
+                 chunk_size: int, stats: Dict[str, Any]) -> Iterator[WikitextChunk]:
+    """Pair articles with their stored wikitext, in chunks."""
+    chunk = []
+    for article_dict in article_dicts:
+        stats['articles'] += 1
+        wikitext = store.get(article_dict.get("page_id", 0), article_dict.get("revision_id"))
+        if wikitext is None:
+            stats['missing_wikitext'] += 1
+        else:
+            stats['reparsed'] += 1
+        chunk.append((article_dict, wikitext))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def reparse_articles(input_path: str, store: WikitextStore, output_path: str,
+                     workers: Optional[int] = None, chunk_size: int = 100) -> Dict[str, Any]:
+    """Rebuild the infoboxes of an article file from stored wikitext.
+
+    Articles without stored wikitext are written unchanged. Returns
+    reparsing statistics.
+    """
+    from src.collectors.article_store import ArticleWriter, iter_article_dicts
+
+    stats = {'articles': 0, 'reparsed': 0, 'missing_wikitext': 0, 'elapsed_seconds': 0.0}
+    start = time.perf_counter()
+    chunks = _iter_chunks(iter_article_dicts(input_path), store, chunk_size, stats)
+
+    with ArticleWriter(output_path) as writer:
+        if workers == 1:
+            for chunk in chunks:
+                for article_dict in _reparse_chunk(chunk):
+                    writer.write_dict(article_dict)
+        else:
+            workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Keep a bounded number of chunks in flight so memory stays constant
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_reparse_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        for article_dict in pending.popleft().result():
+                            writer.write_dict(article_dict)
+                while pending:
+                    for article_dict in pending.popleft().result():
+                        writer.write_dict(article_dict)
+
+    stats['elapsed_seconds'] = time.perf_counter() - start
+    stats['articles_per_second'] = (
+        stats['articles'] / stats['elapsed_seconds'] if stats['elapsed_seconds'] else 0.0
+    )
+    logger.info(
+        f"Reparsed {stats['reparsed']} of {stats['articles']} articles "
+        f"({stats['missing_wikitext']} without stored wikitext)"
+    )
+    return stats
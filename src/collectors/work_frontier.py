@@ -0,0 +1,337 @@
+"""
+Work Frontier Module
+
+This module lets several collector processes, possibly on different
+machines, share one crawl without a coordinator. The frontier is a SQLite
+database on shared disk: workers claim batches of titles under a time-limited
+lease, write the articles to their own article store file and mark the titles
+done. Titles whose lease runs out (a crashed or stalled node) are handed to
+the next worker that asks. The same database holds a per-host request
+schedule, so the configured API rate limit holds for all nodes together.
+"""
+
+import os
+import time
+import socket
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from urllib.parse import urlparse
+
+from src.collectors.title_aliases import normalize_title
+from src.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def default_worker_id() -> str:
+    """Identify this process across machines."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkFrontier:
+    """Leased title frontier and shared request schedule in a SQLite database."""
+
+    def __init__(self, frontier_path: str = "data/frontier.sqlite",
+                 lease_seconds: float = 600.0, max_attempts: int = 3,
+                 worker_id: Optional[str] = None):
+        self.frontier_path = frontier_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or default_worker_id()
+        self.lock = threading.Lock()
+
+        Path(frontier_path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self.connection = sqlite3.connect(
+            frontier_path, timeout=60.0, isolation_level=None, check_same_thread=False
+        )
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                title TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS frontier_state ON frontier (state, lease_expires);
+            CREATE TABLE IF NOT EXISTS request_schedule (
+                host TEXT PRIMARY KEY,
+                theoretical_arrival REAL NOT NULL,
+                blocked_until REAL NOT NULL DEFAULT 0
+            );
+        """)
+
+    def _write(self, statements) -> Any:
+        """Run ``statements(cursor)`` in one write transaction shared with other processes."""
+        with self.lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(cursor)
+                cursor.execute("COMMIT")
+                return result
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+    # Titles
+
+    def add_titles(self, titles: Iterable[str]) -> int:
+        """Add titles to the frontier, returning how many were new."""
+        now = time.time()
+        rows = [(normalize_title(title), PENDING, now) for title in titles]
+
+        def insert(cursor):
+            before = self.connection.total_changes
+            cursor.executemany(
+                "INSERT OR IGNORE INTO frontier (title, state, updated) VALUES (?, ?, ?)", rows
+            )
+            return self.connection.total_changes - before
+
+        return self._write(insert)
+
+    def claim(self, limit: int) -> List[str]:
+        """Lease up to ``limit`` pending titles, including titles whose lease has expired."""
+        def lease(cursor):
+            now = time.time()
+            titles = [row[0] for row in cursor.execute(
+                "SELECT title FROM frontier WHERE state = ? OR (state = ? AND lease_expires < ?) "
+                "LIMIT ?",
+                (PENDING, LEASED, now, limit),
+            )]
+            cursor.executemany(
+                "UPDATE frontier SET state = ?, owner = ?, lease_expires = ?, updated = ? "
+                "WHERE title = ?",
+                [(LEASED, self.worker_id, now + self.lease_seconds, now, title) for title in titles],
+            )
+            return titles
+
+        return self._write(lease)
+
+    def complete(self, titles: Iterable[str]) -> None:
+        """Mark leased titles as done."""
+        self._finish(titles, DONE)
+
+    def release(self, titles: Iterable[str]) -> None:
+        """Give leased titles back without counting an attempt."""
+        self._finish(titles, PENDING)
+
+    def fail(self, titles: Iterable[str]) -> None:
+        """Record a failed attempt; titles are retried until ``max_attempts`` is reached."""
+        now = time.time()
+        rows = [(self.max_attempts, FAILED, PENDING, now, title, self.worker_id) for title in titles]
+        self._write(lambda cursor: cursor.executemany(
+            "UPDATE frontier SET attempts = attempts + 1, "
+            "state = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END, "
+            "owner = NULL, lease_expires = NULL, updated = ? WHERE title = ? AND owner = ?",
+            rows,
+        ))
+
+    def _finish(self, titles: Iterable[str], state: str) -> None:
+        now = time.time()
+        rows = [(state, now, title, self.worker_id) for title in titles]
+        # A title whose lease expired and was claimed by another worker is left to that worker
+        self._write(lambda cursor: cursor.executemany(
+            "UPDATE frontier SET state = ?, owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE title = ? AND owner = ?",
+            rows,
+        ))
+
+    def counts(self) -> Dict[str, int]:
+        """Count titles per state."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT state, COUNT(*) FROM frontier GROUP BY state"
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def is_drained(self) -> bool:
+        """Check whether no title is pending or leased any more."""
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    # Shared request schedule
+
+    def reserve_request(self, host: str, interval: float, burst: int,
+                        blocked_until: float = 0.0) -> float:
+        """Reserve the next request slot of ``host`` for all nodes, returning the wait.
+
+        This is a virtual-scheduling token bucket: slots are ``interval``
+        apart, up to ``burst`` of them may be taken early, and no slot is
+        handed out before a shared ``Retry-After`` block has passed.
+        """
+        def reserve(cursor):
+            now = time.time()
+            row = cursor.execute(
+                "SELECT theoretical_arrival, blocked_until FROM request_schedule WHERE host = ?",
+                (host,),
+            ).fetchone()
+            arrival, shared_block = row if row else (now, 0.0)
+            block = max(shared_block, blocked_until)
+            # The bucket is empty when a block ends: one slot then, the rest ``interval`` apart
+            start = max(arrival, now, block + (burst - 1) * interval)
+            cursor.execute(
+                "INSERT OR REPLACE INTO request_schedule (host, theoretical_arrival, blocked_until) "
+                "VALUES (?, ?, ?)",
+                (host, start + interval, block),
+            )
+            return max(0.0, start - now - (burst - 1) * interval)
+
+        return self._write(reserve)
+
+    def block_requests(self, host: str, seconds: float) -> None:
+        """Stop every node from sending requests to ``host`` for ``seconds``."""
+        until = time.time() + seconds
+        self._write(lambda cursor: cursor.execute(
+            "INSERT INTO request_schedule (host, theoretical_arrival, blocked_until) "
+            "VALUES (?, ?, ?) ON CONFLICT(host) DO UPDATE SET "
+            "blocked_until = MAX(blocked_until, excluded.blocked_until)",
+            (host, until, until),
+        ))
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedRateLimiter(RateLimiter):
+    """Rate limiter whose slots come from the frontier's shared request schedule.
+
+    The adaptive backoff of ``RateLimiter`` still applies per node, and a
+    server ``Retry-After`` blocks the host for every node.
+    """
+
+    def __init__(self, frontier: WorkFrontier, url: str, requests_per_second: float = 1.0,
+                 burst_limit: int = 5, **kwargs):
+        self.frontier = frontier
+        self.host = urlparse(url).netloc or url
+        super().__init__(requests_per_second, burst_limit, name=self.host, **kwargs)
+
+    def reserve(self) -> float:
+        with self.lock:
+            rate = self.rate
+        wait_time = self.frontier.reserve_request(self.host, 1.0 / rate, self.burst_limit)
+        with self.lock:
+            self.stats['requests'] += 1
+            if wait_time > 0:
+                self.stats['delayed_requests'] += 1
+                self.stats['total_wait_seconds'] += wait_time
+                self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], wait_time)
+        return wait_time
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        super().record_throttle(retry_after)
+        self.frontier.block_requests(self.host, retry_after if retry_after is not None else 1.0 / self.rate)
+
+
+class FrontierWorker:
+    """Collector loop that claims titles from a shared frontier until it is drained."""
+
+    def __init__(self, collector, frontier: WorkFrontier, output_path: str,
+                 batch_size: int = 50, idle_seconds: float = 5.0):
+        # Workers cut torn tails and append without locking, so each must own its file
+        if "{worker}" not in output_path:
+            raise ValueError(f"Worker output path {output_path} must contain a {{worker}} placeholder")
+        self.collector = collector
+        self.frontier = frontier
+        self.output_path = output_path.format(worker=frontier.worker_id)
+        self.batch_size = batch_size
+        self.idle_seconds = idle_seconds
+        self.stats = {
+            'batches': 0,
+            'claimed': 0,
+            'completed': 0,
+            'failed': 0,
+            'elapsed_seconds': 0.0
+        }
+
+        rate_config = collector.config["rate_limit"]
+        collector.rate_limiter = SharedRateLimiter(
+            frontier, collector.config["base_url"],
+            requests_per_second=rate_config["requests_per_second"],
+            burst_limit=rate_config["burst_limit"],
+        )
+
+    def _collect_batch(self, titles: List[str]) -> Tuple[List[Any], List[str], List[str]]:
+        """Fetch a claimed batch, returning its articles and the titles collected and failed."""
+        collector = self.collector
+        try:
+            collector.get_articles_by_titles(titles)
+        except Exception as e:
+            logger.error(f"Batch starting with {titles[0]} failed: {e}")
+            return [], [], titles
+
+        articles = {}
+        done, failed = [], []
+        for title in titles:
+            article = collector.get_collected_article(title)
+            if article is None:
+                failed.append(title)
+            else:
+                done.append(title)
+                articles.setdefault(article.title, article)
+
+        # Articles are handed to the store, so the in-memory state stays flat
+        for title in articles:
+            collector.collected_articles.pop(title, None)
+        collector.failed_articles.clear()
+        return list(articles.values()), done, failed
+
+    def run(self, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """Claim and collect batches until the frontier is drained, returning statistics."""
+        from src.collectors.article_store import append_article_batch, truncate_torn_tail
+
+        start = time.perf_counter()
+        logger.info(f"Worker {self.frontier.worker_id} writing to {self.output_path}")
+        # A batch torn by a crash was never completed; its titles come back when the lease expires
+        truncate_torn_tail(self.output_path)
+        while max_batches is None or self.stats['batches'] < max_batches:
+            titles = self.frontier.claim(self.batch_size)
+            if not titles:
+                if self.frontier.is_drained():
+                    break
+                # Other nodes still hold leases; they may expire and come back
+                time.sleep(self.idle_seconds)
+                continue
+
+            self.stats['batches'] += 1
+            self.stats['claimed'] += len(titles)
+            try:
+                articles, done, failed = self._collect_batch(titles)
+                # Titles are only marked done once their articles are safely on disk
+                append_article_batch(self.output_path, articles)
+            except BaseException:
+                # Hand the batch straight back instead of waiting for the lease to expire
+                self.frontier.release(titles)
+                raise
+            self.frontier.complete(done)
+            self.frontier.fail(failed)
+            self.stats['completed'] += len(done)
+            self.stats['failed'] += len(failed)
+
+        self.stats['elapsed_seconds'] = time.perf_counter() - start
+        return self.get_statistics()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        elapsed = stats['elapsed_seconds']
+        stats['articles_per_second'] = stats['completed'] / elapsed if elapsed else 0.0
+        stats['rate_limiter'] = self.collector.rate_limiter.get_statistics()
+        return stats
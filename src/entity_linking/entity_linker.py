@@ -9,19 +9,22 @@ algorithms and SPARQL queries.
 import json
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Set, Any
 from pathlib import Path
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import time
 
 import requests
-from SPARQLWrapper import SPARQLWrapper, JSON
 from Levenshtein import distance as levenshtein_distance
 from fuzzywuzzy import fuzz
 from unidecode import unidecode
 
 from src.collectors.wikipedia_collector import WikipediaArticle
+from src.collectors.title_aliases import TitleAliasTable
+from src.utils.http_transport import create_session, get_transport_statistics, sparql_query
+from src.utils.rate_limiter import THROTTLE_STATUS_CODES, get_rate_limiter, parse_retry_after
+from src.utils.uri_factory import get_uri_factory
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +44,14 @@ class EntityMatch:
 class EntityLinker:
     """Advanced entity linking system for Vietnamese-English DBPedia alignment."""
     
-    def __init__(self, dbpedia_endpoint: str = "https://dbpedia.org/sparql"):
+    def __init__(self, dbpedia_endpoint: str = "https://dbpedia.org/sparql",
+                 aliases: Optional[TitleAliasTable] = None):
         self.dbpedia_endpoint = dbpedia_endpoint
-        self.sparql = SPARQLWrapper(dbpedia_endpoint)
-        self.sparql.setReturnFormat(JSON)
+        # Shared with the collector so aliases and redirects link as one entity
+        self.aliases = aliases or TitleAliasTable()
+        
+        # Mints vires: URIs exactly as the RDF transformer does
+        self.uri_factory = get_uri_factory()
         
         # Caching for SPARQL results
         self.sparql_cache = {}
@@ -54,6 +61,9 @@ class EntityLinker:
         self.confidence_threshold = 0.8
         self.max_candidates = 10
         self.request_timeout = 30
+        self.http_pool_size = 10
+        self.wikipedia_api_url = "https://vi.wikipedia.org/w/api.php"
+        self.sparql_requests_per_second = 5.0
         
         # Statistics
         self.linking_stats = {
@@ -68,17 +78,25 @@ class EntityLinker:
         }
         
         self._setup_session()
+        self._setup_rate_limiters()
         self._load_name_mappings()
     
     def _setup_session(self) -> None:
-        """Set up HTTP session for external requests."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Vietnamese-DBPedia-EntityLinker/1.0'
-        })
-        self.session.timeout = self.request_timeout
+        """Set up the pooled HTTP session for Wikipedia and DBPedia requests."""
+        self.session = create_session(
+            headers={'User-Agent': 'Vietnamese-DBPedia-EntityLinker/1.0'},
+            timeout=self.request_timeout,
+            pool_size=self.http_pool_size
+        )
         logger.info("Entity linker HTTP session configured")
     
+    def _setup_rate_limiters(self) -> None:
+        """Share per-host rate limiters with any collector in the same process."""
+        self.sparql_rate_limiter = get_rate_limiter(
+            self.dbpedia_endpoint, requests_per_second=self.sparql_requests_per_second
+        )
+        self.wikipedia_rate_limiter = get_rate_limiter(self.wikipedia_api_url)
+    
     def _load_name_mappings(self) -> None:
         """Load predefined name mappings for Vietnamese entities."""
         self.name_mappings = {
@@ -117,6 +135,7 @@ class EntityLinker:
     def find_matching_entities(self, vietnamese_entity: str, 
                              entity_type: str = None) -> List[EntityMatch]:
         """Find matching English DBPedia entities for a Vietnamese entity."""
+        vietnamese_entity = self.aliases.resolve(vietnamese_entity)
         logger.info(f"Finding matches for: {vietnamese_entity}")
         
         self.linking_stats['entities_processed'] += 1
@@ -201,21 +220,30 @@ class EntityLinker:
                     return []
             
             # Query Vietnamese Wikipedia for language links
-            api_url = "https://vi.wikipedia.org/w/api.php"
             params = {
                 'action': 'query',
                 'format': 'json',
                 'titles': vietnamese_entity,
+                'redirects': 1,
                 'prop': 'langlinks',
                 'lllang': 'en',
                 'lllimit': 1
             }
             
-            response = self.session.get(api_url, params=params)
+            self.wikipedia_rate_limiter.acquire()
+            response = self.session.get(self.wikipedia_api_url, params=params)
+            if response.status_code in THROTTLE_STATUS_CODES:
+                self.wikipedia_rate_limiter.record_throttle(
+                    parse_retry_after(response.headers.get('Retry-After'))
+                )
+            else:
+                self.wikipedia_rate_limiter.record_success()
             response.raise_for_status()
             data = response.json()
             
-            pages = data.get('query', {}).get('pages', {})
+            query = data.get('query', {})
+            pages = query.get('pages', {})
+            self._record_aliases(query)
             for page_data in pages.values():
                 langlinks = page_data.get('langlinks', [])
                 
@@ -250,6 +278,18 @@ class EntityLinker:
             self.language_links_cache[cache_key] = None
             return []
     
+    def _record_aliases(self, query: Dict[str, Any]) -> None:
+        """Learn the normalizations and redirects reported by a Wikipedia query."""
+        pages_by_title = {
+            page_data.get('title'): page_data for page_data in query.get('pages', {}).values()
+        }
+        entries = []
+        for item in query.get('normalized', []) + query.get('redirects', []):
+            page_data = pages_by_title.get(item['to'], {})
+            if 'missing' not in page_data:
+                entries.append((item['from'], item['to'], page_data.get('pageid')))
+        self.aliases.add_many(entries)
+
     def _find_similarity_matches(self, vietnamese_entity: str, 
                                entity_type: str = None) -> List[EntityMatch]:
         """Find matches using string similarity algorithms."""
@@ -551,8 +591,16 @@ class EntityLinker:
             return self.sparql_cache[cache_key]
         
         try:
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
+            self.sparql_rate_limiter.acquire()
+            try:
+                results = sparql_query(self.session, self.dbpedia_endpoint, query)
+            except requests.exceptions.HTTPError as e:
+                if e.response is not None and e.response.status_code in THROTTLE_STATUS_CODES:
+                    self.sparql_rate_limiter.record_throttle(
+                        parse_retry_after(e.response.headers.get('Retry-After'))
+                    )
+                raise
+            self.sparql_rate_limiter.record_success()
             
             # Cache results
             self.sparql_cache[cache_key] = results
@@ -575,27 +623,53 @@ class EntityLinker:
         
         return list(unique_matches.values())
     
-    def link_articles_batch(self, articles: List[WikipediaArticle]) -> Dict[str, List[EntityMatch]]:
-        """Link a batch of articles to English DBPedia entities."""
-        logger.info(f"Linking {len(articles)} articles to English DBPedia")
+    def link_articles_batch(self, articles: Iterable[WikipediaArticle],
+                            max_workers: int = 3) -> Dict[str, List[EntityMatch]]:
+        """Link a batch of articles to English DBPedia entities.
+
+        Articles are pulled lazily from the iterable with a bounded number of
+        lookups in flight, so only titles are retained, not whole articles.
+        Titles naming the same page (aliases, redirects) are linked once, and
+        the results are keyed by the titles of the given articles.
+        """
+        logger.info("Linking articles to English DBPedia")
         
         all_matches = {}
-        
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_article = {
-                executor.submit(self.find_matching_entities, article.title): article.title
-                for article in articles
-            }
-            
-            for future in as_completed(future_to_article):
-                article_title = future_to_article[future]
-                try:
-                    matches = future.result()
-                    all_matches[article_title] = matches
-                except Exception as e:
-                    logger.error(f"Failed to link {article_title}: {e}")
-                    all_matches[article_title] = []
-        
+        max_pending = max_workers * 4
+        # Canonical title -> requested titles, and the matches of canonical titles already linked
+        requested: Dict[str, List[str]] = {}
+        linked: Dict[str, List[EntityMatch]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            
+            def collect(done):
+                for future in done:
+                    title = pending.pop(future)
+                    try:
+                        linked[title] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to link {title}: {e}")
+                        linked[title] = []
+                    for article_title in requested[title]:
+                        all_matches[article_title] = linked[title]
+            
+            for article in articles:
+                title = self.aliases.resolve(article.title)
+                if title in requested:
+                    requested[title].append(article.title)
+                    if title in linked:
+                        all_matches[article.title] = linked[title]
+                    continue
+                requested[title] = [article.title]
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(self.find_matching_entities, title)] = title
+            
+            collect(wait(pending).done)
+        
+        logger.info(f"Linked {len(all_matches)} articles")
         return all_matches
     
     def save_linking_results(self, matches: Dict[str, List[EntityMatch]], 
@@ -638,7 +712,7 @@ class EntityLinker:
             
             # Create graph and namespaces
             g = Graph()
-            VIRES = Namespace('http://vi.dbpedia.org/resource/')
+            VIRES = Namespace(self.uri_factory.bases['resource'])
             DBPEDIA = Namespace('http://dbpedia.org/resource/')
             
             # Bind namespaces
@@ -649,9 +723,8 @@ class EntityLinker:
             
             # Add entity links as RDF triples
             for entity, match_list in matches.items():
-                # Create Vietnamese entity URI
-                entity_encoded = quote(entity.replace(' ', '_'), safe='')
-                vi_uri = VIRES[entity_encoded]
+                # Create Vietnamese entity URI, as the transformer mints it
+                vi_uri = self.uri_factory.resource(entity)
                 
                 for match in match_list:
                     # Skip self-links (Vietnamese entity linking to itself)
@@ -733,6 +806,14 @@ class EntityLinker:
     def get_linking_statistics(self) -> Dict[str, Any]:
         """Get entity linking statistics."""
         stats = self.linking_stats.copy()
+        sparql_limiter_stats = self.sparql_rate_limiter.get_statistics()
+        stats['sparql_wait_seconds'] = sparql_limiter_stats['total_wait_seconds']
+        stats['sparql_throttled_responses'] = sparql_limiter_stats['throttled_responses']
+        http_stats = get_transport_statistics(self.session)
+        stats['http_new_connections'] = http_stats.get('new_connections', 0)
+        stats['http_reused_connections'] = http_stats.get('reused_connections', 0)
+        stats['http_mean_latency_seconds'] = http_stats.get('mean_latency_seconds', 0.0)
+        stats['uri_cache_hit_rate'] = self.uri_factory.get_statistics()['hit_rate']
         
         if stats['entities_processed'] > 0:
             stats['success_rate'] = (stats['successful_links'] / stats['entities_processed']) * 100
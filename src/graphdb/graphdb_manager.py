@@ -16,6 +16,8 @@ from urllib.parse import urljoin
 import io
 from requests.auth import HTTPBasicAuth
 
+from src.utils.http_transport import create_session, get_transport_statistics, upload_timeout
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +31,7 @@ class GraphDBManager:
     
     def __init__(self, config_path: str = "config/graphdb.yaml"):
         self.config_path = config_path
-        self.session = requests.Session()
+        self.session: Optional[requests.Session] = None
         self.base_url = None
         self.repositories = {}
         
@@ -56,21 +58,25 @@ class GraphDBManager:
             raise GraphDBError(f"Configuration error: {e}")
     
     def _setup_session(self) -> None:
-        """Set up HTTP session for GraphDB API calls."""
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
-        
-        # Set authentication if provided
+        """Set up the pooled HTTP session for GraphDB API calls."""
+        auth = None
         if self.graphdb_config.get('username') and self.graphdb_config.get('password'):
-            self.session.auth = HTTPBasicAuth(
+            auth = HTTPBasicAuth(
                 self.graphdb_config['username'],
                 self.graphdb_config['password']
             )
         
-        # Set timeout
-        self.session.timeout = self.graphdb_config.get('timeout', 30)
+        self.session = create_session(
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            timeout=self.graphdb_config.get('timeout', 30),
+            pool_size=self.graphdb_config.get('pool_size', 10),
+            auth=auth
+        )
+        # Bulk /statements uploads can run far longer than an API call
+        self.upload_timeout = upload_timeout(self.graphdb_config.get('upload_timeout'))
         logger.info("GraphDB session configured")
     
     def _check_connection(self) -> None:
@@ -238,7 +244,8 @@ class GraphDBManager:
                 url,
                 params=params,
                 data=data,
-                headers={'Content-Type': content_type}
+                headers={'Content-Type': content_type},
+                timeout=self.upload_timeout
             )
             
             if response.status_code == 204:  # No Content - success
@@ -282,7 +289,8 @@ class GraphDBManager:
                 url,
                 params=params,
                 data=rdf_data.encode('utf-8'),
-                headers={'Content-Type': content_type}
+                headers={'Content-Type': content_type},
+                timeout=self.upload_timeout
             )
             
             if response.status_code == 204:
@@ -532,6 +540,10 @@ class GraphDBManager:
         except Exception as e:
             logger.error(f"Repository setup failed: {e}")
             return False
+    
+    def get_http_statistics(self) -> Dict[str, Any]:
+        """Get request, latency and connection reuse counters of the GraphDB session."""
+        return get_transport_statistics(self.session)
 
 
 def main():
@@ -14,10 +14,12 @@ from pathlib import Path
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from SPARQLWrapper import SPARQLWrapper, JSON, XML, TURTLE, N3
 import requests
+from rdflib import Graph
 
 from src.graphdb.graphdb_manager import GraphDBManager
+from src.utils.http_transport import create_session, sparql_query
+from src.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -70,9 +72,11 @@ class SPARQLInterface:
                 self.local_endpoint = f"{base_url}/repositories/{config['id']}"
                 logger.info(f"Local SPARQL endpoint: {self.local_endpoint}")
             
-            # Set up DBPedia endpoint
-            self.dbpedia_sparql = SPARQLWrapper(self.dbpedia_endpoint)
-            self.dbpedia_sparql.setReturnFormat(JSON)
+            # Set up DBPedia endpoint; its own session so GraphDB credentials never leave
+            self.dbpedia_session = create_session(
+                headers={'User-Agent': 'Vietnamese-DBPedia-SPARQLInterface/1.0'}
+            )
+            self.dbpedia_rate_limiter = get_rate_limiter(self.dbpedia_endpoint)
             logger.info("SPARQL endpoints configured")
             
         except Exception as e:
@@ -244,9 +248,12 @@ class SPARQLInterface:
     
     def _execute_dbpedia_query(self, query: str, timeout: int) -> Dict[str, Any]:
         """Execute query on DBPedia SPARQL endpoint."""
-        self.dbpedia_sparql.setQuery(query)
-        self.dbpedia_sparql.setTimeout(timeout)
-        return self.dbpedia_sparql.query().convert()
+        self.dbpedia_rate_limiter.acquire()
+        results = sparql_query(self.dbpedia_session, self.dbpedia_endpoint, query, timeout=timeout)
+        if isinstance(results, Graph):
+            # Same shape as CONSTRUCT/DESCRIBE results from the local endpoint
+            return {'rdf_data': results.serialize(format='xml')}
+        return results
     
     def _execute_federated_query(self, query: str, timeout: int) -> Dict[str, Any]:
         """Execute federated query across local and remote endpoints."""
@@ -15,6 +15,8 @@ from pathlib import Path
 
 from src.graphdb.graphdb_manager import GraphDBManager
 from src.interfaces.sparql_interface import SPARQLInterface, QueryResult
+from src.collectors.indexed_store import open_article_index
+from src.collectors.title_aliases import normalize_title
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +28,20 @@ CORS(app)
 # Global variables for application components
 graphdb_manager = None
 sparql_interface = None
+article_index = None
 
 
-def initialize_app():
+def initialize_app(articles_path: Optional[str] = None):
     """Initialize the web application with required components."""
-    global graphdb_manager, sparql_interface
+    global graphdb_manager, sparql_interface, article_index
     
     try:
         graphdb_manager = GraphDBManager()
         sparql_interface = SPARQLInterface(graphdb_manager)
+        if articles_path and os.path.exists(articles_path):
+            # Memory-mapped, so every server worker shares the same pages
+            article_index = open_article_index(articles_path)
+            logger.info(f"Serving {len(article_index)} source articles from {articles_path}")
         logger.info("Web application initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize web application: {e}")
@@ -172,6 +179,18 @@ def api_entity_details(entity_uri: str):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/article/<path:title>')
+def api_source_article(title: str):
+    """API endpoint for the collected Wikipedia article behind an entity."""
+    if article_index is None:
+        return jsonify({'error': 'No article store configured'}), 404
+
+    article = article_index.get(normalize_title(title))
+    if article is None:
+        return jsonify({'success': False, 'error': f'Article not found: {title}'}), 404
+    return jsonify({'success': True, 'article': article})
+
+
 @app.route('/api/sparql', methods=['POST'])
 def api_sparql_query():
     """API endpoint for SPARQL queries."""
@@ -617,14 +636,14 @@ document.addEventListener('DOMContentLoaded', function() {
         f.write(js_content)
 
 
-def run_web_interface(host='0.0.0.0', port=5000, debug=False):
+def run_web_interface(host='0.0.0.0', port=5000, debug=False, articles_path=None):
     """Run the web interface."""
     try:
         # Create templates if they don't exist
         create_templates()
         
         # Initialize application
-        initialize_app()
+        initialize_app(articles_path)
         
         logger.info(f"Starting Vietnamese DBPedia web interface on {host}:{port}")
         app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,118 @@
+"""
+Category Classifier Module
+
+This module guesses the ontology class of an article from its Wikipedia
+categories. The keyword -> class table in ``config/ontology.yaml`` is
+compiled once into a single regular expression shaped like a trie of the
+keywords, so every category is scanned in one pass for all keywords at
+once. Keyword matches are memoized per category string because the same
+categories recur on thousands of articles. Instead of the first keyword
+that happens to match, callers get every candidate class ranked by how many
+categories vote for it.
+"""
+
+import re
+import logging
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 65536
+
+
+def normalize_keyword(text: str) -> str:
+    """Normalize text for keyword matching: NFC and case-folded."""
+    return unicodedata.normalize('NFC', text).casefold()
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex alternation that shares the common prefixes of the keywords."""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here, so the longer continuations are optional
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class CategoryClassifier:
+    """Single-pass multi-keyword classifier of article categories."""
+
+    def __init__(self, keywords: Dict[str, str], cache_size: int = DEFAULT_CACHE_SIZE):
+        self.keywords = {normalize_keyword(keyword): class_name for keyword, class_name in keywords.items()}
+        # Keywords only match whole words, and the trie tries longer keywords first
+        self.pattern = re.compile(r'(?<!\w)(?:' + _trie_pattern(self.keywords) + r')(?!\w)') \
+            if self.keywords else None
+        self._cached_match = lru_cache(maxsize=cache_size)(self._match)
+        logger.info(f"Compiled {len(self.keywords)} category keywords")
+
+    @classmethod
+    def from_config(cls, config_path: str = "config/ontology.yaml") -> 'CategoryClassifier':
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file)
+        return cls(config.get('mappings', {}).get('category_keywords', {}))
+
+    def _match(self, category: str) -> Tuple[Tuple[str, int], ...]:
+        if self.pattern is None:
+            return ()
+        # Each matched class once, with the length of its longest keyword
+        longest: Dict[str, int] = {}
+        for keyword in self.pattern.findall(normalize_keyword(category)):
+            class_name = self.keywords[keyword]
+            longest[class_name] = max(longest.get(class_name, 0), len(keyword))
+        return tuple(longest.items())
+
+    def match(self, category: str) -> Tuple[Tuple[str, int], ...]:
+        """Get the ``(class_name, keyword_length)`` pairs matched in one category, memoized."""
+        return self._cached_match(category)
+
+    def rank(self, categories: Iterable[str]) -> List[Tuple[str, int]]:
+        """Rank candidate classes for a list of categories.
+
+        Returns ``(class_name, votes)`` pairs, best first. A class gets one
+        vote per category containing one of its keywords; ties go to the
+        class with the longer keyword, then to the one matched first.
+        """
+        votes: Dict[str, int] = {}
+        longest: Dict[str, int] = {}
+        for category in categories:
+            for class_name, length in self._cached_match(category):
+                votes[class_name] = votes.get(class_name, 0) + 1
+                if length > longest.get(class_name, 0):
+                    longest[class_name] = length
+
+        if len(votes) < 2:
+            return list(votes.items())
+        order = {class_name: position for position, class_name in enumerate(votes)}
+        ranked = sorted(votes, key=lambda class_name: (-votes[class_name], -longest[class_name],
+                                                       order[class_name]))
+        return [(class_name, votes[class_name]) for class_name in ranked]
+
+    def classify(self, categories: Iterable[str]) -> Optional[str]:
+        """Get the best candidate class, or None if no keyword matches."""
+        ranked = self.rank(categories)
+        return ranked[0][0] if ranked else None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        info = self._cached_match.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'keywords': len(self.keywords),
+            'cache_hits': info.hits,
+            'cache_misses': info.misses,
+            'cache_hit_rate': info.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,93 @@
+"""
+Streaming N-Triples Writer
+
+This module writes triples straight to an N-Triples or N-Quads file (or any
+binary stream, such as a socket's ``makefile('wb')``) as they are produced,
+instead of collecting them in an rdflib Graph and serializing it at the end.
+Lines are buffered and flushed in chunks, so memory use is bounded by the
+chunk size rather than by the size of the corpus.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, BinaryIO, Union
+
+from rdflib import URIRef
+from rdflib.plugins.serializers.nt import _nt_row
+from rdflib.plugins.serializers.nquads import _nq_row
+
+logger = logging.getLogger(__name__)
+
+NTRIPLES_SUFFIX = ".nt"
+NQUADS_SUFFIX = ".nq"
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class NTriplesWriter:
+    """Chunked writer of N-Triples, or N-Quads when a ``graph`` name is given."""
+
+    def __init__(self, destination: Union[str, BinaryIO], graph: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.graph = URIRef(graph) if graph else None
+        self.chunk_size = chunk_size
+        self.lines: List[str] = []
+        self.stats = {
+            'triples_written': 0,
+            'bytes_written': 0,
+            'flushes': 0
+        }
+
+        if isinstance(destination, (str, Path)):
+            self.output_path = str(destination)
+            Path(destination).parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(destination, "wb")
+            self.owns_file = True
+        else:
+            self.output_path = None
+            self.file = destination
+            self.owns_file = False
+
+    def write(self, triple) -> None:
+        if self.graph is not None:
+            self.lines.append(_nq_row(triple, self.graph))
+        else:
+            self.lines.append(_nt_row(triple))
+        if len(self.lines) >= self.chunk_size:
+            self.flush()
+
+    def write_all(self, triples: Iterable) -> int:
+        """Write every triple of an iterable, returning how many were written."""
+        before = self.stats['triples_written'] + len(self.lines)
+        for triple in triples:
+            self.write(triple)
+        return self.stats['triples_written'] + len(self.lines) - before
+
+    def flush(self) -> None:
+        if not self.lines:
+            return
+        data = "".join(self.lines).encode("utf-8")
+        self.file.write(data)
+        self.file.flush()
+        self.stats['triples_written'] += len(self.lines)
+        self.stats['bytes_written'] += len(data)
+        self.stats['flushes'] += 1
+        self.lines = []
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+        self.file = None
+        logger.info(f"Wrote {self.stats['triples_written']} triples"
+                    + (f" to {self.output_path}" if self.output_path else ""))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return dict(self.stats)
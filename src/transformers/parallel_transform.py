@@ -0,0 +1,152 @@
+"""
+Parallel RDF Transformation Module
+
+This module shards the articles of an input file across a process pool.
+The input is opened as a memory-mapped indexed store (``.aix``, built next
+to the file on first use), so a shard is just a range of record positions
+and every worker reads its own articles instead of having them parsed and
+pickled by the parent. Each worker process builds its own RDFTransformer,
+so the ontology is loaded once per worker rather than once per shard, and
+streams the triples of its shards into a partial N-Quads file of its own.
+A merge step then concatenates the partial files into the final output, or
+loads them into a graph for the formats that need one, and sums the
+workers' ``transformation_stats``.
+"""
+
+import os
+import time
+import shutil
+import logging
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+from rdflib import Graph
+
+from src.collectors.article_store import iter_articles
+from src.collectors.indexed_store import IndexedArticleStore, open_article_index
+from src.collectors.wikipedia_collector import WikipediaArticle
+from src.transformers.rdf_transformer import RDFTransformer
+from src.transformers.ntriples_writer import NTriplesWriter, NQUADS_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_PREFIX = "part-"
+
+# Per-process state, set up once by _init_worker
+_store: Optional[IndexedArticleStore] = None
+_transformer: Optional[RDFTransformer] = None
+_writer: Optional[NTriplesWriter] = None
+
+
+def _init_worker(store_path: str, config_path: str, shard_dir: str, graph: Optional[str]) -> None:
+    global _store, _transformer, _writer
+    _store = IndexedArticleStore(store_path)
+    _transformer = RDFTransformer(config_path=config_path)
+    _writer = NTriplesWriter(str(Path(shard_dir) / f"{PARTIAL_PREFIX}{os.getpid()}{NQUADS_SUFFIX}"), graph=graph)
+
+
+def _transform_shard(start: int, stop: int) -> Tuple[int, Dict[str, Any]]:
+    """Transform the articles at positions ``start:stop`` into this worker's partial file.
+
+    Returns the worker's pid and its running transformation statistics.
+    """
+    _writer.write_all(_transformer.iter_triples(WikipediaArticle(**_store[position])
+                                                for position in range(start, stop)))
+    # Nothing stays buffered between shards, so the file is complete whenever the process exits
+    _writer.flush()
+    return os.getpid(), _transformer.get_transformation_statistics()
+
+
+def merge_transformation_stats(worker_stats: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the ``transformation_stats`` of several transformers."""
+    merged: Dict[str, Any] = {}
+    for stats in worker_stats:
+        for key, value in stats.items():
+            if key == 'current_graph_size':
+                continue
+            if isinstance(value, dict):
+                mappings = merged.setdefault(key, {})
+                for sub_key, count in value.items():
+                    mappings[sub_key] = mappings.get(sub_key, 0) + count
+            else:
+                merged[key] = merged.get(key, 0) + value
+    merged.setdefault('template_mappings', {})
+    for cache in ('uri_cache', 'literal_cache'):
+        if f'{cache}_hit_rate' in merged:
+            lookups = merged[f'{cache}_hits'] + merged[f'{cache}_misses']
+            merged[f'{cache}_hit_rate'] = merged[f'{cache}_hits'] / lookups if lookups else 0.0
+    return merged
+
+
+def transform_parallel(input_path: str, shard_dir: str, workers: Optional[int] = None,
+                       shard_size: int = 200, graph: Optional[str] = None,
+                       config_path: str = "config/ontology.yaml") -> Tuple[List[str], Dict[str, Any]]:
+    """Transform an article file into one partial N-Quads file per worker process.
+
+    Workers take ``shard_size`` consecutive articles at a time. Returns the
+    partial file paths and the merged transformation statistics.
+    Triples of categories and places shared by articles of different workers
+    appear in more than one partial file; RDF stores drop such duplicates.
+    """
+    Path(shard_dir).mkdir(parents=True, exist_ok=True)
+    for stale in Path(shard_dir).glob(f"{PARTIAL_PREFIX}*{NQUADS_SUFFIX}"):
+        stale.unlink()
+
+    start = time.perf_counter()
+    latest: Dict[int, Dict[str, Any]] = {}
+
+    if workers == 1:
+        transformer = RDFTransformer(config_path=config_path)
+        transformer.stream_rdf(iter_articles(input_path),
+                               str(Path(shard_dir) / f"{PARTIAL_PREFIX}0{NQUADS_SUFFIX}"), graph=graph)
+        latest[0] = transformer.get_transformation_statistics()
+    else:
+        workers = workers or os.cpu_count() or 1
+        with open_article_index(input_path) as store:
+            store_path, total = store.store_path, len(store)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(store_path, config_path, shard_dir, graph)) as executor:
+            # Keep a bounded number of shards in flight so results are collected as they finish
+            pending = deque()
+            for shard_start in range(0, total, shard_size):
+                pending.append(executor.submit(_transform_shard, shard_start,
+                                               min(shard_start + shard_size, total)))
+                if len(pending) >= workers * 2:
+                    pid, stats = pending.popleft().result()
+                    latest[pid] = stats
+            while pending:
+                pid, stats = pending.popleft().result()
+                latest[pid] = stats
+
+    # Each worker reports running totals, so only its latest report counts
+    stats = merge_transformation_stats(latest.values())
+    stats['workers'] = len(latest)
+    stats['elapsed_seconds'] = round(time.perf_counter() - start, 2)
+    partials = sorted(str(path) for path in Path(shard_dir).glob(f"{PARTIAL_PREFIX}*{NQUADS_SUFFIX}"))
+    logger.info(f"Transformed {stats.get('articles_processed', 0)} articles into "
+                f"{stats.get('triples_generated', 0)} triples across {len(partials)} partial files "
+                f"in {stats['elapsed_seconds']:.1f}s")
+    return partials, stats
+
+
+def merge_partials(partials: Iterable[str], output_path: str) -> int:
+    """Concatenate partial N-Triples/N-Quads files into one, returning its size in bytes."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as output:
+        for partial in partials:
+            with open(partial, "rb") as file:
+                shutil.copyfileobj(file, output, 1024 * 1024)
+        size = output.tell()
+    logger.info(f"Merged partial files into {output_path} ({size} bytes)")
+    return size
+
+
+def load_partials(partials: Iterable[str], graph: Optional[Graph] = None) -> Graph:
+    """Load partial files written without a named graph into one rdflib Graph."""
+    graph = graph if graph is not None else Graph()
+    for partial in partials:
+        graph.parse(partial, format="nt")
+    return graph
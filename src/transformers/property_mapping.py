@@ -0,0 +1,75 @@
+"""
+Infobox Property Mapping Module
+
+This module maps Wikipedia infobox field names to ontology properties using
+the ``mappings.infobox_properties`` table of ``config/ontology.yaml``. Field
+names are normalized once, when the table is compiled, so that spelling
+variants found in the wild (``Ngày_sinh``, ``ngày  sinh``, decomposed
+Unicode and, optionally, ``ngay sinh`` typed without diacritics) all land on
+the same property.
+"""
+
+import re
+import logging
+import unicodedata
+from typing import Dict, Optional, Any
+
+from unidecode import unidecode
+
+logger = logging.getLogger(__name__)
+
+_SPACES = re.compile(r'[\s_]+')
+
+
+def normalize_field_name(name: str) -> str:
+    """Normalize an infobox field name: NFC, case-folded, single spaces for underscores and blanks."""
+    return _SPACES.sub(' ', unicodedata.normalize('NFC', name).casefold()).strip()
+
+
+def fold_diacritics(text: str) -> str:
+    """Strip Vietnamese diacritics, including đ -> d."""
+    return unidecode(text)
+
+
+class InfoboxPropertyMap:
+    """Compiled infobox field name -> ontology property name table."""
+
+    def __init__(self, mapping: Dict[str, str], fold: bool = True):
+        self.fold = fold
+        self.table: Dict[str, str] = {}
+        for field_name, property_name in mapping.items():
+            key = normalize_field_name(field_name)
+            if key in self.table and self.table[key] != property_name:
+                logger.warning(f"Infobox field '{field_name}' mapped to both "
+                               f"{self.table[key]} and {property_name}; keeping {self.table[key]}")
+                continue
+            self.table.setdefault(key, property_name)
+
+        # Diacritic-free spellings never shadow a configured field name
+        self.folded: Dict[str, str] = {}
+        if fold:
+            for key, property_name in self.table.items():
+                folded = fold_diacritics(key)
+                if folded not in self.table:
+                    self.folded.setdefault(folded, property_name)
+
+        logger.info(f"Loaded {len(self.table)} property mappings")
+
+    def get(self, field_name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get the property of an infobox field name as found in an article."""
+        key = normalize_field_name(field_name)
+        property_name = self.table.get(key)
+        # Only names written without diacritics fall back to the folded table, so
+        # "tình" does not turn into "tỉnh"
+        if property_name is None and self.fold and key.isascii():
+            property_name = self.folded.get(key)
+        return default if property_name is None else property_name
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'fields': len(self.table),
+            'diacritic_free_variants': len(self.folded)
+        }
@@ -8,20 +8,33 @@ to RDF format using the Vietnamese ontology and proper semantic mapping.
 import json
 import yaml
 import logging
-import re
-from typing import Dict, List, Optional, Set, Any, Tuple
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Any, Tuple, BinaryIO, Union
 from pathlib import Path
 from datetime import datetime
-from urllib.parse import quote
 
 from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL, XSD
 from rdflib.namespace import FOAF, DCTERMS
 
 from src.ontology.vietnam_ontology import VietnamOntology
 from src.collectors.wikipedia_collector import WikipediaArticle
+from src.transformers.ntriples_writer import NTriplesWriter, DEFAULT_CHUNK_SIZE
+from src.transformers.category_classifier import CategoryClassifier
+from src.transformers.property_mapping import InfoboxPropertyMap
+from src.transformers.literal_parsers import LiteralParser
+from src.utils.uri_factory import clean_title, get_uri_factory
 
 logger = logging.getLogger(__name__)
 
+Triple = Tuple[Any, Any, Any]
+
+DESCRIBED_CACHE_SIZE = 100000
+FIELD_BINDINGS_SIZE = 100000
+LITERAL_BATCH_SIZE = 256
+
+_UNBOUND = object()
+
 
 class RDFTransformer:
     """Comprehensive RDF transformation pipeline for Vietnamese Wikipedia data."""
@@ -31,6 +44,11 @@ class RDFTransformer:
         self.graph = Graph()
         self.entity_count = 0
         self.triple_count = 0
+        self._triples: List[Triple] = []
+        # Category and place nodes described recently, so shared nodes are not
+        # emitted again for every article that mentions them
+        self._described: OrderedDict = OrderedDict()
+        self.described_cache_size = DESCRIBED_CACHE_SIZE
         self.transformation_stats = {
             'articles_processed': 0,
             'entities_created': 0,
@@ -40,6 +58,21 @@ class RDFTransformer:
             'template_mappings': {}
         }
         
+        # Shared with the entity linker, so both mint the same URI for a title
+        self.uri_factory = get_uri_factory(self.ontology.ontology_config)
+        
+        # Keyword -> class table from the ontology config, compiled once
+        self.category_classifier = CategoryClassifier(
+            self.ontology.mapping_config.get('category_keywords', {})
+        )
+        # Dates, numbers and coordinates, memoized per raw value
+        self.literal_parser = LiteralParser()
+        self.superclasses = {
+            subclass: class_name
+            for class_name, class_info in self.ontology.class_config.items()
+            for subclass in class_info.get('subclasses', [])
+        }
+        
         self._setup_namespaces()
         self._load_property_mappings()
     
@@ -52,81 +85,83 @@ class RDFTransformer:
         logger.info("RDF namespaces configured")
     
     def _load_property_mappings(self) -> None:
-        """Load property mappings for Vietnamese Wikipedia infoboxes."""
-        self.property_mappings = {
-            # Person properties
-            'ngày sinh': 'birthDate',
-            'sinh': 'birthDate',
-            'nơi sinh': 'birthPlace',
-            'quê quán': 'birthPlace',
-            'ngày mất': 'deathDate',
-            'mất': 'deathDate',
-            'nơi mất': 'deathPlace',
-            'nghề nghiệp': 'occupation',
-            'quốc tịch': 'nationality',
-            'dân tộc': 'ethnicity',
-            
-            # Place properties
-            'tọa độ': 'coordinates',
-            'diện tích': 'area',
-            'dân số': 'population',
-            'thành lập': 'foundingDate',
-            'múi giờ': 'timeZone',
-            'tỉnh': 'province',
-            'quận': 'district',
-            'phường': 'ward',
-            
-            # Organization properties
-            'thành lập': 'foundingDate',
-            'trụ sở': 'headquarters',
-            'giám đốc': 'director',
-            'hiệu trưởng': 'rector',
-            
-            # General properties
-            'tên': 'name',
-            'tên đầy đủ': 'fullName',
-            'tên khác': 'alternateName',
-            'mô tả': 'description',
-            'website': 'homepage',
-            'hình ảnh': 'image'
+        """Load property mappings for Vietnamese Wikipedia infoboxes and bind their converters."""
+        mapping_config = self.ontology.mapping_config
+        self.property_mappings = InfoboxPropertyMap(
+            mapping_config.get('infobox_properties', {}),
+            fold=mapping_config.get('infobox_fold_diacritics', True)
+        )
+        
+        converters = {
+            'date': self._convert_date,
+            'number': self._convert_number,
+            'place': self._convert_place,
+            'url': self._convert_url,
+            'coordinates': self._convert_coordinates,
+            'literal': self._convert_literal
+        }
+        # Converters whose values the literal parser can parse ahead, a column at a time
+        self._converter_kinds: Dict[Callable, str] = {
+            converters[kind]: kind for kind in self.literal_parser.kinds
         }
+        property_converters = mapping_config.get('property_converters', {})
+        unknown = set(property_converters.values()) - set(converters)
+        if unknown:
+            raise ValueError(f"Unknown property converters: {', '.join(sorted(unknown))}")
+        
+        # Property name -> (property URI, converter); None for properties the ontology lacks
+        self.property_bindings: Dict[str, Optional[Tuple[URIRef, Callable]]] = {}
+        for property_name in set(self.property_mappings.table.values()):
+            property_uri = self.ontology.get_property_uri(property_name)
+            self.property_bindings[property_name] = (
+                property_uri, converters[property_converters.get(property_name, 'literal')]
+            ) if property_uri else None
+        
+        # Infobox field name as found in articles -> binding, filled on first sight
+        self._field_bindings: Dict[str, Optional[Tuple[URIRef, Callable]]] = {}
+    
+    def _bind_field(self, key: str) -> Optional[Tuple[URIRef, Callable]]:
+        """Resolve the property URI and converter of an infobox field name."""
+        property_name = self.property_mappings.get(key)
+        if property_name:
+            binding = self.property_bindings[property_name]
+        else:
+            # Create a custom property for unmapped infobox fields
+            binding = (self.create_entity_uri(key, 'property'), self._convert_unmapped)
         
-        logger.info(f"Loaded {len(self.property_mappings)} property mappings")
+        if len(self._field_bindings) < FIELD_BINDINGS_SIZE:
+            self._field_bindings[key] = binding
+        return binding
     
     def create_entity_uri(self, title: str, entity_type: str = 'resource') -> URIRef:
         """Create a properly formatted URI for Vietnamese entities."""
-        # Clean and encode the title
-        cleaned_title = self._clean_title_for_uri(title)
-        
-        if entity_type == 'resource':
-            base_uri = self.ontology.ontology_config['resource_uri']
-        elif entity_type == 'property':
-            base_uri = self.ontology.ontology_config['property_uri']
-        else:
-            base_uri = self.ontology.ontology_config['base_uri']
-        
-        return URIRef(base_uri + quote(cleaned_title, safe=''))
+        return self.uri_factory.mint(title, entity_type)
     
     def _clean_title_for_uri(self, title: str) -> str:
         """Clean Wikipedia title for use in URIs."""
-        # Replace spaces with underscores
-        cleaned = title.replace(' ', '_')
-        
-        # Remove special characters but keep Vietnamese diacritics
-        cleaned = re.sub(r'[^\w\u00C0-\u1EF9]', '_', cleaned)
-        
-        # Remove multiple underscores
-        cleaned = re.sub(r'_+', '_', cleaned)
-        
-        # Remove leading/trailing underscores
-        cleaned = cleaned.strip('_')
-        
-        return cleaned
+        return clean_title(title)
     
     def transform_article(self, article: WikipediaArticle) -> int:
         """Transform a Wikipedia article to RDF triples."""
-        logger.info(f"Transforming article: {article.title}")
+        triples = self.article_triples(article)
+        if not triples:
+            return 0
+        
+        for triple in triples:
+            self.graph.add(triple)
         
+        # The first triple is always the rdf:type of the article entity
+        return len(list(self.graph.triples((triples[0][0], None, None))))
+    
+    def article_triples(self, article: WikipediaArticle) -> List[Triple]:
+        """Build the triples of one article without adding them to the graph.
+        
+        The first triple is the rdf:type of the article entity. An empty list
+        means the article could not be transformed.
+        """
+        logger.debug(f"Transforming article: {article.title}")
+        
+        self._triples = []
         try:
             # Create entity URI
             entity_uri = self.create_entity_uri(article.title)
@@ -136,7 +171,7 @@ class RDFTransformer:
             
             if entity_class:
                 # Add type information
-                self.graph.add((entity_uri, RDF.type, entity_class))
+                self._emit(entity_uri, RDF.type, entity_class)
                 
                 # Add basic properties
                 self._add_basic_properties(entity_uri, article)
@@ -161,18 +196,81 @@ class RDFTransformer:
                     self.transformation_stats['template_mappings'][template_type] = \
                         self.transformation_stats['template_mappings'].get(template_type, 0) + 1
                 
-                logger.info(f"Successfully transformed article: {article.title}")
-                return len(list(self.graph.triples((entity_uri, None, None))))
+                logger.debug(f"Successfully transformed article: {article.title}")
+                return self._triples
             
             else:
                 logger.warning(f"Could not determine entity class for: {article.title}")
                 self.transformation_stats['failed_transformations'] += 1
-                return 0
+                return []
                 
         except Exception as e:
             logger.error(f"Failed to transform article {article.title}: {e}")
             self.transformation_stats['failed_transformations'] += 1
-            return 0
+            # Nodes marked as described by this article were never emitted
+            self._described.clear()
+            return []
+        finally:
+            self._triples = []
+    
+    def iter_triples(self, articles: Iterable[WikipediaArticle]) -> Iterator[Triple]:
+        """Yield the triples of each article in turn, never touching ``self.graph``.
+        
+        Only one article's triples are held at a time, so memory stays flat
+        however many articles are streamed through. Nodes shared between
+        articles, such as categories and places, are described once while they
+        stay among the ``described_cache_size`` most recently used ones, and
+        again after that; RDF stores drop such duplicates on load.
+        """
+        articles = iter(articles)
+        while True:
+            batch = list(islice(articles, LITERAL_BATCH_SIZE))
+            if not batch:
+                break
+            self.parse_literals(batch)
+            for article in batch:
+                triples = self.article_triples(article)
+                self.triple_count += len(triples)
+                self.transformation_stats['triples_generated'] = self.triple_count
+                yield from triples
+    
+    def parse_literals(self, articles: List[WikipediaArticle]) -> None:
+        """Parse the typed infobox values of a batch of articles ahead, one column per kind.
+        
+        Each distinct date, number or coordinate string of the batch is parsed
+        once; the article transformations then find it in the literal cache.
+        """
+        columns: Dict[str, List[str]] = {}
+        field_bindings = self._field_bindings
+        for article in articles:
+            if not article.infobox:
+                continue
+            for key, value in article.infobox.items():
+                if key == 'template_type' or not value:
+                    continue
+                binding = field_bindings.get(key, _UNBOUND)
+                if binding is _UNBOUND:
+                    binding = self._bind_field(key)
+                kind = self._converter_kinds.get(binding[1]) if binding else None
+                if kind:
+                    columns.setdefault(kind, []).append(value)
+        
+        for kind, values in columns.items():
+            self.literal_parser.parse_column(kind, values)
+    
+    def _emit(self, subject: Any, predicate: Any, obj: Any) -> None:
+        """Record a triple of the article being transformed."""
+        self._triples.append((subject, predicate, obj))
+    
+    def _first_description(self, uri: URIRef) -> bool:
+        """Check whether a shared node still needs describing, remembering it if so."""
+        if uri in self._described:
+            self._described.move_to_end(uri)
+            return False
+        self._described[uri] = None
+        if len(self._described) > self.described_cache_size:
+            self._described.popitem(last=False)
+        return True
     
     def _determine_entity_class(self, article: WikipediaArticle) -> Optional[URIRef]:
         """Determine the ontology class for an article based on its infobox template."""
@@ -189,60 +287,12 @@ class RDFTransformer:
     
     def _determine_class_from_categories(self, categories: List[str]) -> Optional[URIRef]:
         """Determine entity class from Wikipedia categories."""
-        category_mappings = {
-            # People
-            'người': 'Person',
-            'nhân vật': 'Person',
-            'chính trị gia': 'PoliticalFigure',
-            'nghệ sĩ': 'Artist',
-            'nhà văn': 'Writer',
-            'nhà khoa học': 'Scientist',
-            'vận động viên': 'Athlete',
-            
-            # Places - expanded with more keywords
-            'địa điểm': 'Place',
-            'tỉnh': 'Province',
-            'thành phố': 'City',
-            'thành phố việt nam': 'City',
-            'tỉnh thành': 'Province',
-            'tỉnh thành việt nam': 'Province',
-            'vịnh': 'Place',
-            'di tích': 'HistoricalSite',
-            'di tích lịch sử': 'HistoricalSite',
-            'danh lam thắng cảnh': 'Place',
-            'khu vực': 'Place',
-            'vùng': 'Place',
-            'xã': 'Ward',
-            'huyện': 'District',
-            'quận': 'District',
-            
-            # Organizations
-            'trường': 'University',
-            'đại học': 'University',
-            'công ty': 'Company',
-            'tổ chức': 'Organization',
-            'cơ quan': 'GovernmentAgency',
-            
-            # Events
-            'sự kiện': 'Event',
-            'lịch sử': 'HistoricalEvent',
-            'chiến dịch': 'HistoricalEvent',
-            'cách mạng': 'HistoricalEvent',
-            'lễ hội': 'CulturalEvent',
-            
-            # Works
-            'văn học': 'LiteraryWork',
-            'âm nhạc': 'MusicalWork',
-            'phim': 'Film',
-            'tác phẩm': 'Work'
-        }
-        
-        # Check categories for keywords
-        for category in categories:
-            category_lower = category.lower()
-            for keyword, class_name in category_mappings.items():
-                if keyword in category_lower:
-                    return self.ontology.get_class_uri(class_name)
+        # Take the best ranked candidate the ontology knows, directly or through its superclass
+        for class_name, _ in self.category_classifier.rank(categories):
+            class_uri = self.ontology.get_class_uri(class_name) or \
+                self.ontology.get_class_uri(self.superclasses.get(class_name))
+            if class_uri:
+                return class_uri
         
         # Smarter default classification based on article title patterns
         return self._determine_default_class(categories)
@@ -263,137 +313,71 @@ class RDFTransformer:
     def _add_basic_properties(self, entity_uri: URIRef, article: WikipediaArticle) -> None:
         """Add basic properties for any entity."""
         # Title and labels
-        self.graph.add((entity_uri, RDFS.label, Literal(article.title, lang="vi")))
-        self.graph.add((entity_uri, FOAF.name, Literal(article.title, lang="vi")))
+        self._emit(entity_uri, RDFS.label, Literal(article.title, lang="vi"))
+        self._emit(entity_uri, FOAF.name, Literal(article.title, lang="vi"))
         
         # Abstract/description
         if article.abstract:
-            self.graph.add((entity_uri, RDFS.comment, Literal(article.abstract, lang="vi")))
-            self.graph.add((entity_uri, DCTERMS.description, Literal(article.abstract, lang="vi")))
+            self._emit(entity_uri, RDFS.comment, Literal(article.abstract, lang="vi"))
+            self._emit(entity_uri, DCTERMS.description, Literal(article.abstract, lang="vi"))
         
         # Wikipedia URL
-        self.graph.add((entity_uri, FOAF.isPrimaryTopicOf, URIRef(article.url)))
+        self._emit(entity_uri, FOAF.isPrimaryTopicOf, URIRef(article.url))
         
         # Language
-        self.graph.add((entity_uri, DCTERMS.language, Literal("vi")))
+        self._emit(entity_uri, DCTERMS.language, Literal("vi"))
     
     def _transform_infobox(self, entity_uri: URIRef, infobox: Dict[str, Any], entity_class: URIRef) -> None:
         """Transform infobox data to RDF properties."""
+        field_bindings = self._field_bindings
         for key, value in infobox.items():
             if key == 'template_type' or not value or not value.strip():
                 continue
             
-            # Map Vietnamese property name to ontology property
-            property_name = self.property_mappings.get(key.lower())
-            if property_name:
-                property_uri = self.ontology.get_property_uri(property_name)
-                if property_uri:
-                    # Determine if this is a literal or object property
-                    object_value = self._process_property_value(value, property_name, entity_class)
-                    if object_value:
-                        self.graph.add((entity_uri, property_uri, object_value))
-            else:
-                # Create a custom property for unmapped infobox fields
-                custom_property_uri = self.create_entity_uri(key, 'property')
-                literal_value = Literal(str(value), lang="vi")
-                self.graph.add((entity_uri, custom_property_uri, literal_value))
+            binding = field_bindings.get(key, _UNBOUND)
+            if binding is _UNBOUND:
+                binding = self._bind_field(key)
+            if binding is None:
+                continue
+            
+            property_uri, convert = binding
+            object_value = convert(value)
+            if object_value is not None:
+                self._emit(entity_uri, property_uri, object_value)
     
-    def _process_property_value(self, value: str, property_name: str, entity_class: URIRef) -> Optional[Any]:
-        """Process and convert property values to appropriate RDF objects."""
-        if not value or not value.strip():
-            return None
-        
+    def _convert_literal(self, value: str) -> Literal:
+        return Literal(value.strip(), lang="vi")
+    
+    def _convert_unmapped(self, value: str) -> Literal:
+        return Literal(str(value), lang="vi")
+    
+    def _convert_typed(self, kind: str, value: str) -> Literal:
+        parsed = self.literal_parser.parse(kind, value)
+        return Literal(value.strip(), lang="vi") if parsed is None else parsed
+    
+    def _convert_date(self, value: str) -> Literal:
+        return self._convert_typed('date', value)
+    
+    def _convert_number(self, value: str) -> Literal:
+        return self._convert_typed('number', value)
+    
+    def _convert_place(self, value: str) -> URIRef:
+        """Link to a place entity, describing the place the first time it is seen."""
         value = value.strip()
-        
-        # Date processing
-        if property_name in ['birthDate', 'deathDate', 'foundingDate']:
-            date_value = self._parse_vietnamese_date(value)
-            if date_value:
-                return Literal(date_value, datatype=XSD.date)
-        
-        # Numeric processing
-        elif property_name in ['population', 'area']:
-            numeric_value = self._extract_number(value)
-            if numeric_value is not None:
-                return Literal(numeric_value, datatype=XSD.integer)
-        
-        # Location processing (create linked entities)
-        elif property_name in ['birthPlace', 'deathPlace', 'province', 'district', 'ward']:
-            place_uri = self.create_entity_uri(value)
-            # Add basic information about the place
-            self.graph.add((place_uri, RDF.type, self.ontology.get_class_uri('Place')))
-            self.graph.add((place_uri, RDFS.label, Literal(value, lang="vi")))
-            return place_uri
-        
-        # URL processing
-        elif property_name == 'homepage':
-            if value.startswith('http'):
-                return URIRef(value)
-        
-        # Coordinates processing
-        elif property_name == 'coordinates':
-            coords = self._parse_coordinates(value)
-            if coords:
-                return Literal(coords, datatype=XSD.string)
-        
-        # Default: return as Vietnamese literal
+        place_uri = self.create_entity_uri(value)
+        if self._first_description(place_uri):
+            self._emit(place_uri, RDF.type, self.ontology.get_class_uri('Place'))
+            self._emit(place_uri, RDFS.label, Literal(value, lang="vi"))
+        return place_uri
+    
+    def _convert_url(self, value: str) -> Any:
+        value = value.strip()
+        if value.startswith('http'):
+            return URIRef(value)
         return Literal(value, lang="vi")
     
-    def _parse_vietnamese_date(self, date_str: str) -> Optional[str]:
-        """Parse Vietnamese date strings to ISO format."""
-        if not date_str:
-            return None
-        
-        # Remove common Vietnamese date prefixes
-        date_str = re.sub(r'^(ngày |tháng |năm )', '', date_str.lower())
-        
-        # Common Vietnamese date patterns
-        patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',  # DD/MM/YYYY
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',  # DD-MM-YYYY
-            r'(\d{4})',                       # YYYY only
-            r'(\d{1,2}) tháng (\d{1,2}), (\d{4})'  # DD tháng MM, YYYY
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                groups = match.groups()
-                if len(groups) == 1:  # Year only
-                    return groups[0]
-                elif len(groups) == 3:  # Full date
-                    if 'tháng' in date_str:  # DD tháng MM, YYYY
-                        day, month, year = groups
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:  # DD/MM/YYYY or DD-MM-YYYY
-                        day, month, year = groups
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        
-        return None
-    
-    def _extract_number(self, text: str) -> Optional[int]:
-        """Extract numeric value from text."""
-        # Remove common Vietnamese number separators and words
-        text = re.sub(r'[.,\s]', '', text.lower())
-        text = re.sub(r'(người|km²|m²|ha|hecta)', '', text)
-        
-        # Extract number
-        match = re.search(r'\d+', text)
-        if match:
-            return int(match.group())
-        
-        return None
-    
-    def _parse_coordinates(self, coord_str: str) -> Optional[str]:
-        """Parse coordinate strings."""
-        # This is a simplified parser - could be expanded for more formats
-        coord_pattern = r'(\d+\.?\d*)[°,\s]+(\d+\.?\d*)'
-        match = re.search(coord_pattern, coord_str)
-        if match:
-            lat, lon = match.groups()
-            return f"{lat},{lon}"
-        
-        return None
+    def _convert_coordinates(self, value: str) -> Literal:
+        return self._convert_typed('coordinates', value)
     
     def _add_categories(self, entity_uri: URIRef, categories: List[str]) -> None:
         """Add category information as SKOS concepts."""
@@ -402,38 +386,62 @@ class RDFTransformer:
             category_uri = self.create_entity_uri(category.replace('Thể loại:', ''))
             
             # Add category as SKOS concept
-            self.graph.add((category_uri, RDF.type, self.ontology.namespaces['skos'].Concept))
-            self.graph.add((category_uri, self.ontology.namespaces['skos'].prefLabel, 
-                           Literal(category, lang="vi")))
+            if self._first_description(category_uri):
+                self._emit(category_uri, RDF.type, self.ontology.namespaces['skos'].Concept)
+                self._emit(category_uri, self.ontology.namespaces['skos'].prefLabel, 
+                       Literal(category, lang="vi"))
             
             # Link entity to category
-            self.graph.add((entity_uri, DCTERMS.subject, category_uri))
+            self._emit(entity_uri, DCTERMS.subject, category_uri)
     
     def _add_wikipedia_metadata(self, entity_uri: URIRef, article: WikipediaArticle) -> None:
         """Add Wikipedia-specific metadata."""
         # Page ID
-        self.graph.add((entity_uri, self.ontology.namespaces['vidbp'].wikipediaPageID, 
-                       Literal(article.page_id, datatype=XSD.integer)))
+        self._emit(entity_uri, self.ontology.namespaces['vidbp'].wikipediaPageID, 
+                   Literal(article.page_id, datatype=XSD.integer))
         
         # Last modified
         if article.last_modified:
-            self.graph.add((entity_uri, DCTERMS.modified, 
-                           Literal(article.last_modified, datatype=XSD.dateTime)))
+            self._emit(entity_uri, DCTERMS.modified, 
+                   Literal(article.last_modified, datatype=XSD.dateTime))
         
         # Revision ID
         if article.revision_id:
-            self.graph.add((entity_uri, self.ontology.namespaces['vidbp'].wikipediaRevisionID, 
-                           Literal(article.revision_id, datatype=XSD.integer)))
+            self._emit(entity_uri, self.ontology.namespaces['vidbp'].wikipediaRevisionID, 
+                   Literal(article.revision_id, datatype=XSD.integer))
     
-    def transform_articles_batch(self, articles: List[WikipediaArticle]) -> None:
-        """Transform a batch of articles to RDF."""
-        logger.info(f"Transforming {len(articles)} articles to RDF")
+    def transform_articles_batch(self, articles: Iterable[WikipediaArticle]) -> None:
+        """Transform a batch of articles to RDF.
+
+        Articles are consumed one at a time, so a lazy iterator such as
+        ``iter_articles`` is never materialized.
+        """
+        logger.info("Transforming articles to RDF")
         
+        count = 0
         for article in articles:
             self.transform_article(article)
+            count += 1
         
         self.transformation_stats['triples_generated'] = len(self.graph)
-        logger.info(f"Transformation complete. Generated {len(self.graph)} triples.")
+        logger.info(f"Transformation complete. Transformed {count} articles "
+                    f"into {len(self.graph)} triples.")
+    
+    def stream_rdf(self, articles: Iterable[WikipediaArticle], destination: Union[str, BinaryIO],
+                   graph: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """Stream articles to an N-Triples file, or N-Quads when ``graph`` is given.
+        
+        Unlike ``transform_articles_batch`` followed by ``export_rdf``, nothing
+        is kept in ``self.graph``, so memory use does not grow with the corpus.
+        """
+        logger.info("Streaming articles to RDF")
+        
+        with NTriplesWriter(destination, graph=graph, chunk_size=chunk_size) as writer:
+            writer.write_all(self.iter_triples(articles))
+        
+        logger.info(f"Streaming complete. Transformed {self.transformation_stats['articles_processed']} "
+                    f"articles into {self.triple_count} triples.")
+        return writer.get_statistics()
     
     def export_rdf(self, output_path: str, format: str = 'turtle') -> None:
         """Export RDF graph to file."""
@@ -481,6 +489,14 @@ class RDFTransformer:
         """Get detailed transformation statistics."""
         stats = self.transformation_stats.copy()
         stats['current_graph_size'] = len(self.graph)
+        uri_stats = self.uri_factory.get_statistics()
+        stats['uri_cache_hits'] = uri_stats['hits']
+        stats['uri_cache_misses'] = uri_stats['misses']
+        stats['uri_cache_hit_rate'] = uri_stats['hit_rate']
+        literal_stats = self.literal_parser.get_statistics()
+        stats['literal_cache_hits'] = literal_stats['cache_hits']
+        stats['literal_cache_misses'] = literal_stats['cache_misses']
+        stats['literal_cache_hit_rate'] = literal_stats['cache_hit_rate']
         return stats
     
     def merge_with_existing_graph(self, existing_graph_path: str) -> None:
@@ -0,0 +1,170 @@
+"""
+HTTP Transport Module
+
+This module builds the pooled ``requests`` sessions used by the collectors,
+the entity linker and the GraphDB manager. Sessions keep per-host keep-alive
+pools sized to the caller's worker count, apply a default timeout to every
+request (``requests`` ignores ``Session.timeout``), retry connection errors
+and transient 5xx responses with backoff, negotiate compressed responses,
+and count requests, new connections and latency so connection reuse can be
+checked. SPARQL endpoints are queried through the same sessions instead of
+opening a fresh urllib connection per query.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple, Union
+
+import requests
+from rdflib import Graph
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+# Transient server errors worth retrying at the transport level, along with
+# connection errors. 429 and 503 are left to the rate limiter, which honours
+# Retry-After.
+RETRY_STATUS_CODES = (500, 502, 504)
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+# SELECT/ASK results as JSON; CONSTRUCT/DESCRIBE results as an RDF serialization
+SPARQL_ACCEPT = ("application/sparql-results+json, text/turtle;q=0.9, "
+                 "application/n-triples;q=0.8, application/rdf+xml;q=0.7, application/ld+json;q=0.6")
+RDF_CONTENT_TYPES = {
+    'text/turtle': 'turtle',
+    'application/x-turtle': 'turtle',
+    'application/n-triples': 'nt',
+    'text/plain': 'nt',
+    'application/rdf+xml': 'xml',
+    'application/ld+json': 'json-ld',
+}
+
+
+class TransportAdapter(HTTPAdapter):
+    """HTTP adapter with a default timeout and request/connection counters."""
+
+    def __init__(self, timeout: Timeout = 30.0, pool_size: int = 10,
+                 max_retries: int = 3, backoff_factor: float = 0.5):
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'errors': 0,
+            'total_latency_seconds': 0.0,
+            'max_latency_seconds': 0.0
+        }
+        # Read timeouts are not retried: a slow query would only be sent again
+        retry = Retry(
+            total=max_retries,
+            read=False,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    def send(self, request, timeout=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = super().send(request, timeout=timeout or self.timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            with self.lock:
+                self.stats['errors'] += 1
+            raise
+        latency = time.perf_counter() - start
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['total_latency_seconds'] += latency
+            self.stats['max_latency_seconds'] = max(self.stats['max_latency_seconds'], latency)
+        return response
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get request, latency and connection reuse counters."""
+        with self.lock:
+            stats = self.stats.copy()
+
+        # Each urllib3 pool counts the connections it opened and the requests it sent
+        new_connections = 0
+        pool_requests = 0
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                new_connections += pool.num_connections
+                pool_requests += pool.num_requests
+
+        stats['new_connections'] = new_connections
+        stats['reused_connections'] = max(0, pool_requests - new_connections)
+        stats['mean_latency_seconds'] = (
+            stats['total_latency_seconds'] / stats['requests'] if stats['requests'] else 0.0
+        )
+        return stats
+
+
+def _normalize_timeout(timeout: Timeout) -> Timeout:
+    """Use a short connect timeout alongside a plain read timeout."""
+    if isinstance(timeout, tuple):
+        return timeout
+    return (min(DEFAULT_CONNECT_TIMEOUT, timeout), timeout)
+
+
+def create_session(headers: Optional[Dict[str, str]] = None, timeout: Timeout = 30.0,
+                   pool_size: int = 10, max_retries: int = 3,
+                   backoff_factor: float = 0.5, auth=None) -> requests.Session:
+    """Create a pooled session; ``pool_size`` should match the caller's worker count."""
+    session = requests.Session()
+    adapter = TransportAdapter(
+        timeout=_normalize_timeout(timeout),
+        pool_size=max(1, pool_size),
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+    if auth is not None:
+        session.auth = auth
+    return session
+
+
+def get_transport_statistics(session: requests.Session) -> Dict[str, Any]:
+    """Get the transport counters of a session made by ``create_session``."""
+    adapter = session.get_adapter("https://")
+    if isinstance(adapter, TransportAdapter):
+        return adapter.get_statistics()
+    return {}
+
+
+def upload_timeout(timeout: Optional[float]) -> Timeout:
+    """Timeout for bulk uploads: the usual connect timeout, ``timeout`` (None: unlimited) to read."""
+    return (DEFAULT_CONNECT_TIMEOUT, timeout)
+
+
+def sparql_query(session: requests.Session, endpoint: str, query: str,
+                 timeout: Optional[Timeout] = None) -> Union[Dict[str, Any], Graph]:
+    """Run a query on a SPARQL endpoint.
+
+    SELECT and ASK queries return the JSON results; CONSTRUCT and DESCRIBE
+    queries return the triples parsed into a ``Graph``. The query is posted
+    as a form over the session's keep-alive pool; HTTP errors are raised as
+    ``requests`` exceptions.
+    """
+    response = session.post(
+        endpoint,
+        data={"query": query},
+        headers={"Accept": SPARQL_ACCEPT},
+        timeout=_normalize_timeout(timeout) if timeout else None,
+    )
+    response.raise_for_status()
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    rdf_format = RDF_CONTENT_TYPES.get(content_type)
+    if rdf_format:
+        return Graph().parse(data=response.content, format=rdf_format)
+    return response.json()
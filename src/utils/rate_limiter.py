@@ -0,0 +1,181 @@
+"""
+Rate Limiter Module
+
+This module provides an adaptive token bucket shared by every client of a
+host. Tokens are reserved under a short lock and the caller waits outside it,
+so concurrent threads and coroutines queue behind each other without being
+serialized behind a sleeper. The bucket slows down when the server pushes
+back (HTTP 429/503, ``Retry-After``, MediaWiki ``maxlag``) and recovers
+towards the configured rate as requests succeed again.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down" rather than "this request is wrong"
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Thread- and coroutine-safe adaptive token bucket."""
+
+    def __init__(self, requests_per_second: float = 1.0, burst_limit: int = 5,
+                 min_requests_per_second: Optional[float] = None,
+                 backoff_factor: float = 0.5, recovery_step: float = 0.05,
+                 name: str = ""):
+        self.name = name
+        self.requests_per_second = requests_per_second
+        self.burst_limit = burst_limit
+        self.min_requests_per_second = min_requests_per_second or requests_per_second / 16
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+
+        self.rate = requests_per_second
+        self.tokens = float(burst_limit)
+        self.last_update = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'delayed_requests': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'throttled_responses': 0
+        }
+
+    def configure(self, requests_per_second: float, burst_limit: int) -> None:
+        """Change the target rate and burst size."""
+        with self.lock:
+            if (requests_per_second, burst_limit) == (self.requests_per_second, self.burst_limit):
+                return
+            self.requests_per_second = requests_per_second
+            self.burst_limit = burst_limit
+            self.min_requests_per_second = min(self.min_requests_per_second, requests_per_second)
+            self.rate = requests_per_second
+            self.tokens = min(self.tokens, float(burst_limit))
+
+    def reserve(self) -> float:
+        """Reserve the next token and return how long the caller must wait for it.
+
+        The token is taken even if it is not available yet, so concurrent
+        callers get consecutive slots instead of racing for the same one.
+        Callers that queue during a ``Retry-After`` block get slots spaced
+        out from the end of the block rather than all at it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            # No tokens accrue while the server has us blocked
+            elapsed = max(0.0, now - max(self.last_update, self.blocked_until))
+            self.tokens = min(self.burst_limit, self.tokens + elapsed * self.rate)
+            self.last_update = now
+
+            self.tokens -= 1
+            wait_time = max(0.0, self.blocked_until - now) + max(0.0, -self.tokens / self.rate)
+
+            self.stats['requests'] += 1
+            if wait_time > 0:
+                self.stats['delayed_requests'] += 1
+                self.stats['total_wait_seconds'] += wait_time
+                self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], wait_time)
+        return wait_time
+
+    def acquire(self) -> float:
+        """Wait for a token from synchronous code, returning the time waited."""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """Wait for a token from a coroutine, returning the time waited."""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Back off after the server asked us to slow down.
+
+        The rate is cut multiplicatively and, if the server said how long to
+        wait, no token is handed out before that time.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.rate = max(self.min_requests_per_second, self.rate * self.backoff_factor)
+            delay = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + delay)
+            # Tokens accumulated at the old rate must not be spent in a burst; one
+            # request may go when the block ends, the rest follow at the new rate
+            self.tokens = min(self.tokens, 1.0)
+            self.last_update = now
+            self.stats['throttled_responses'] += 1
+            rate = self.rate
+        logger.warning(
+            f"Server throttled {self.name or 'requests'}; "
+            f"backing off to {rate:.2f} req/s for at least {delay:.1f}s"
+        )
+
+    def record_success(self) -> None:
+        """Recover additively towards the configured rate after a successful request."""
+        if self.rate >= self.requests_per_second:
+            return
+        with self.lock:
+            self.rate = min(
+                self.requests_per_second,
+                self.rate + self.requests_per_second * self.recovery_step,
+            )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = self.stats.copy()
+            stats['current_rate'] = self.rate
+        stats['mean_wait_seconds'] = (
+            stats['total_wait_seconds'] / stats['requests'] if stats['requests'] else 0.0
+        )
+        return stats
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str, requests_per_second: Optional[float] = None,
+                     burst_limit: Optional[int] = None) -> RateLimiter:
+    """Get the shared rate limiter of the host serving ``url``.
+
+    Every client of the same host in this process draws from one bucket.
+    Passing limits reconfigures the bucket; without them an existing bucket
+    is used as is and a new one gets 1 request/s with a burst of 5.
+    """
+    host = urlparse(url).netloc or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_second or 1.0, burst_limit or 5, name=host)
+            _limiters[host] = limiter
+            return limiter
+    if requests_per_second is not None:
+        limiter.configure(requests_per_second, burst_limit or limiter.burst_limit)
+    return limiter
@@ -0,0 +1,106 @@
+"""
+URI Factory Module
+
+This module mints the vi.dbpedia.org URIs of resources, properties and
+ontology terms from Wikipedia titles. The cleaning patterns are compiled
+once, and minted URIs are kept in a bounded LRU cache, because the same
+categories, places and infobox keys come up on article after article. The
+transformer and the entity linker share one factory per set of base URIs,
+so a title maps to the same URI in the generated data and in the links.
+"""
+
+import re
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import quote
+
+import yaml
+from rdflib import URIRef
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 65536
+DEFAULT_BASE_URIS = {
+    'base_uri': "http://vi.dbpedia.org/ontology/",
+    'resource_uri': "http://vi.dbpedia.org/resource/",
+    'property_uri': "http://vi.dbpedia.org/property/",
+}
+
+# Anything but word characters and Vietnamese letters becomes an underscore
+_SEPARATORS = re.compile(r'[^\w\u00C0-\u1EF9]')
+_UNDERSCORE_RUNS = re.compile(r'_{2,}')
+
+
+def clean_title(title: str) -> str:
+    """Clean a Wikipedia title for use in URIs, keeping Vietnamese diacritics."""
+    return _UNDERSCORE_RUNS.sub('_', _SEPARATORS.sub('_', title)).strip('_')
+
+
+class URIFactory:
+    """Memoized minting of resource, property and ontology URIs."""
+
+    def __init__(self, base_uri: str = DEFAULT_BASE_URIS['base_uri'],
+                 resource_uri: str = DEFAULT_BASE_URIS['resource_uri'],
+                 property_uri: str = DEFAULT_BASE_URIS['property_uri'],
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.bases = {
+            'resource': resource_uri,
+            'property': property_uri,
+        }
+        self.base_uri = base_uri
+        # lru_cache is thread-safe and hands out the same URIRef for repeated titles
+        self._cached_mint = lru_cache(maxsize=cache_size)(self._mint)
+
+    def _mint(self, title: str, entity_type: str) -> URIRef:
+        base = self.bases.get(entity_type, self.base_uri)
+        return URIRef(base + quote(clean_title(title), safe=''))
+
+    def mint(self, title: str, entity_type: str = 'resource') -> URIRef:
+        """Mint the URI of a title; ``entity_type`` is 'resource', 'property' or anything else for the ontology."""
+        return self._cached_mint(title, entity_type)
+
+    def resource(self, title: str) -> URIRef:
+        return self._cached_mint(title, 'resource')
+
+    def property(self, name: str) -> URIRef:
+        return self._cached_mint(name, 'property')
+
+    def get_statistics(self) -> Dict[str, Any]:
+        info = self._cached_mint.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'cached': info.currsize,
+            'cache_size': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0
+        }
+
+
+_factories: Dict[Tuple[str, str, str], URIFactory] = {}
+_factories_lock = threading.Lock()
+
+
+def get_uri_factory(ontology_config: Optional[Dict[str, Any]] = None,
+                    config_path: str = "config/ontology.yaml") -> URIFactory:
+    """Get the shared factory for the base URIs of an ``ontology`` config section.
+
+    Without ``ontology_config`` the section is read from ``config_path``,
+    falling back to the vi.dbpedia.org defaults if the file is missing.
+    """
+    if ontology_config is None:
+        ontology_config = {}
+        if Path(config_path).exists():
+            with open(config_path, 'r', encoding='utf-8') as file:
+                ontology_config = (yaml.safe_load(file) or {}).get('ontology', {})
+
+    key = tuple(ontology_config.get(name, default) for name, default in DEFAULT_BASE_URIS.items())
+    with _factories_lock:
+        factory = _factories.get(key)
+        if factory is None:
+            factory = URIFactory(*key)
+            _factories[key] = factory
+    return factory
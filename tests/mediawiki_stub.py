@@ -0,0 +1,225 @@
+"""
+Local stub of the MediaWiki action API used by collector tests and benchmarks.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+def make_page(title: str, page_id: int, revision_id: int = 1000,
+              wikitext: Optional[str] = None, categories=None,
+              templates=None, extract: Optional[str] = None,
+              langlinks: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Build a stub page record."""
+    return {
+        "title": title,
+        "pageid": page_id,
+        "revid": revision_id,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "extract": extract if extract is not None else f"{title} là một bài viết.",
+        "wikitext": wikitext if wikitext is not None else (
+            "{{Thông tin nhân vật\n| tên = %s\n| ngày sinh = 19 tháng 5 năm 1890\n}}\n"
+            "'''%s''' là một [[nhân vật]]." % (title, title)
+        ),
+        "categories": categories if categories is not None else ["Thể loại:Nhân vật lịch sử Việt Nam"],
+        "templates": templates if templates is not None else ["Bản mẫu:Thông tin nhân vật"],
+        "langlinks": langlinks or {},
+    }
+
+
+class MediaWikiStub:
+    """Threaded HTTP server answering a subset of the MediaWiki action API."""
+
+    def __init__(self, pages: Optional[Dict[str, Dict[str, Any]]] = None,
+                 latency: float = 0.0):
+        self.pages = pages or {}
+        self.latency = latency
+        self.extract_limit = 20
+        # Redirect title -> target title, followed when the request sets ``redirects``
+        self.redirects: Dict[str, str] = {}
+        self.request_log = []
+        self.throttled = []
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/w/api.php"
+
+    @property
+    def request_count(self) -> int:
+        return len(self.request_log)
+
+    def add_page(self, page: Dict[str, Any]) -> None:
+        self.pages[page["title"]] = page
+
+    def throttle(self, status: int = 429, retry_after: Optional[str] = None,
+                 maxlag: bool = False, count: int = 1) -> None:
+        """Answer the next ``count`` requests with a throttling response."""
+        body = ({"error": {"code": "maxlag", "info": "Waiting for replica", "lag": 6}}
+                if maxlag else {"error": {"code": "ratelimited"}})
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        with self.lock:
+            self.throttled.extend([(status, body, headers)] * count)
+
+    def start(self) -> "MediaWikiStub":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                with stub.lock:
+                    stub.request_log.append(params)
+                    throttled = stub.throttled.pop(0) if stub.throttled else None
+                if stub.latency:
+                    time.sleep(stub.latency)
+                status, body, headers = throttled or (*stub.handle(params), {})
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # API emulation
+
+    def handle(self, params: Dict[str, str]):
+        action = params.get("action", "query")
+        if action == "parse":
+            return self._handle_parse(params)
+        if action == "query":
+            if params.get("list") == "categorymembers":
+                return self._handle_categorymembers(params)
+            return self._handle_query(params)
+        return 400, {"error": {"code": "badaction", "info": action}}
+
+    def _lookup(self, title: str) -> Optional[Dict[str, Any]]:
+        return self.pages.get(title) or self.pages.get(title.replace("_", " "))
+
+    def _handle_parse(self, params):
+        page = self._lookup(params.get("page", ""))
+        if not page:
+            return 200, {"error": {"code": "missingtitle"}}
+        return 200, {"parse": {"title": page["title"], "pageid": page["pageid"],
+                               "wikitext": {"*": page["wikitext"]}}}
+
+    def _page_entry(self, page, props):
+        entry = {"pageid": page["pageid"], "ns": 0, "title": page["title"]}
+        if "extracts" in props:
+            entry["extract"] = page["extract"]
+        if "info" in props:
+            entry["lastrevid"] = page["revid"]
+            entry["touched"] = page["timestamp"]
+        if "categories" in props:
+            entry["categories"] = [{"ns": 14, "title": c} for c in page["categories"]]
+        if "templates" in props:
+            entry["templates"] = [{"ns": 10, "title": t} for t in page["templates"]]
+        if "langlinks" in props and page.get("langlinks"):
+            entry["langlinks"] = [{"lang": lang, "*": title} for lang, title in page["langlinks"].items()]
+        if "revisions" in props:
+            entry["revisions"] = [{
+                "revid": page["revid"],
+                "timestamp": page["timestamp"],
+                "slots": {"main": {"contentmodel": "wikitext", "*": page["wikitext"]}},
+            }]
+        return entry
+
+    def _handle_query(self, params):
+        props = set(params.get("prop", "").split("|"))
+        requested = [title for title in params.get("titles", "").split("|") if title]
+        query = {"pages": {}}
+
+        normalized = [
+            {"from": title, "to": title.replace("_", " ")}
+            for title in requested if "_" in title
+        ]
+        if normalized:
+            query["normalized"] = normalized
+
+        if "redirects" in params:
+            followed = []
+            for index, title in enumerate(requested):
+                target = self.redirects.get(title.replace("_", " "))
+                if target is not None:
+                    followed.append({"from": title.replace("_", " "), "to": target})
+                    requested[index] = target
+            if followed:
+                query["redirects"] = followed
+            requested = list(dict.fromkeys(requested))
+
+        # Intro extracts are limited per request, like TextExtracts' exlimit
+        offset = int(params.get("excontinue", 0))
+        if "excontinue" in params:
+            props = {"extracts"}
+        extract_window = set(requested[offset:offset + self.extract_limit])
+
+        missing_id = -1
+        for title in requested:
+            page = self._lookup(title)
+            if page is None:
+                query["pages"][str(missing_id)] = {"ns": 0, "title": title, "missing": ""}
+                missing_id -= 1
+                continue
+            page_props = set(props)
+            if title not in extract_window:
+                page_props.discard("extracts")
+            query["pages"][str(page["pageid"])] = self._page_entry(page, page_props)
+
+        body = {"query": query}
+        if "extracts" in props and offset + self.extract_limit < len(requested):
+            body["continue"] = {"excontinue": offset + self.extract_limit,
+                                "continue": "||categories|info|revisions|templates"}
+        else:
+            body["batchcomplete"] = ""
+        return 200, body
+
+    def _handle_categorymembers(self, params):
+        category = params.get("cmtitle", "")
+        limit = params.get("cmlimit", "10")
+        limit = 500 if limit == "max" else int(limit)
+        types = set(params.get("cmtype", "page").split("|"))
+        members = []
+        for page in self.pages.values():
+            if category not in page["categories"]:
+                continue
+            namespace = 14 if page["title"].startswith("Thể loại:") else 0
+            if ("subcat" if namespace == 14 else "page") in types:
+                members.append({"pageid": page["pageid"], "ns": namespace, "title": page["title"]})
+
+        offset = int(params.get("cmcontinue", 0))
+        body = {"query": {"categorymembers": members[offset:offset + limit]}}
+        if offset + limit < len(members):
+            body["continue"] = {"cmcontinue": str(offset + limit), "continue": "-||"}
+        else:
+            body["batchcomplete"] = ""
+        return 200, body
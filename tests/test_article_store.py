@@ -0,0 +1,214 @@
+"""
+Tests for the streaming JSON Lines article store
+"""
+
+import pickle
+import types
+
+import pytest
+
+from src.collectors.wikipedia_collector import WikipediaArticle, WikipediaCollector, article_to_dict
+from src.collectors.article_store import ArticleWriter, iter_articles
+
+
+def make_article(i: int) -> WikipediaArticle:
+    return WikipediaArticle(
+        title=f"Bài viết {i}",
+        page_id=i,
+        url=f"https://vi.wikipedia.org/wiki/Bài_viết_{i}",
+        abstract="Tóm tắt.",
+        content="Nội dung.",
+        infobox={"tên": f"Bài viết {i}"},
+        categories=["Thể loại:Việt Nam"],
+        templates=["Hộp thông tin"],
+        revision_id=1000 + i,
+    )
+
+
+class TestArticleStore:
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.zst"])
+    def test_round_trip(self, tmp_path, suffix):
+        """Test that articles survive a write/read round trip in every format."""
+        if suffix.endswith(".zst"):
+            pytest.importorskip("zstandard")
+        path = str(tmp_path / f"articles{suffix}")
+        articles = [make_article(i) for i in range(10)]
+
+        with ArticleWriter(path) as writer:
+            writer.write_many(iter(articles))
+
+        assert writer.count == 10
+        assert list(iter_articles(path)) == articles
+
+    def test_iter_articles_is_lazy(self, tmp_path):
+        """Test that articles are read one record at a time."""
+        path = str(tmp_path / "articles.jsonl")
+        with ArticleWriter(path) as writer:
+            writer.write(make_article(1))
+        with open(path, "a", encoding="utf-8") as file:
+            file.write('{"title": "truncated')
+
+        articles = iter_articles(path)
+        assert isinstance(articles, types.GeneratorType)
+        assert [a.page_id for a in articles] == [1]
+
+    def test_collector_save_and_load_by_extension(self, tmp_path):
+        """Test that the collector picks the format from the file extension."""
+        collector = WikipediaCollector()
+        articles = [make_article(i) for i in range(3)]
+
+        for name in ("articles.json", "articles.jsonl.gz", "articles.zarc", "articles.aix"):
+            path = str(tmp_path / name)
+            collector.save_articles_to_json(articles, path)
+            assert list(iter_articles(path)) == articles
+            assert collector.load_articles_from_json(path) == articles
+            # Loading goes through the indexed store, indexing other formats first
+            assert (tmp_path / name).with_name(name if name.endswith(".aix") else name + ".aix").exists()
+
+
+class TestWikipediaArticle:
+
+    def test_compact_fields_keep_attribute_api(self):
+        """Test that interned, compressed and derived fields read back unchanged."""
+        content = "Nội dung dài. " * 500
+        article = WikipediaArticle(
+            title="Huế", page_id=1, url="https://vi.wikipedia.org/wiki/Hu%E1%BA%BF",
+            abstract="Tóm tắt.", content=content, infobox={"template_type": "tỉnh"},
+            categories=["Thể loại:" + "Việt Nam"], templates=["Sơ khai"],
+        )
+        other = make_article(2)
+
+        assert article._url is None
+        assert article.url == "https://vi.wikipedia.org/wiki/Hu%E1%BA%BF"
+        assert isinstance(article._content, bytes)
+        assert article.content == content
+        assert article.categories == ["Thể loại:Việt Nam"]
+        assert article.categories[0] is other.categories[0]
+
+        article.content = "ngắn"
+        assert article_to_dict(article)["content"] == "ngắn"
+
+    def test_lazy_loader_and_pickle(self):
+        """Test that loader-backed text is read on access and survives pickling."""
+        calls = []
+        article = make_article(3)
+        article.content = lambda: calls.append(1) or "Nội dung đã tải."
+
+        assert calls == []
+        assert article.content == "Nội dung đã tải."
+        assert pickle.loads(pickle.dumps(article)) == article
+
+
+class TestArticleArchive:
+
+    def test_trained_dictionary_and_random_access(self, tmp_path):
+        """Test that archived records round-trip and can be read one at a time."""
+        pytest.importorskip("zstandard")
+        from src.collectors.article_archive import ArchiveWriter, ArticleArchive
+
+        path = str(tmp_path / "articles.zarc")
+        articles = [article_to_dict(make_article(i)) for i in range(300)]
+        with ArchiveWriter(path, dict_size=4096, training_records=100) as writer:
+            for article_dict in articles:
+                writer.write_dict(article_dict)
+
+        assert writer.dictionary is not None
+        assert writer.get_statistics()['compression_ratio'] > 1
+        with ArticleArchive(path) as archive:
+            assert len(archive) == 300
+            assert archive[250] == articles[250]
+            assert archive.get("Bài viết 7") == articles[7]
+            assert archive.get_by_page_id(42) == articles[42]
+            assert archive.get("Không có") is None
+            assert list(archive.iter_dicts(chunk_bytes=512)) == articles
+
+    def test_archive_rejects_append(self, tmp_path):
+        """Test that ArticleWriter refuses to append to an archive."""
+        pytest.importorskip("zstandard")
+        with pytest.raises(ValueError):
+            ArticleWriter(str(tmp_path / "articles.zarc"), append=True)
+
+
+class TestIndexedStore:
+
+    def test_lookup_by_title_and_page_id(self, tmp_path):
+        """Test constant-time lookups and scans over a memory-mapped store."""
+        from src.collectors.indexed_store import IndexedArticleStore
+
+        path = str(tmp_path / "articles.aix")
+        articles = [make_article(i) for i in range(500)]
+        with ArticleWriter(path) as writer:
+            writer.write_many(articles)
+
+        with IndexedArticleStore(path) as store:
+            assert len(store) == 500
+            assert store.get_article("Bài viết 321") == articles[321]
+            assert store.get_by_page_id(7)["title"] == "Bài viết 7"
+            assert store.get("Bài viết 500") is None
+            assert store.get_by_page_id(10_000) is None
+            assert "Bài viết 0" in store
+            assert isinstance(next(store.iter_records()), memoryview)
+            assert list(store.page_ids) == list(range(500))
+            assert list(store.iter_articles()) == articles
+            assert store.get_statistics()['probes_per_lookup'] < 3
+
+    def test_open_article_index_rebuilds_stale_index(self, tmp_path):
+        """Test that other article files are indexed next to themselves on demand."""
+        import os
+        from src.collectors.indexed_store import open_article_index
+
+        path = str(tmp_path / "articles.jsonl")
+        with ArticleWriter(path) as writer:
+            writer.write(make_article(1))
+        with open_article_index(path) as store:
+            assert store.store_path == path + ".aix"
+            assert store.titles() == ["Bài viết 1"]
+
+        with ArticleWriter(path, append=True) as writer:
+            writer.write(make_article(2))
+        os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+        with WikipediaCollector().open_article_index(path) as store:
+            assert store.get("Bài viết 2")["page_id"] == 2
+
+        # A change in size is noticed even when the mtime is put back
+        mtime = os.stat(path).st_mtime_ns
+        with ArticleWriter(path, append=True) as writer:
+            writer.write(make_article(3))
+        os.utime(path, ns=(mtime, mtime))
+        with open_article_index(path) as store:
+            assert len(store) == 3
+
+    def test_failed_index_build_leaves_no_index(self, tmp_path):
+        """Test that indexing a truncated file fails every time instead of sealing a partial index."""
+        import os
+        from src.collectors.indexed_store import open_article_index
+
+        path = str(tmp_path / "articles.jsonl.gz")
+        with ArticleWriter(path) as writer:
+            writer.write_many(make_article(i) for i in range(3000))
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) // 2)
+
+        for _ in range(2):
+            with pytest.raises(EOFError):
+                open_article_index(path)
+        assert os.listdir(tmp_path) == ["articles.jsonl.gz"]
+
+    @pytest.mark.parametrize("name", ["articles.aix", "articles.zarc"])
+    def test_failed_write_leaves_no_sealed_file(self, tmp_path, name):
+        """Test that writing a sealed article file from a failing iterator publishes nothing."""
+        import os
+        from src.collectors.article_store import write_articles
+
+        def failing_articles():
+            yield make_article(0)
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            write_articles(failing_articles(), str(tmp_path / name))
+        assert os.listdir(tmp_path) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,66 @@
+"""
+Tests for offline Wikipedia dump ingestion
+"""
+
+import bz2
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.collectors.article_store import iter_articles
+from src.collectors.dump_reader import DumpReader, iter_dump_pages
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "viwiki-sample-pages-articles.xml"
+
+
+@pytest.fixture
+def dump_path(tmp_path):
+    """Compress the fixture dump like the published pages-articles files."""
+    path = tmp_path / "viwiki-sample-pages-articles.xml.bz2"
+    with open(FIXTURE, "rb") as source, bz2.open(path, "wb") as target:
+        shutil.copyfileobj(source, target)
+    return str(path)
+
+
+class TestDumpReader:
+
+    def test_iter_dump_pages(self, dump_path):
+        """Test that every page is streamed with its revision metadata."""
+        pages = list(iter_dump_pages(dump_path))
+
+        assert [p["page_id"] for p in pages] == [1, 2, 3, 4, 5]
+        assert pages[2]["redirect"] and pages[3]["namespace"] == 14
+        assert pages[0]["revision_id"] == 70000001
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_write_to_store(self, dump_path, tmp_path, workers):
+        """Test that main-namespace articles are parsed into the article store."""
+        output = str(tmp_path / "articles.jsonl")
+        reader = DumpReader(dump_path, workers=workers, chunk_size=1)
+
+        stats = reader.write_to_store(output)
+        articles = list(iter_articles(output))
+
+        assert [a.title for a in articles] == ["Hồ Chí Minh", "Hà Nội", "Truyện Kiều"]
+        assert stats["pages_read"] == 5 and stats["skipped"] == 2
+
+        article = articles[0]
+        assert article.infobox["ngày sinh"] == "19 tháng 5 năm 1890"
+        assert article.infobox["nơi sinh"] == "Nghệ An"
+        assert article.abstract == "Hồ Chí Minh là một nhà cách mạng người Việt Nam."
+        assert article.categories == [
+            "Thể loại:Nhân vật lịch sử Việt Nam", "Thể loại:Chính trị gia Việt Nam"
+        ]
+        assert article.templates == ["Bản mẫu:Thông tin nhân vật"]
+        assert article.revision_id == 70000001
+
+    def test_limit(self, dump_path):
+        """Test that ingestion stops after the requested number of articles."""
+        articles = list(DumpReader(dump_path, workers=1).iter_articles(limit=2))
+        assert [a.page_id for a in articles] == [1, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,108 @@
+"""
+Tests for the pooled HTTP transport
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+import requests
+from rdflib import Graph, URIRef
+
+from src.utils.http_transport import create_session, get_transport_statistics, sparql_query, upload_timeout
+from tests.mediawiki_stub import MediaWikiStub, make_page
+
+
+@pytest.fixture
+def stub():
+    with MediaWikiStub({"Huế": make_page("Huế", page_id=1)}) as server:
+        yield server
+
+
+class TestHTTPTransport:
+
+    def test_connections_are_reused(self, stub):
+        """Test that sequential requests share one keep-alive connection."""
+        session = create_session()
+        for _ in range(5):
+            assert session.get(stub.base_url, params={"titles": "Huế"}).status_code == 200
+
+        stats = get_transport_statistics(session)
+        assert stats["requests"] == 5
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 4
+        assert stats["mean_latency_seconds"] > 0
+
+    def test_default_timeout_applies(self, stub):
+        """Test that the session timeout is enforced without passing it per request."""
+        stub.latency = 0.5
+        session = create_session(timeout=0.1, max_retries=0)
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            session.get(stub.base_url, params={"titles": "Huế"})
+        assert get_transport_statistics(session)["errors"] == 1
+
+    def test_retries_transient_server_errors(self, stub):
+        """Test that 502 is retried by the transport while 429 is left to the caller."""
+        session = create_session(backoff_factor=0)
+
+        stub.throttle(status=502)
+        assert session.get(stub.base_url, params={"titles": "Huế"}).status_code == 200
+        assert stub.request_count == 2
+
+        stub.throttle(status=429)
+        assert session.get(stub.base_url, params={"titles": "Huế"}).status_code == 429
+        assert stub.request_count == 3
+
+    def test_upload_timeout_allows_slow_reads(self, stub):
+        """Test that a per-request upload timeout overrides the session's read timeout."""
+        stub.latency = 0.3
+        session = create_session(timeout=0.1, max_retries=0)
+        response = session.get(stub.base_url, params={"titles": "Huế"}, timeout=upload_timeout(None))
+        assert response.status_code == 200
+
+
+class SPARQLHandler(BaseHTTPRequestHandler):
+    """Answers SELECT queries with JSON results and CONSTRUCT queries with Turtle."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8")
+        query = parse_qs(body)["query"][0]
+        if query.startswith("CONSTRUCT"):
+            payload, content_type = b"<http://a> <http://b> <http://c> .", "text/turtle; charset=utf-8"
+        else:
+            payload, content_type = b'{"head": {"vars": []}, "results": {"bindings": []}}', \
+                "application/sparql-results+json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSPARQLQuery:
+
+    def test_results_and_graphs(self):
+        """Test that SELECT gives JSON results and CONSTRUCT a parsed graph."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SPARQLHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}/sparql"
+        try:
+            session = create_session()
+            assert sparql_query(session, endpoint, "SELECT * WHERE { ?s ?p ?o }")["results"]["bindings"] == []
+
+            graph = sparql_query(session, endpoint, "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+            assert isinstance(graph, Graph)
+            assert list(graph) == [(URIRef("http://a"), URIRef("http://b"), URIRef("http://c"))]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
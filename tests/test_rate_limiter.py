@@ -0,0 +1,98 @@
+"""
+Tests for the adaptive per-host rate limiter
+"""
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+
+
+class TestRateLimiter:
+
+    def test_reservations_are_consecutive(self):
+        """Test that callers get consecutive slots once the burst is spent."""
+        limiter = RateLimiter(requests_per_second=10, burst_limit=2)
+        waits = [limiter.reserve() for _ in range(5)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+        stats = limiter.get_statistics()
+        assert stats["requests"] == 5
+        assert stats["delayed_requests"] == 3
+        assert stats["max_wait_seconds"] == pytest.approx(0.3, abs=0.01)
+
+    def test_waiting_does_not_hold_the_lock(self):
+        """Test that a thread waiting for its slot does not block other threads."""
+        limiter = RateLimiter(requests_per_second=2, burst_limit=1)
+        limiter.reserve()
+        sleeper = threading.Thread(target=limiter.acquire)
+        sleeper.start()
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        wait_time = limiter.reserve()
+        assert time.monotonic() - start < 0.05
+        assert wait_time == pytest.approx(1.0, abs=0.06)
+        sleeper.join()
+
+    def test_backs_off_and_recovers(self):
+        """Test throttling feedback with Retry-After and additive recovery."""
+        limiter = RateLimiter(requests_per_second=100, burst_limit=10, recovery_step=0.25)
+        limiter.record_throttle(retry_after=0.5)
+
+        assert limiter.rate == 50
+        assert limiter.reserve() == pytest.approx(0.5, abs=0.02)
+
+        limiter.record_success()
+        limiter.record_success()
+        limiter.record_success()
+        assert limiter.rate == 100
+        assert limiter.get_statistics()["throttled_responses"] == 1
+
+    def test_callers_queued_during_block_are_spaced_out(self):
+        """Test that a Retry-After block delays queued callers instead of releasing them together."""
+        limiter = RateLimiter(requests_per_second=10, burst_limit=5)
+        limiter.record_throttle(retry_after=0.5)
+
+        waits = [limiter.reserve() for _ in range(4)]
+        # The rate was halved to 5 req/s: one slot when the block ends, then one every 0.2 s
+        assert waits == pytest.approx([0.5, 0.7, 0.9, 1.1], abs=0.02)
+
+        # Time spent blocked does not refill the bucket
+        time.sleep(0.1)
+        assert limiter.reserve() == pytest.approx(1.2, abs=0.03)
+
+    def test_async_acquire(self):
+        """Test that coroutines share the bucket and wait outside the lock."""
+        limiter = RateLimiter(requests_per_second=50, burst_limit=1)
+
+        async def acquire_all():
+            return await asyncio.gather(*(limiter.acquire_async() for _ in range(4)))
+
+        start = time.monotonic()
+        waits = asyncio.run(acquire_all())
+        assert sorted(waits) == pytest.approx([0.0, 0.02, 0.04, 0.06], abs=0.01)
+        assert time.monotonic() - start < 0.15
+
+    def test_one_bucket_per_host(self):
+        """Test that the registry shares buckets by host only."""
+        wiki = get_rate_limiter("https://test-vi.wikipedia.org/w/api.php", 3, 4)
+
+        assert get_rate_limiter("https://test-vi.wikipedia.org/wiki/Huế") is wiki
+        assert get_rate_limiter("https://test-dbpedia.org/sparql") is not wiki
+        assert (wiki.requests_per_second, wiki.burst_limit) == (3, 4)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("3", 3.0), (" 0.5 ", 0.5), ("-1", 0.0), (None, None), ("soon", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ])
+    def test_parse_retry_after(self, value, expected):
+        assert parse_retry_after(value) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,209 @@
+"""
+Tests for the RDF transformer
+"""
+
+import io
+
+import pytest
+from rdflib import Graph, Dataset, URIRef, Literal, XSD
+
+from src.collectors.wikipedia_collector import WikipediaArticle
+from src.collectors.article_store import ArticleWriter
+from src.ontology.vietnam_ontology import VietnamOntology
+from src.transformers.rdf_transformer import RDFTransformer
+from src.transformers.category_classifier import CategoryClassifier
+from src.transformers.ntriples_writer import NTriplesWriter
+from src.transformers.property_mapping import InfoboxPropertyMap
+from src.transformers.literal_parsers import LiteralParser, parse_date, parse_number, parse_coordinates
+from src.transformers.parallel_transform import (
+    transform_parallel, merge_partials, load_partials, merge_transformation_stats
+)
+
+
+def make_article(i: int) -> WikipediaArticle:
+    return WikipediaArticle(
+        title=f"Nhân vật {i}",
+        page_id=i,
+        url=f"https://vi.wikipedia.org/wiki/Nhân_vật_{i}",
+        abstract="Một \"nhân vật\" lịch sử.\nDòng thứ hai.",
+        content="Nội dung.",
+        infobox={"template_type": "Thông tin nhân vật", "ngày sinh": f"{i}/5/1890", "nơi sinh": "Nghệ An",
+                 "dân số": "1.234 người"},
+        categories=["Thể loại:Nhà cách mạng Việt Nam", "Thể loại:Người Nghệ An"],
+        templates=["Thông tin nhân vật"],
+        revision_id=1000 + i,
+        last_modified="2024-01-01T00:00:00Z",
+    )
+
+
+@pytest.fixture(scope="module")
+def ontology():
+    return VietnamOntology()
+
+
+class TestStreamingTransform:
+
+    def test_stream_matches_graph(self, ontology, tmp_path):
+        """Test that streamed N-Triples describe the same graph as the in-memory transform."""
+        articles = [make_article(i) for i in range(1, 6)]
+
+        batch = RDFTransformer(ontology)
+        batch.transform_articles_batch(articles)
+
+        streaming = RDFTransformer(ontology)
+        path = tmp_path / "out.nt"
+        writer_stats = streaming.stream_rdf(iter(articles), str(path), chunk_size=7)
+
+        streamed = Graph().parse(str(path), format="nt")
+        assert set(streamed) == set(batch.graph)
+        assert len(streaming.graph) == 0
+        assert writer_stats['triples_written'] == streaming.get_transformation_statistics()['triples_generated']
+        assert writer_stats['flushes'] > 1
+        assert streaming.transformation_stats['articles_processed'] == 5
+
+    def test_nquads_to_stream(self, ontology):
+        """Test that a named graph produces N-Quads on any binary stream."""
+        buffer = io.BytesIO()
+        graph = "http://vi.dbpedia.org/graph/test"
+        with NTriplesWriter(buffer, graph=graph) as writer:
+            written = writer.write_all(RDFTransformer(ontology).iter_triples([make_article(1)]))
+
+        assert written > 0
+        dataset = Dataset().parse(data=buffer.getvalue().decode("utf-8"), format="nquads")
+        assert len(dataset.graph(URIRef(graph))) == written
+
+    def test_transform_article_count(self, ontology):
+        """Test that transform_article still counts the triples about the entity."""
+        transformer = RDFTransformer(ontology)
+        count = transformer.transform_article(make_article(1))
+        entity = transformer.create_entity_uri("Nhân vật 1")
+        assert count == len(list(transformer.graph.triples((entity, None, None))))
+        assert count > 0
+
+
+class TestParallelTransform:
+
+    def test_partials_match_single_process(self, ontology, tmp_path):
+        """Test that sharded partial files merge into the single-process graph and statistics."""
+        articles = [make_article(i) for i in range(1, 13)]
+        input_path = str(tmp_path / "articles.jsonl")
+        with ArticleWriter(input_path) as writer:
+            writer.write_many(iter(articles))
+
+        single = RDFTransformer(ontology)
+        single.transform_articles_batch(articles)
+
+        partials, stats = transform_parallel(input_path, str(tmp_path / "parts"), workers=2, shard_size=3)
+        assert partials
+        assert set(load_partials(partials)) == set(single.graph)
+        assert stats['articles_processed'] == 12
+        assert stats['template_mappings'] == {"Thông tin nhân vật": 12}
+
+        merged_path = str(tmp_path / "merged.nt")
+        merge_partials(partials, merged_path)
+        assert len(Graph().parse(merged_path, format="nt")) == len(single.graph)
+
+    def test_merge_transformation_stats(self):
+        """Test that worker statistics are summed, template counts included."""
+        merged = merge_transformation_stats([
+            {'articles_processed': 2, 'template_mappings': {'a': 1}, 'current_graph_size': 0},
+            {'articles_processed': 3, 'template_mappings': {'a': 2, 'b': 1}},
+        ])
+        assert merged == {'articles_processed': 5, 'template_mappings': {'a': 3, 'b': 1}}
+
+
+class TestCategoryClassifier:
+
+    def test_rank_by_votes_then_keyword_length(self):
+        """Test that classes are ranked by matching categories, not by table order."""
+        classifier = CategoryClassifier({"cách mạng": "HistoricalEvent", "người": "Person",
+                                         "di tích": "HistoricalSite", "di tích lịch sử": "HistoricalSite",
+                                         "lịch sử": "HistoricalEvent"})
+        ranked = classifier.rank(["Thể loại:Nhà cách mạng Việt Nam", "Thể loại:Người Nghệ An",
+                                  "Thể loại:Người đoạt giải Lenin"])
+        assert ranked == [("Person", 2), ("HistoricalEvent", 1)]
+        # The longest keyword wins where keywords overlap
+        assert classifier.match("Thể loại:Di tích lịch sử Huế") == (("HistoricalSite", 15),)
+
+    def test_whole_words_only(self):
+        """Test that keywords do not match inside longer words."""
+        classifier = CategoryClassifier({"xã": "Ward", "phim": "Film"})
+        assert classifier.classify(["Thể loại:Xã hội học"]) == "Ward"
+        assert classifier.classify(["Thể loại:Phimography"]) is None
+
+    def test_transformer_falls_back_to_superclass(self, ontology):
+        """Test that classes missing from the ontology resolve to their superclass."""
+        transformer = RDFTransformer(ontology)
+        assert transformer.category_classifier.classify(["Thể loại:Thành phố Việt Nam"]) == "City"
+        assert transformer._determine_class_from_categories(["Thể loại:Thành phố Việt Nam"]) == \
+            ontology.get_class_uri("Place")
+
+
+class TestInfoboxPropertyMapping:
+
+    def test_field_name_variants(self):
+        """Test that field names match after normalization and, without diacritics, folding."""
+        mapping = InfoboxPropertyMap({"ngày sinh": "birthDate", "tỉnh": "province", "thành lập": "foundingDate"})
+        assert mapping.get("Ngày_sinh") == "birthDate"
+        assert mapping.get("  NGÀY   sinh ") == "birthDate"
+        assert mapping.get("ngay sinh") == "birthDate"
+        assert mapping.get("tinh") == "province"
+        # A different word that only differs in its diacritics is not folded
+        assert mapping.get("tình") is None
+        assert len(mapping) == 3
+
+    def test_infobox_dispatch(self, ontology):
+        """Test that fields go through the converter bound to their property."""
+        transformer = RDFTransformer(ontology)
+        entity = transformer.create_entity_uri("Nhân vật 1")
+        transformer._triples = []
+        transformer._transform_infobox(entity, {"template_type": "x", "Ngày_sinh": "19/5/1890",
+                                                "noi sinh": "Nghệ An", "biệt danh": " Bác Hồ "}, None)
+        triples = {(p, o) for s, p, o in transformer._triples if s == entity}
+
+        assert (ontology.get_property_uri("birthDate"), Literal("1890-05-19", datatype=XSD.date)) in triples
+        assert (ontology.get_property_uri("birthPlace"), transformer.create_entity_uri("Nghệ An")) in triples
+        assert (transformer.create_entity_uri("biệt danh", "property"), Literal(" Bác Hồ ", lang="vi")) in triples
+
+
+class TestLiteralParsers:
+
+    def test_dates_typed_by_precision(self):
+        """Test that full dates, months and bare years get xsd:date, xsd:gYearMonth and xsd:gYear."""
+        assert parse_date("26 tháng 12 năm 1867") == Literal("1867-12-26", datatype=XSD.date)
+        assert parse_date("{{ngày mất và tuổi|1300|10|03|1228") == Literal("1300-10-03", datatype=XSD.date)
+        assert parse_date("tháng 8 năm 1945") == Literal("1945-08", datatype=XSD.gYearMonth)
+        assert parse_date("1226") == Literal("1226", datatype=XSD.gYear)
+        assert parse_date("938") == Literal("0938", datatype=XSD.gYear)
+        assert parse_date("không rõ") is None
+        # Digit groups of grouped numbers are not years
+        assert parse_date("1.500") is None
+        assert parse_date("8.053.663") is None
+        assert parse_date("1,234 người") is None
+        assert parse_date("050") is None
+
+    def test_numbers_and_coordinates(self):
+        """Test Vietnamese digit grouping, decimal commas and coordinate forms."""
+        assert parse_number("8.053.663 người") == Literal(8053663, datatype=XSD.integer)
+        assert parse_number("11.114,71 km²") == Literal("11114.71", datatype=XSD.decimal)
+        assert parse_number("không") is None
+        assert str(parse_coordinates("{{coord|21|01|42|N|105|51|12|E|display=title}}")) == "21.028333,105.853333"
+        assert str(parse_coordinates("10°46′N 106°42′E")) == "10.766667,106.7"
+        assert str(parse_coordinates("-33.86, 151.2")) == "-33.86,151.2"
+
+    def test_parse_column_memoized(self, ontology):
+        """Test that a column parses each distinct value once and primes the transformer's cache."""
+        parser = LiteralParser()
+        column = parser.parse_column('date', ["1890", "19/5/1890", "1890", "x"])
+        assert column == [Literal("1890", datatype=XSD.gYear), Literal("1890-05-19", datatype=XSD.date),
+                          Literal("1890", datatype=XSD.gYear), None]
+        assert parser.get_statistics()['cache_misses'] == 3
+
+        transformer = RDFTransformer(ontology)
+        triples = list(transformer.iter_triples(make_article(i) for i in range(1, 4)))
+        stats = transformer.get_transformation_statistics()
+        # The three birth dates are parsed ahead, then found by each article
+        assert stats['literal_cache_misses'] == 3
+        assert stats['literal_cache_hits'] == 3
+        assert (transformer.create_entity_uri("Nhân vật 2"), ontology.get_property_uri("birthDate"),
+                Literal("1890-05-02", datatype=XSD.date)) in triples
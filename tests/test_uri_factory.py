@@ -0,0 +1,71 @@
+"""
+Tests for the shared URI factory
+"""
+
+from types import SimpleNamespace
+
+from rdflib import Graph, OWL
+
+from src.collectors.title_aliases import TitleAliasTable
+from src.entity_linking.entity_linker import EntityLinker, EntityMatch
+from src.ontology.vietnam_ontology import VietnamOntology
+from src.transformers.rdf_transformer import RDFTransformer
+from src.utils.uri_factory import URIFactory, clean_title, get_uri_factory
+
+
+class TestURIFactory:
+
+    def test_clean_title(self):
+        """Test that punctuation collapses to single underscores and diacritics survive."""
+        assert clean_title("Thành phố Hồ Chí Minh") == "Thành_phố_Hồ_Chí_Minh"
+        assert clean_title("  Chiến tranh (1946–1954), Việt Nam ") == "Chiến_tranh_1946_1954_Việt_Nam"
+
+    def test_mint_is_memoized(self):
+        """Test that repeated titles are served from the cache as the same URIRef."""
+        factory = URIFactory(cache_size=2)
+        first = factory.resource("Hà Nội")
+        assert factory.resource("Hà Nội") is first
+        assert str(first) == "http://vi.dbpedia.org/resource/H%C3%A0_N%E1%BB%99i"
+        assert str(factory.property("ngày sinh")).startswith("http://vi.dbpedia.org/property/")
+
+        factory.resource("Huế")
+        factory.resource("Đà Nẵng")
+        stats = factory.get_statistics()
+        assert stats['hits'] == 1
+        assert stats['cached'] == 2
+        assert stats['hit_rate'] == 1 / 5
+
+    def test_shared_by_transformer_and_linker(self, tmp_path):
+        """Test that the linker mints the same vires: URI as the transformer."""
+        transformer = RDFTransformer(VietnamOntology())
+        linker = EntityLinker()
+        assert linker.uri_factory is transformer.uri_factory is get_uri_factory()
+
+        title = "Chiến dịch Điện Biên Phủ (1954)"
+        match = EntityMatch(title, "Battle of Dien Bien Phu", "http://dbpedia.org/resource/Battle_of_Dien_Bien_Phu",
+                            0.95, {}, "language_links")
+        output_path = str(tmp_path / "links.ttl")
+        linker.export_links_to_rdf({title: [match]}, output_path)
+
+        subjects = set(Graph().parse(output_path, format="turtle").subjects(OWL.sameAs, None))
+        assert subjects == {transformer.create_entity_uri(title)}
+
+    def test_linker_batch_keeps_requested_titles(self):
+        """Test that aliased titles are linked once and looked up under the titles given."""
+        aliases = TitleAliasTable()
+        aliases.add_many([("Bác Hồ", "Hồ Chí Minh", 100)])
+        linker = EntityLinker(aliases=aliases)
+        linked = []
+
+        def find_matching_entities(title):
+            linked.append(title)
+            return [EntityMatch(title, "Ho Chi Minh", "http://dbpedia.org/resource/Ho_Chi_Minh",
+                                0.95, {}, "language_links")]
+        linker.find_matching_entities = find_matching_entities
+
+        titles = ["Bác Hồ", "Hồ Chí Minh", "Bác Hồ"]
+        matches = linker.link_articles_batch(SimpleNamespace(title=title) for title in titles)
+
+        assert linked == ["Hồ Chí Minh"]
+        assert sorted(matches) == ["Bác Hồ", "Hồ Chí Minh"]
+        assert matches["Bác Hồ"] is matches["Hồ Chí Minh"]
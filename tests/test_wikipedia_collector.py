@@ -0,0 +1,429 @@
+"""
+Tests for Wikipedia collectors against a local stub MediaWiki server
+"""
+
+import time
+import hashlib
+import threading
+
+import pytest
+import yaml
+
+from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.async_collector import AsyncWikipediaCollector
+from src.collectors.pipeline_collector import PipelineCollector
+from src.collectors.response_cache import ResponseCache
+from src.collectors.crawl_journal import CrawlJournal
+from src.collectors.category_crawler import CategoryCrawler
+from src.collectors.article_store import iter_articles, write_articles
+from src.collectors.wikitext_store import reparse_articles
+from src.collectors.title_aliases import TitleAliasTable, normalize_title
+from src.collectors.multi_wiki_collector import MultiWikiCollector
+from tests.mediawiki_stub import MediaWikiStub, make_page
+
+
+TITLES = ["Hồ Chí Minh", "Nguyễn Trãi", "Võ Nguyên Giáp", "Nguyễn Du", "Hà Nội"]
+
+
+@pytest.fixture
+def stub():
+    pages = {title: make_page(title, page_id=100 + i) for i, title in enumerate(TITLES)}
+    with MediaWikiStub(pages) as server:
+        yield server
+
+
+@pytest.fixture
+def config_path(stub, tmp_path):
+    """Write a collector config that points at the stub server."""
+    with open("config/wikipedia.yaml", "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+
+    config["wikipedia"]["base_url"] = stub.base_url
+    config["wikipedia"]["rate_limit"]["requests_per_second"] = 1000
+    config["wikipedia"]["rate_limit"]["burst_limit"] = 1000
+    config["sample_articles"] = {"people": TITLES[:3]}
+    config["cache"]["enabled"] = False
+    config["cache"]["path"] = str(tmp_path / "cache.sqlite")
+    config["wikitext_store"]["path"] = str(tmp_path / "wikitext.sqlite")
+    config["title_aliases"]["path"] = str(tmp_path / "aliases.sqlite")
+
+    path = tmp_path / "wikipedia.yaml"
+    path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding="utf-8")
+    return str(path)
+
+
+class TestWikipediaCollector:
+
+    def test_get_article_by_title(self, config_path):
+        """Test fetching a single article through the sync path."""
+        collector = WikipediaCollector(config_path)
+        article = collector.get_article_by_title("Hồ Chí Minh")
+
+        assert article is not None
+        assert article.page_id == 100
+        assert article.infobox["tên"] == "Hồ Chí Minh"
+        assert article.categories == ["Thể loại:Nhân vật lịch sử Việt Nam"]
+
+    def test_missing_article(self, config_path):
+        """Test that missing pages are recorded as failures."""
+        collector = WikipediaCollector(config_path)
+
+        assert collector.get_article_by_title("Không tồn tại") is None
+        assert "Không tồn tại" in collector.failed_articles
+
+    def test_batched_titles_follow_continuation(self, stub, config_path):
+        """Test that a batch is fetched with multi-title queries and no parse calls."""
+        for i in range(30):
+            stub.add_page(make_page(f"Bài viết {i}", page_id=1000 + i))
+        titles = [f"Bài_viết_{i}" for i in range(30)]
+
+        collector = WikipediaCollector(config_path)
+        articles = collector.get_articles_by_titles(titles)
+
+        assert [a.title for a in articles] == [t.replace("_", " ") for t in titles]
+        assert all(a.abstract and a.infobox for a in articles)
+        assert all(params.get("action") != "parse" for params in stub.request_log)
+        # One query plus one continuation for the remaining intro extracts
+        assert stub.request_count == 2
+
+    def test_backs_off_on_server_throttling(self, stub, config_path):
+        """Test that 429 with Retry-After and maxlag errors are retried after backing off."""
+        stub.throttle(status=429, retry_after="0.2")
+        stub.throttle(maxlag=True, retry_after="0.1")
+
+        collector = WikipediaCollector(config_path)
+        start = time.monotonic()
+        article = collector.get_article_by_title("Nguyễn Du")
+
+        assert article is not None and article.title == "Nguyễn Du"
+        assert time.monotonic() - start >= 0.3
+        assert stub.request_count == 3
+        assert all(params["maxlag"] == "5" for params in stub.request_log)
+        limiter_stats = collector.get_collection_statistics()["rate_limiter"]
+        assert limiter_stats["throttled_responses"] == 2
+        assert limiter_stats["current_rate"] < 1000
+
+
+class TestResponseCache:
+
+    def test_rerun_revalidates_instead_of_refetching(self, stub, config_path):
+        """Test that unchanged pages are served from cache after one prop=info call."""
+        WikipediaCollector(config_path, use_cache=True).get_articles_by_titles(TITLES)
+
+        stub.pages["Hà Nội"]["revid"] += 1
+        stub.pages["Hà Nội"]["extract"] = "Đã cập nhật."
+        stub.request_log.clear()
+
+        collector = WikipediaCollector(config_path, use_cache=True)
+        articles = collector.get_articles_by_titles(TITLES)
+
+        assert [a.title for a in articles] == TITLES
+        assert articles[-1].abstract == "Đã cập nhật."
+        assert [p["prop"] for p in stub.request_log] == ["info", stub.request_log[1]["prop"]]
+        assert stub.request_log[1]["titles"] == "Hà Nội"
+
+        cache_stats = collector.get_collection_statistics()["cache"]
+        assert cache_stats["revalidated"] == 4
+        assert cache_stats["stale"] == 1
+
+    def test_size_based_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first."""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_size_bytes=2000)
+        for i in range(20):
+            data = "".join(hashlib.sha256(f"{i}-{j}".encode()).hexdigest() for j in range(10))
+            cache.put_response({"titles": f"Trang {i}"}, {"data": data})
+
+        stats = cache.get_statistics()
+        assert stats["evictions"] > 0
+        assert stats["size_bytes"] <= 2000
+        assert cache.get_response({"titles": "Trang 19"}) is not None
+        assert cache.get_response({"titles": "Trang 0"}) is None
+
+
+class TestCrawlJournal:
+
+    def test_resume_skips_completed_titles(self, stub, config_path, tmp_path):
+        """Test that a resumed crawl only fetches the remaining titles."""
+        journal_path = str(tmp_path / "crawl.journal.jsonl")
+
+        collector = WikipediaCollector(config_path)
+        with CrawlJournal(journal_path, flush_every=1).open() as journal:
+            collector.use_journal(journal)
+            collector.get_articles_by_titles(TITLES[:3])
+            collector.get_articles_by_titles(["Không tồn tại"])
+
+        # Simulate a crash in the middle of writing a record
+        with open(journal_path, "a", encoding="utf-8") as file:
+            file.write('{"type": "article", "requ')
+        stub.request_log.clear()
+
+        collector = WikipediaCollector(config_path)
+        with CrawlJournal(journal_path).open(resume=True) as journal:
+            collector.use_journal(journal)
+            articles = collector.get_articles_by_titles(TITLES + ["Không tồn tại"])
+
+        assert [a.title for a in articles] == TITLES
+        fetched = [t for params in stub.request_log for t in params["titles"].split("|")]
+        assert sorted(fetched) == sorted(TITLES[3:] + ["Không tồn tại"])
+
+    def test_resume_reuses_category_frontier(self, stub, config_path, tmp_path):
+        """Test that journaled category listings are not requested again."""
+        journal_path = str(tmp_path / "crawl.journal.jsonl")
+        category = "Thể loại:Nhân vật lịch sử Việt Nam"
+
+        with CrawlJournal(journal_path).open() as journal:
+            collector = WikipediaCollector(config_path)
+            collector.use_journal(journal)
+            collector.get_category_member_titles(category, 10)
+        stub.request_log.clear()
+
+        with CrawlJournal(journal_path).open(resume=True) as journal:
+            collector = WikipediaCollector(config_path)
+            collector.use_journal(journal)
+            articles = collector.get_articles_from_category(category, 10)
+
+        assert len(articles) == len(TITLES)
+        assert all(params.get("list") != "categorymembers" for params in stub.request_log)
+
+
+class TestCategoryCrawler:
+
+    ROOT = "Thể loại:Gốc"
+    CHILD = "Thể loại:Con"
+    GRANDCHILD = "Thể loại:Cháu"
+
+    @pytest.fixture
+    def category_tree(self, stub):
+        """Root with 5 pages and a subcategory chain; one page sits in both levels."""
+        for title in TITLES:
+            stub.pages[title]["categories"] = [self.ROOT]
+        stub.pages["Hà Nội"]["categories"].append(self.CHILD)
+        stub.add_page(make_page(self.CHILD, page_id=900, categories=[self.ROOT]))
+        stub.add_page(make_page(self.GRANDCHILD, page_id=901, categories=[self.CHILD]))
+        stub.add_page(make_page("Huế", page_id=200, categories=[self.CHILD]))
+        stub.add_page(make_page("Hội An", page_id=201, categories=[self.GRANDCHILD]))
+        return stub
+
+    def test_crawl_pages_dedups_and_respects_depth(self, category_tree, config_path):
+        """Test cmcontinue paging, subcategory depth and page-id dedup."""
+        collector = WikipediaCollector(config_path)
+        crawler = CategoryCrawler(collector, max_depth=1)
+        crawler.page_size = 2
+
+        titles = crawler.crawl([self.ROOT])
+
+        assert titles == TITLES + ["Huế"]
+        assert crawler.get_statistics()["duplicates_skipped"] == 1
+        # Root listing (6 members) needs three pages, the child listing two
+        assert crawler.get_statistics()["listing_requests"] == 5
+
+        assert CategoryCrawler(collector, max_depth=2).crawl([self.ROOT])[-1] == "Hội An"
+        assert CategoryCrawler(collector, max_depth=0).crawl([self.ROOT]) == TITLES
+
+    def test_limit_keeps_subcategories_and_is_journaled(self, category_tree, config_path, tmp_path):
+        """Test that a cut listing still lists every subcategory and is reused on resume."""
+        # Subcategories sort after the pages, past where a limit of 2 cuts the listing
+        category_tree.add_page(make_page("Thể loại:Khác", page_id=902, categories=[self.ROOT]))
+        journal_path = str(tmp_path / "crawl.journal.jsonl")
+
+        with CrawlJournal(journal_path).open() as journal:
+            collector = WikipediaCollector(config_path)
+            collector.use_journal(journal)
+            crawler = CategoryCrawler(collector)
+            crawler.page_size = 2
+            members = crawler.list_members(self.ROOT, limit=2)
+
+        assert [m.title for m in members] == TITLES[:2] + [self.CHILD, "Thể loại:Khác"]
+        category_tree.request_log.clear()
+
+        with CrawlJournal(journal_path).open(resume=True) as journal:
+            collector = WikipediaCollector(config_path)
+            collector.use_journal(journal)
+            assert CategoryCrawler(collector).list_members(self.ROOT, limit=1) == members[:1] + members[2:]
+            assert not category_tree.request_log
+            # A larger limit than the journaled listing covers is listed again
+            assert len(CategoryCrawler(collector).list_members(self.ROOT, limit=4)) == 6
+            assert category_tree.request_log
+
+    def test_articles_are_fetched_once(self, category_tree, config_path, tmp_path):
+        """Test that pages shared by several categories are fetched only once."""
+        config = yaml.safe_load(open(config_path, encoding="utf-8"))
+        config["target_categories"] = {"a": [self.ROOT], "b": [self.CHILD]}
+        path = tmp_path / "categories.yaml"
+        path.write_text(yaml.safe_dump(config, allow_unicode=True), encoding="utf-8")
+        category_tree.request_log.clear()
+
+        articles = WikipediaCollector(str(path)).collect_articles_by_categories(10)
+
+        # "Hội An" is reached through the second root's subcategory
+        assert [a.title for a in articles] == TITLES + ["Huế", "Hội An"]
+        fetched = [
+            t for params in category_tree.request_log if "titles" in params
+            for t in params["titles"].split("|")
+        ]
+        assert sorted(fetched) == sorted(TITLES + ["Huế", "Hội An"])
+
+
+class TestTitleAliases:
+
+    def test_aliases_and_redirects_are_fetched_once(self, config_path, stub, tmp_path):
+        """Test that underscored titles and redirects resolve to one collected page."""
+        stub.redirects["Bác Hồ"] = "Hồ Chí Minh"
+        collector = WikipediaCollector(config_path)
+
+        articles = collector.get_articles_by_titles(["Hồ_Chí_Minh", "Bác Hồ", "Hà Nội"])
+        assert [a.title for a in articles] == ["Hồ Chí Minh", "Hà Nội"]
+        assert sorted(collector.collected_articles) == ["Hà Nội", "Hồ Chí Minh"]
+
+        request_count = stub.request_count
+        for title in ("Bác Hồ", "Hồ Chí Minh", "hồ_Chí_Minh"):
+            assert collector.get_article_by_title(title) is articles[0]
+        assert stub.request_count == request_count
+
+        # The table is persisted for later runs and the entity linker
+        collector.aliases.close()
+        aliases = TitleAliasTable(str(tmp_path / "aliases.sqlite"))
+        assert aliases.lookup("Bác_Hồ") == ("Hồ Chí Minh", 100)
+
+    def test_normalize_title(self):
+        assert normalize_title("  hồ_Chí__Minh#Tiểu sử ") == "Hồ Chí Minh"
+
+
+class TestWikitextStore:
+
+    def test_reparse_rebuilds_infoboxes_offline(self, config_path, stub, tmp_path):
+        """Test that stored wikitext restores infoboxes without new requests."""
+        collector = WikipediaCollector(config_path, store_wikitext=True)
+        articles = collector.get_articles_by_titles(TITLES)
+        assert len(collector.wikitext_store) == len(TITLES)
+
+        stale = tmp_path / "stale.jsonl"
+        for article in articles:
+            article.infobox = {}
+        write_articles(articles, str(stale))
+
+        request_count = stub.request_count
+        output = tmp_path / "reparsed.jsonl"
+        stats = reparse_articles(str(stale), collector.wikitext_store, str(output), workers=2)
+
+        assert stub.request_count == request_count
+        assert stats["reparsed"] == len(TITLES) and stats["missing_wikitext"] == 0
+        assert [a.infobox["tên"] for a in iter_articles(str(output))] == TITLES
+
+
+class TestAsyncWikipediaCollector:
+
+    def test_matches_sync_collector(self, config_path):
+        """Test that the async engine produces the same articles as the sync path."""
+        sync_articles = [WikipediaCollector(config_path).get_article_by_title(t) for t in TITLES]
+
+        engine = AsyncWikipediaCollector(WikipediaCollector(config_path), max_in_flight=4)
+        async_articles = engine.collect_titles(TITLES)
+
+        assert async_articles == sync_articles
+
+    def test_sample_articles_and_failures(self, config_path):
+        """Test sample collection and failure tracking."""
+        engine = AsyncWikipediaCollector(WikipediaCollector(config_path), max_in_flight=2)
+
+        articles = engine.collect_sample_articles()
+        assert [a.title for a in articles] == TITLES[:3]
+
+        assert engine.collect_titles(["Không tồn tại"]) == []
+        assert "Không tồn tại" in engine.failed_articles
+
+    def test_batches_are_stored_off_the_event_loop(self, config_path):
+        """Test that building and journaling a batch does not block the event loop."""
+        collector = WikipediaCollector(config_path)
+        store_batch_results = collector._store_batch_results
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return store_batch_results(*args, **kwargs)
+
+        collector._store_batch_results = record_thread
+        articles = AsyncWikipediaCollector(collector, max_in_flight=2).collect_titles(TITLES)
+
+        assert [a.title for a in articles] == TITLES
+        assert threads and threading.get_ident() not in threads
+
+
+class TestPipelineCollector:
+
+    def test_matches_sync_collector(self, config_path):
+        """Test that parsing in worker processes produces the same articles as the sync path."""
+        sync_articles = [WikipediaCollector(config_path).get_article_by_title(t) for t in TITLES]
+
+        engine = PipelineCollector(WikipediaCollector(config_path), parse_workers=2)
+        assert engine.collect_titles(TITLES) == sync_articles
+
+        stats = engine.get_statistics()
+        assert stats["fetched_pages"] == stats["parsed_pages"] == len(TITLES)
+
+    def test_bounded_queue_and_failures(self, config_path):
+        """Test that fetchers never buffer more than the queue allows."""
+        collector = WikipediaCollector(config_path)
+        collector.extraction_config["batch_size"] = 1
+        engine = PipelineCollector(collector, fetch_workers=3, parse_workers=1, queue_size=1)
+
+        articles = engine.collect_titles(TITLES + ["Không tồn tại"])
+        assert [a.title for a in articles] == TITLES
+        assert "Không tồn tại" in engine.failed_articles
+
+        stats = engine.get_statistics()
+        assert stats["fetched_batches"] == len(TITLES) + 1
+        assert stats["max_queue_depth"] <= 1
+
+
+class TestMultiWikiCollector:
+
+    def test_counterparts_are_collected_concurrently_per_host(self, stub, config_path):
+        """Test that other wikis are collected side by side, each with its own budget."""
+        stub.pages["Hà Nội"]["langlinks"] = {"en": "Hanoi", "fr": "Hanoï", "de": "Hanoi"}
+        stub.pages["Hồ Chí Minh"]["langlinks"] = {"en": "Ho Chi Minh"}
+        en_pages = {
+            "Hanoi": make_page("Hanoi", page_id=1, wikitext="{{Infobox settlement\n| name = Hanoi\n}}"),
+            "Ho Chi Minh": make_page("Ho Chi Minh", page_id=2),
+        }
+        fr_pages = {"Hanoï": make_page("Hanoï", page_id=1)}
+
+        with MediaWikiStub(en_pages, latency=0.3) as en, MediaWikiStub(fr_pages, latency=0.3) as fr:
+            with open(config_path, "r", encoding="utf-8") as file:
+                config = yaml.safe_load(file)
+            config["wikis"] = {
+                "en": {"base_url": en.base_url, "rate_limit": {"requests_per_second": 1000}},
+                "fr": {"base_url": fr.base_url, "rate_limit": {"requests_per_second": 1000}},
+            }
+            with open(config_path, "w", encoding="utf-8") as file:
+                yaml.safe_dump(config, file, allow_unicode=True)
+
+            source = WikipediaCollector(config_path)
+            articles = source.get_articles_by_titles(TITLES)
+            multi = MultiWikiCollector(["en", "fr"], config_path)
+            results = multi.collect_counterparts(source, articles)
+
+        assert sorted(a.title for a in results["en"]) == ["Hanoi", "Ho Chi Minh"]
+        hanoi = next(a for a in results["en"] if a.title == "Hanoi")
+        assert hanoi.language == "en"
+        assert hanoi.url == "https://en.wikipedia.org/wiki/Hanoi"
+        assert hanoi.infobox["name"] == "Hanoi"
+        assert [a.page_id for a in results["fr"]] == [1]
+        assert multi.language_links["Hà Nội"] == {"en": "Hanoi", "fr": "Hanoï"}
+
+        en_collector, fr_collector = multi.collectors["en"], multi.collectors["fr"]
+        assert len({id(source.rate_limiter), id(en_collector.rate_limiter), id(fr_collector.rate_limiter)}) == 3
+        assert en_collector.session is not fr_collector.session
+        assert en_collector.aliases.table_path.endswith("aliases.en.sqlite")
+
+        stats = multi.get_statistics()
+        assert stats["elapsed_seconds"] < stats["sequential_seconds"] * 0.8
+
+    def test_unknown_wiki(self, config_path):
+        """Test that a wiki missing from the config is rejected."""
+        with pytest.raises(ValueError):
+            WikipediaCollector(config_path, wiki="xx")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,114 @@
+"""
+Tests for wikitext parsing and markup cleanup
+"""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.collectors.wikitext_parser import (
+    clean_wiki_markup, parse_infobox, parse_infobox_parameters, parse_infobox_and_templates,
+    parse_templates, _clean_wiki_markup_by_passes
+)
+
+
+GOLDEN_PATH = Path(__file__).parent / "fixtures" / "wikitext_cleaner_golden.json"
+
+FRAGMENTS = [
+    "a", "Hà Nội", " ", "\n", "\t", "[", "]", "[[", "]]", "{", "}", "{{", "}}", "|",
+    "'", "''", "'''", "<", ">", "<br/>", "<!--", "-->", "http://", "https://e.org",
+    "[http://x", "File:", "Image:", "[[File:", "[[File:x|y]]", "<ref>", "</ref>", "=",
+]
+
+
+class TestCleanWikiMarkup:
+
+    def test_golden_corpus(self):
+        """Test that the scanner matches the original regex chain on the golden corpus."""
+        golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+        mismatches = [case["input"] for case in golden
+                      if clean_wiki_markup(case["input"]) != case["expected"]]
+        assert mismatches == []
+
+    def test_matches_reference_passes_on_random_markup(self):
+        """Test random fragment soups against the reference substitution chain."""
+        rng = random.Random(20240101)
+        for _ in range(5000):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 16)))
+            assert clean_wiki_markup(text) == _clean_wiki_markup_by_passes(text), repr(text)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("'''[[Hà Nội|Thủ đô]]''' của {{nowrap|{{lang|vi|Việt Nam}}}}", "Thủ đô của"),
+        ("[https://vi.wikipedia.org Wikipedia] <ref>nguồn</ref><!-- ẩn -->", "Wikipedia nguồn"),
+        ("[[File:a.jpg|nhỏ|[[Huế]]]] Huế", "Huế"),
+        ("{{birth date|df=y|1890|5|19", "{{birth date|df=y|1890|5|19"),
+    ])
+    def test_examples(self, text, expected):
+        assert clean_wiki_markup(text) == expected
+
+
+class TestTemplateParser:
+
+    PROVINCE = (
+        "{{Hộp thông tin đơn vị hành chính\n"
+        "| tên = [[Thừa Thiên Huế|Thừa Thiên – Huế]]\n"
+        "| dân số = {{formatnum:1128620}} người<ref>{{chú thích web|url=https://gso.gov.vn}}</ref>\n"
+        "| tọa độ = {{Coord|16|28|N|107|36|E}}\n"
+        "| tỉnh lỵ = [[Huế]] <!-- thành phố | trực thuộc -->\n"
+        "| diện tích = 4.947,1 km²\n"
+        "}}\n"
+        "'''Thừa Thiên Huế''' là một tỉnh {{lang|vi|ven biển}}. {{Coord|1|2}}\n"
+        "{{Sơ khai địa lý}}"
+    )
+
+    def test_parse_infobox(self):
+        """Test that infobox values are cleaned."""
+        infobox = parse_infobox("{{Thông tin nhân vật\n| tên = '''[[Nguyễn Du]]'''\n}}")
+        assert infobox == {"template_type": "nhân vật", "tên": "Nguyễn Du"}
+
+    def test_nested_templates_do_not_truncate_infobox(self):
+        """Test that fields after nested templates, piped links and comments are kept."""
+        infobox = parse_infobox(self.PROVINCE)
+
+        assert infobox == {
+            "template_type": "đơn vị hành chính",
+            "tên": "Thừa Thiên – Huế",
+            "dân số": "người",
+            "tỉnh lỵ": "Huế",
+            "diện tích": "4.947,1 km²",
+        }
+
+    def test_top_level_templates(self):
+        """Test that only top-level templates are returned, with raw parameters."""
+        templates = parse_templates(self.PROVINCE)
+
+        assert [t.name for t in templates] == [
+            "Hộp thông tin đơn vị hành chính", "lang", "Coord", "Sơ khai địa lý"
+        ]
+        assert templates[0].params["tọa độ"] == "{{Coord|16|28|N|107|36|E}}"
+        assert templates[2].positional == ["1", "2"]
+        assert self.PROVINCE[templates[1].start:templates[1].end] == "{{lang|vi|ven biển}}"
+
+        infobox, others = parse_infobox_and_templates(self.PROVINCE, names=["coord"])
+        assert infobox["template_type"] == "đơn vị hành chính"
+        assert [(t.name, t.positional) for t in others] == [("Coord", ["1", "2"])]
+
+    @pytest.mark.parametrize("wikitext, names", [
+        ("{{a|{{b|c}}", ["b"]),
+        ("{{a}} }} {{b|x=[[c|d]]}}", ["a", "b"]),
+        ("<!-- {{a}} --> {{b|c=<!-- | -->d}}", ["b"]),
+        ("{{a|[[b|{{c|d}}]]|e=f}}", ["a"]),
+    ])
+    def test_unbalanced_markup(self, wikitext, names):
+        assert [t.name for t in parse_templates(wikitext)] == names
+
+    def test_parse_infobox_parameters(self):
+        """Test that pipes in links and nested templates do not split parameters."""
+        params = parse_infobox_parameters("nhân vật|nơi sinh=[[Nghi Xuân|huyện Nghi Xuân]]|năm={{b|1765}} 1765|x")
+        assert params == {"nơi sinh": "huyện Nghi Xuân", "năm": "1765"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,150 @@
+"""
+Tests for the shared work frontier used by multi-node collection
+"""
+
+import threading
+
+import pytest
+
+from src.collectors import article_store
+from src.collectors.wikipedia_collector import WikipediaCollector
+from src.collectors.article_store import iter_articles, append_article_batch, truncate_torn_tail
+from src.collectors.work_frontier import WorkFrontier, FrontierWorker
+from tests.mediawiki_stub import MediaWikiStub, make_page
+from tests.test_wikipedia_collector import config_path  # noqa: F401
+
+
+TITLES = [f"Bài viết {i}" for i in range(12)]
+
+
+@pytest.fixture
+def stub():
+    pages = {title: make_page(title, page_id=100 + i) for i, title in enumerate(TITLES)}
+    with MediaWikiStub(pages) as server:
+        yield server
+
+
+class TestWorkFrontier:
+
+    def test_leases_expire_and_attempts_are_limited(self, tmp_path):
+        """Test claiming, lease expiry and the attempt limit."""
+        path = str(tmp_path / "frontier.sqlite")
+        first = WorkFrontier(path, lease_seconds=0.05, max_attempts=2, worker_id="a")
+        second = WorkFrontier(path, lease_seconds=60, max_attempts=2, worker_id="b")
+
+        assert first.add_titles(["Hà_Nội", "Huế", "Hà Nội"]) == 2
+        assert sorted(first.claim(10)) == ["Huế", "Hà Nội"]
+        assert second.claim(10) == []
+
+        # The first worker stalls; its lease runs out and the titles move on
+        threading.Event().wait(0.1)
+        assert sorted(second.claim(10)) == ["Huế", "Hà Nội"]
+        first.complete(["Huế"])
+        second.complete(["Huế"])
+        second.fail(["Hà Nội"])
+        assert second.counts()["done"] == 1 and second.counts()["pending"] == 1
+
+        second.claim(10)
+        second.fail(["Hà Nội"])
+        assert second.counts()["failed"] == 1
+        assert second.is_drained()
+
+    def test_request_schedule_is_shared(self, tmp_path):
+        """Test that two nodes draw consecutive slots from one budget."""
+        path = str(tmp_path / "frontier.sqlite")
+        nodes = [WorkFrontier(path, worker_id=name) for name in ("a", "b")]
+
+        waits = [nodes[i % 2].reserve_request("vi.wikipedia.org", 0.1, 2) for i in range(5)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.03)
+
+    def test_shared_block_spaces_out_queued_requests(self, tmp_path):
+        """Test that requests queued during a shared block are not released together."""
+        path = str(tmp_path / "frontier.sqlite")
+        nodes = [WorkFrontier(path, worker_id=name) for name in ("a", "b")]
+        nodes[0].block_requests("vi.wikipedia.org", 0.5)
+
+        waits = [nodes[i % 2].reserve_request("vi.wikipedia.org", 0.1, 3) for i in range(3)]
+        assert waits == pytest.approx([0.5, 0.6, 0.7], abs=0.03)
+
+
+class TestFrontierWorker:
+
+    def test_workers_drain_frontier_without_duplicates(self, config_path, tmp_path):
+        """Test that concurrent workers collect every title exactly once."""
+        path = str(tmp_path / "frontier.sqlite")
+        WorkFrontier(path).add_titles(TITLES)
+        output = str(tmp_path / "articles-{worker}.jsonl")
+
+        workers = [
+            FrontierWorker(WikipediaCollector(config_path), WorkFrontier(path, worker_id=name),
+                           output, batch_size=3, idle_seconds=0.05)
+            for name in ("a", "b")
+        ]
+        threads = [threading.Thread(target=worker.run) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        collected = [
+            article.title
+            for worker in workers
+            for article in iter_articles(worker.output_path)
+        ]
+        assert sorted(collected) == sorted(TITLES)
+        assert WorkFrontier(path).counts()["done"] == len(TITLES)
+
+    def test_output_path_must_be_per_worker(self, config_path, tmp_path):
+        """Test that workers cannot be pointed at one shared article file."""
+        with pytest.raises(ValueError):
+            FrontierWorker(WikipediaCollector(config_path), WorkFrontier(str(tmp_path / "frontier.sqlite")),
+                           str(tmp_path / "articles.jsonl.gz"))
+
+    def test_titles_completed_only_after_batch_is_written(self, config_path, tmp_path, monkeypatch):
+        """Test that a batch that never reaches disk is handed back instead of marked done."""
+        path = str(tmp_path / "frontier.sqlite")
+        WorkFrontier(path).add_titles(TITLES[:3])
+        worker = FrontierWorker(WikipediaCollector(config_path), WorkFrontier(path, worker_id="a"),
+                                str(tmp_path / "articles-{worker}.jsonl.gz"), batch_size=3)
+
+        def crash(output_path, articles):
+            raise KeyboardInterrupt
+        monkeypatch.setattr(article_store, "append_article_batch", crash)
+        with pytest.raises(KeyboardInterrupt):
+            worker.run()
+        assert WorkFrontier(path).counts()["pending"] == 3
+
+        monkeypatch.undo()
+        worker.run()
+        assert sorted(article.title for article in iter_articles(worker.output_path)) == sorted(TITLES[:3])
+        assert WorkFrontier(path).counts()["done"] == 3
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.zst"])
+    def test_torn_batch_is_cut_before_appending(self, suffix, tmp_path):
+        """Test that a half-written last batch is dropped and the batches around it survive."""
+        from src.collectors.wikipedia_collector import WikipediaArticle
+        output = str(tmp_path / f"articles{suffix}")
+        batches = [[WikipediaArticle(title=f"{batch}-{i}", page_id=i, url="", abstract="", content="",
+                                     infobox={}, categories=[], templates=[], revision_id=0, last_modified="")
+                     for i in range(40)] for batch in range(3)]
+
+        append_article_batch(output, batches[0])
+        append_article_batch(output, batches[1])
+        with open(output, "rb") as file:
+            data = file.read()
+        # Crash halfway through writing the second batch
+        with open(output, "wb") as file:
+            file.write(data[:len(data) - 40])
+
+        assert truncate_torn_tail(output) > 0
+        append_article_batch(output, batches[2])
+        assert truncate_torn_tail(output) == 0
+        titles = [article.title for article in iter_articles(output)]
+        # Compressed batches are all or nothing; plain JSON Lines keep the whole records
+        survivors = batches[0] + (batches[1][:-1] if suffix == ".jsonl" else []) + batches[2]
+        assert titles == [article.title for article in survivors]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])